@@ -1,6 +1,6 @@
 import os
 import re
-from ayon_core.addon import AYONAddon, IHostAddon
+from ayon_core.addon import AYONAddon, IHostAddon, click_wrap
 
 from .version import __version__
 
@@ -74,3 +74,24 @@ class UnrealAddon(AYONAddon, IHostAddon):
 
     def get_workfile_extensions(self):
         return [".uproject"]
+
+    def cli(self, click_group):
+        click_group.add_command(cli_main.to_click_obj())
+
+
+@click_wrap.group(UnrealAddon.name, help="Unreal addon related commands.")
+def cli_main():
+    pass
+
+
+@cli_main.command()
+@click_wrap.argument("paths", nargs=-1, required=True)
+def render_report(paths):
+    """Summarize render throughput per sequence and per render preset.
+
+    PATHS are render telemetry JSONL files or directories searched
+    for them.
+    """
+    from .render_telemetry import format_report, read_records
+
+    print(format_report(read_records(paths)))
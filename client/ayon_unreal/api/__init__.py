@@ -23,6 +23,7 @@ from .pipeline import (
     instantiate,
     UnrealHost,
     set_sequence_hierarchy,
+    link_child_sequences,
     generate_sequence,
     maintained_selection
 )
@@ -46,6 +47,7 @@ __all__ = [
     "instantiate",
     "UnrealHost",
     "set_sequence_hierarchy",
+    "link_child_sequences",
     "generate_sequence",
     "maintained_selection"
 ]
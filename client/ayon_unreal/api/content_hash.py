@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""Content hashes used to skip exporting and importing unchanged data.
+
+Extractors store hashes of the published content in version data of the
+product. On the next publish, content with the same hash is linked from
+the last published version instead of being exported again.
+"""
+import os
+import json
+import shutil
+import hashlib
+
+import ayon_api
+from ayon_core.lib import create_hard_link
+from ayon_core.pipeline.load import get_representation_path_with_anatomy
+
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+VERSION_DATA_KEY = "unrealContentHashes"
+
+
+def get_file_hash(path, chunk_size=HASH_CHUNK_SIZE):
+    """Get hash of file content, the file is read in chunks.
+
+    Args:
+        path (str): Path to file.
+        chunk_size (int): Size of chunks read at once.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _get_file_id(stat):
+    """Get identifier of a file shared by its hardlinks."""
+    if not stat.st_ino:
+        return None
+    return f"{stat.st_dev}:{stat.st_ino}"
+
+
+def get_source_file_data(path):
+    """Get data of imported source file stored in container metadata.
+
+    The file is not read, its content is compared with the file of a new
+    version only on update, see `is_source_file_unchanged`.
+
+    Args:
+        path (str): Path to the imported file.
+
+    Returns:
+        dict[str, str]: Path, size, modification time and identifier of
+            the file.
+    """
+    stat = os.stat(path)
+    return {
+        "source_path": path,
+        "source_size": str(stat.st_size),
+        "source_mtime": str(stat.st_mtime),
+        "source_file_id": _get_file_id(stat) or "",
+    }
+
+
+def _is_same_content(path, other_path, chunk_size=HASH_CHUNK_SIZE):
+    """Compare content of two files, reading stops at first difference."""
+    with open(path, "rb") as f, open(other_path, "rb") as other_f:
+        while True:
+            chunk = f.read(chunk_size)
+            if chunk != other_f.read(chunk_size):
+                return False
+            if not chunk:
+                return True
+
+
+def is_source_file_unchanged(container, path):
+    """Check whether file has the same content as imported by container.
+
+    Files of different size are different without reading them. The same
+    file or its hardlink, e.g. product published again with unchanged
+    files, is recognized by its identifier and modification time. Other
+    files are compared with the imported file, which is read only when
+    it was not modified since the import.
+
+    Args:
+        container (dict): Container metadata.
+        path (str): Path to the file to import.
+
+    Returns:
+        bool: The file content matches the imported source file.
+    """
+    source_path = container.get("source_path")
+    source_size = container.get("source_size")
+    if not source_path or not source_size or not os.path.isfile(path):
+        return False
+    stat = os.stat(path)
+    # Different size means different content, no need to read the file
+    if source_size != str(stat.st_size):
+        return False
+    source_mtime = container.get("source_mtime")
+    file_id = _get_file_id(stat)
+    if (
+        file_id
+        and container.get("source_file_id") == file_id
+        and source_mtime == str(stat.st_mtime)
+    ):
+        return True
+
+    try:
+        source_stat = os.stat(source_path)
+    except OSError:
+        return False
+    # Imported file was removed or changed, its content is unknown
+    if (
+        str(source_stat.st_size) != source_size
+        or str(source_stat.st_mtime) != source_mtime
+    ):
+        return False
+    return _is_same_content(source_path, path)
+
+
+def get_data_hash(data):
+    """Get hash of JSON serializable data.
+
+    Args:
+        data (Any): Data to hash, dictionaries are hashed regardless
+            of the order of their keys.
+
+    Returns:
+        str: Hex digest of the data.
+    """
+    content = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def link_or_copy_file(src, dst):
+    """Hardlink file when the filesystem allows it, copy it otherwise."""
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        create_hard_link(src, dst)
+    except (OSError, NotImplementedError):
+        shutil.copy2(src, dst)
+
+
+class PublishedContentHashes:
+    """Content hashes of the last published version of instance product.
+
+    Hashes of the content published by the instance are stored into its
+    version data. The last published version is queried only when a hash
+    is looked up for the first time.
+
+    Args:
+        instance (pyblish.api.Instance): Published instance.
+    """
+
+    def __init__(self, instance):
+        self._instance = instance
+        self._hashes = None
+        self._files = None
+
+    def _query_last_version(self):
+        self._hashes = {}
+        self._files = {}
+        context = self._instance.context
+        project_name = context.data["projectName"]
+        folder_entity = ayon_api.get_folder_by_path(
+            project_name, self._instance.data["folderPath"], fields={"id"})
+        if not folder_entity:
+            return
+        product_entity = ayon_api.get_product_by_name(
+            project_name,
+            self._instance.data["productName"],
+            folder_entity["id"],
+            fields={"id"}
+        )
+        if not product_entity:
+            return
+        version_entity = ayon_api.get_last_version_by_product_id(
+            project_name, product_entity["id"], fields={"id", "data"})
+        if not version_entity:
+            return
+
+        self._hashes = (
+            (version_entity.get("data") or {}).get(VERSION_DATA_KEY) or {})
+        if not self._hashes:
+            return
+        anatomy = context.data["anatomy"]
+        for repre_entity in ayon_api.get_representations(
+            project_name,
+            representation_names=set(self._hashes),
+            version_ids={version_entity["id"]}
+        ):
+            self._files[repre_entity["name"]] = str(
+                get_representation_path_with_anatomy(repre_entity, anatomy))
+
+    def get_published_file(self, repre_name, content_hash):
+        """Get published file of a representation with the same content.
+
+        Args:
+            repre_name (str): Representation name.
+            content_hash (str): Hash of the content to be published.
+
+        Returns:
+            Optional[str]: Path to the published file of the last version
+                when its content hash matches.
+        """
+        if self._hashes is None:
+            self._query_last_version()
+        if self._hashes.get(repre_name) != content_hash:
+            return None
+        path = self._files.get(repre_name)
+        if path and os.path.isfile(path):
+            return path
+        return None
+
+    def set_hash(self, repre_name, content_hash):
+        """Store content hash of a representation into version data."""
+        version_data = self._instance.data.setdefault("versionData", {})
+        version_data.setdefault(VERSION_DATA_KEY, {})[repre_name] = (
+            content_hash)
@@ -1,7 +1,7 @@
 from pathlib import Path
 from qtpy import QtWidgets, QtCore, QtGui
 
-from ayon_api import get_folders_hierarchy
+from ayon_api import get_folders, get_folders_hierarchy
 from ayon_core import (
     resources,
     style
@@ -16,12 +16,87 @@ from ayon_core.tools.utils import SimpleFoldersWidget
 
 from ayon_unreal.api.pipeline import (
     generate_sequence,
-    set_sequence_hierarchy,
+    get_folder_attributes_by_path,
+    get_sequence_folder_path,
+    get_tracks,
+    link_child_sequences,
 )
 
 import unreal
 
 
+class FolderHierarchyCache:
+    """Project folder hierarchies indexed by folder path.
+
+    Hierarchy of a project is fetched again only when its folders changed
+    on server since it was cached. Folders are compared by their count
+    and last update time, which are fetched without the hierarchy, so
+    created, renamed and removed folders are found.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def get_index(self, project_name, refresh=False):
+        """Get hierarchy elements of the project by folder path.
+
+        Args:
+            project_name (str): Project name.
+            refresh (bool): Fetch the hierarchy even if cached.
+
+        Returns:
+            dict[str, dict]: Hierarchy elements by folder path without
+                leading slash.
+        """
+        state = _get_folders_state(project_name)
+        cached = self._cache.get(project_name)
+        if refresh or cached is None or cached["state"] != state:
+            hierarchy = get_folders_hierarchy(
+                project_name=project_name)["hierarchy"]
+            cached = {
+                "state": state,
+                "index": _index_hierarchy(hierarchy),
+            }
+            self._cache[project_name] = cached
+        return cached["index"]
+
+    def find(self, project_name, folder_path):
+        """Find the hierarchy element of the folder.
+
+        Args:
+            project_name (str): Project name.
+            folder_path (str): Folder path.
+
+        Returns:
+            Optional[dict]: The hierarchy element.
+        """
+        return self.get_index(project_name).get(folder_path.strip("/"))
+
+
+def _get_folders_state(project_name):
+    """Get count and last update time of folders in the project."""
+    count = 0
+    updated_at = ""
+    for folder in get_folders(project_name, fields={"updatedAt"}):
+        count += 1
+        updated_at = max(updated_at, folder.get("updatedAt") or "")
+    return count, updated_at
+
+
+def _index_hierarchy(hierarchy):
+    index = {}
+    queue = [("", element) for element in hierarchy]
+    while queue:
+        parent_path, element = queue.pop()
+        path = f"{parent_path}/{element['name']}".lstrip("/")
+        index[path] = element
+        queue.extend((path, child) for child in element["children"])
+    return index
+
+
+_folder_hierarchy_cache = FolderHierarchyCache()
+
+
 class ConfirmButton(SquareButton):
     def __init__(self, parent=None):
         super(ConfirmButton, self).__init__(parent)
@@ -91,13 +166,21 @@ class FolderSelector(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(content_body, 1)
 
+        # Filter folders when typing pauses, not on every key stroke
+        filter_timer = QtCore.QTimer(self)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(200)
+
         folders_filter_text.textChanged.connect(
             self._on_filter_text_changed)
+        filter_timer.timeout.connect(self._on_filter_timer)
 
         self._controller = controller
 
         self._confirm_btn = self.confirm_btn
         self._folders_widget = folders_widget
+        self._folders_filter_text = folders_filter_text
+        self._filter_timer = filter_timer
 
         self.resize(300, 400)
 
@@ -105,8 +188,12 @@ class FolderSelector(QtWidgets.QWidget):
         self.raise_()
         self.activateWindow()
 
-    def _on_filter_text_changed(self, text):
-        self._folders_widget.set_name_filter(text)
+    def _on_filter_text_changed(self, _text):
+        self._filter_timer.start()
+
+    def _on_filter_timer(self):
+        self._folders_widget.set_name_filter(
+            self._folders_filter_text.text())
 
     def get_selected_folder(self):
         return self._folders_widget.get_selected_folder_path()
@@ -130,82 +217,158 @@ def _create_level(path, name, master_level):
     return level_package
 
 
-def _create_sequence(
-    element, sequence_path, master_level,
-    parent_path="", parents_sequence=[], parents_frame_range=[]
-):
-    """
-    Create sequences from the hierarchy element.
+def _get_sequence_path(hierarchy_dir, name):
+    return f"{hierarchy_dir}/{name}.{name}"
 
-    Args:
-        element (dict): The hierarchy element.
-        sequence_path (str): The sequence path.
-        master_level (str): The master level package.
-        parent_path (str): The parent path.
-        parents_sequence (list): The list of parent sequences.
-        parents_frame_range (list): The list of parent frame ranges.
-    """
-    name = element["name"]
-    path = f"{parent_path}/{name}"
-    hierarchy_dir = f"{sequence_path}{path}"
-    children = element["children"]
 
-    # Create sequence for the current element
-    sequence, frame_range = generate_sequence(name, hierarchy_dir)
+def _get_level_path(hierarchy_dir, name):
+    return f"{hierarchy_dir}/{name}_map.{name}_map"
 
-    sequences = parents_sequence.copy() + [sequence]
-    frame_ranges = parents_frame_range.copy() + [frame_range]
 
-    if children:
-        # Traverse the children and create sequences recursively
-        for child in children:
-            _create_sequence(
-                child, sequence_path, master_level, parent_path=path,
-                parents_sequence=sequences, parents_frame_range=frame_ranges)
-    else:
-        level = _create_level(hierarchy_dir, name, master_level)
-
-        # Create the sequence hierarchy. Add each child to its parent
-        for i in range(len(parents_sequence) - 1):
-            set_sequence_hierarchy(
-                parents_sequence[i], parents_sequence[i + 1],
-                parents_frame_range[i][1],
-                parents_frame_range[i + 1][0], parents_frame_range[i + 1][1],
-                [level])
-
-        if not parents_sequence:
-            parents_sequence = sequences
-        if not parents_frame_range:
-            parents_frame_range = frame_ranges
-
-        # Add the newly created sequence to its parent
-        set_sequence_hierarchy(
-            parents_sequence[-1], sequence,
-            parents_frame_range[-1][1],
-            frame_range[0], frame_range[1],
-            [level])
-
-
-def _find_in_hierarchy(hierarchy, path):
-    """
-    Find the hierarchy element from the path.
+def _plan_hierarchy(element, sequence_path):
+    """Plan operations needed to build sequence hierarchy of the element.
+
+    Sequences and levels which already exist are skipped, so a partially
+    built hierarchy is completed by running its plan again. Links of child
+    sequences are grouped by parent and planned after all sequences and
+    levels, each parent is linked in one operation.
 
     Args:
-        hierarchy (list): The hierarchy list.
-        path (str): The path to find.
+        element (dict): The hierarchy element.
+        sequence_path (str): Content directory of the element parent.
+
+    Returns:
+        list[dict]: Operations of type `sequence`, `level` and `link`.
     """
-    elements = path.split("/")
-    current_element = elements[0]
+    operations = []
+    links = {}
+
+    def _plan(element, hierarchy_dir, parents):
+        name = element["name"]
+        sequence = _get_sequence_path(hierarchy_dir, name)
+        if not unreal.EditorAssetLibrary.does_asset_exist(sequence):
+            operations.append({
+                "type": "sequence",
+                "name": name,
+                "dir": hierarchy_dir,
+            })
+        sequences = parents + [sequence]
+
+        children = element["children"]
+        for child in children:
+            _plan(child, f"{hierarchy_dir}/{child['name']}", sequences)
+        if children:
+            return
+
+        level = _get_level_path(hierarchy_dir, name)
+        if not unreal.EditorAssetLibrary.does_asset_exist(level):
+            operations.append({
+                "type": "level",
+                "name": name,
+                "dir": hierarchy_dir,
+            })
+
+        # Each sequence on the path to the level shows it while playing
+        for parent, child in zip(sequences[:-1], sequences[1:]):
+            child_maps = links.setdefault(parent, {}).setdefault(child, [])
+            if level not in child_maps:
+                child_maps.append(level)
+
+    _plan(element, f"{sequence_path}/{element['name']}", [])
+
+    for parent, children in links.items():
+        operations.append({
+            "type": "link",
+            "parent": parent,
+            "children": children,
+        })
+    return operations
+
+
+def _get_operation_label(operation):
+    if operation["type"] == "link":
+        return f"Linking sequences of {operation['parent']}"
+    return f"Creating {operation['type']} {operation['name']}"
+
+
+def _load_sequence(sequence_path, sequences):
+    """Get sequence with its frame range, created or loaded."""
+    if sequence_path not in sequences:
+        sequence = unreal.EditorAssetLibrary.load_asset(sequence_path)
+        sequences[sequence_path] = (
+            sequence,
+            (sequence.get_playback_start(), sequence.get_playback_end())
+        )
+    return sequences[sequence_path]
+
+
+def _link_children(operation, sequences):
+    """Link child sequences not linked to the parent yet."""
+    parent, parent_frame_range = _load_sequence(
+        operation["parent"], sequences)
+    subscenes = {
+        section.get_editor_property("sub_sequence").get_path_name()
+        for track in get_tracks(parent)
+        if track.get_class() == unreal.MovieSceneSubTrack.static_class()
+        for section in track.get_sections()
+        if section.get_editor_property("sub_sequence")
+    }
+    children = []
+    for child_path, maps in operation["children"].items():
+        child, frame_range = _load_sequence(child_path, sequences)
+        if child.get_path_name() in subscenes:
+            continue
+        children.append({
+            "sequence": child,
+            "frame_start": frame_range[0],
+            "frame_end": frame_range[1],
+            "maps": maps,
+        })
+    if children:
+        link_child_sequences(parent, children, parent_frame_range[1])
 
-    for element in hierarchy:
-        if element["name"] == current_element:
-            if len(elements) == 1:
-                return element
 
-            remaining_path = "/".join(elements[1:])
-            return _find_in_hierarchy(element["children"], remaining_path)
+def _run_plan(operations, master_level, project):
+    """Run planned operations with progress dialog.
 
-    return None
+    Args:
+        operations (list[dict]): Operations from `_plan_hierarchy`.
+        master_level (str): The master level package.
+        project (str): Project name.
+
+    Returns:
+        bool: False when cancelled by user before all operations ran.
+    """
+    folder_attributes_by_path = get_folder_attributes_by_path(
+        project,
+        [
+            get_sequence_folder_path(operation["dir"])
+            for operation in operations
+            if operation["type"] == "sequence"
+        ]
+    )
+    sequences = {}
+    with unreal.ScopedSlowTask(
+        len(operations), "Building sequence hierarchy..."
+    ) as slow_task:
+        slow_task.make_dialog(True)
+        for operation in operations:
+            if slow_task.should_cancel():
+                return False
+            slow_task.enter_progress_frame(
+                1, _get_operation_label(operation))
+
+            if operation["type"] == "sequence":
+                sequence, frame_range = generate_sequence(
+                    operation["name"], operation["dir"],
+                    folder_attributes_by_path)
+                sequences[sequence.get_path_name()] = (sequence, frame_range)
+            elif operation["type"] == "level":
+                _create_level(
+                    operation["dir"], operation["name"], master_level)
+            else:
+                _link_children(operation, sequences)
+    return True
 
 
 def find_level_sequence(asset_content):
@@ -246,13 +409,10 @@ def _on_confirm_clicked(folder_selector, sequence_path, project):
     selected_root = folder_selector.get_selected_folder()
     sequence_root_name = selected_root.lstrip("/")
     sequence_root = f"{sequence_path}/{sequence_root_name}"
-    asset_content = unreal.EditorAssetLibrary.list_assets(
-        sequence_root, recursive=False, include_folder=True)
-
-    hierarchy = get_folders_hierarchy(project_name=project)["hierarchy"]
 
     # Find the sequence root element in the hierarchy
-    hierarchy_element = _find_in_hierarchy(hierarchy, sequence_root_name)
+    hierarchy_element = _folder_hierarchy_cache.find(
+        project, sequence_root_name)
 
     # Raise an error if the sequence root element is not found
     if not hierarchy_element:
@@ -262,33 +422,17 @@ def _on_confirm_clicked(folder_selector, sequence_path, project):
     master_level_path = f"{sequence_root}/{master_level_name}_map"
     master_level_package = f"{master_level_path}.{master_level_name}_map"
 
-    if asset_content:
-        msg = (
-            f"The sequence hierarchy already created in {sequence_path}"
-            f"Loading level {master_level_package} from the path {master_level_path}."
-        )
-        show_message_dialog(
-            parent=None,
-            title="Loading level from the already-created shot structure",
-            message=msg,
-            level="info")
-
-        if not find_level_sequence(asset_content):
-            _create_sequence(
-                hierarchy_element, Path(sequence_root).parent.as_posix(),
-                master_level_package)
-
-        save_asset_and_load_level(
-            asset_content, master_level_package, folder_selector)
-        return
-
     # Create the master level
-    unreal.EditorLevelLibrary.new_level(master_level_path)
+    if not unreal.EditorAssetLibrary.does_asset_exist(master_level_package):
+        unreal.EditorLevelLibrary.new_level(master_level_path)
 
-    # Start creating sequences from the root element
-    _create_sequence(
-        hierarchy_element, Path(sequence_root).parent.as_posix(),
-        master_level_package)
+    # Plan the missing parts of the hierarchy and build them
+    operations = _plan_hierarchy(
+        hierarchy_element, Path(sequence_root).parent.as_posix())
+    unreal.log(
+        f"Building sequence hierarchy of {sequence_root_name} "
+        f"in {len(operations)} operations.")
+    completed = _run_plan(operations, master_level_package, project)
 
     # List all the assets in the sequence path and save them
     asset_content = unreal.EditorAssetLibrary.list_assets(
@@ -298,6 +442,16 @@ def _on_confirm_clicked(folder_selector, sequence_path, project):
     save_asset_and_load_level(
         asset_content, master_level_package, folder_selector)
 
+    if not completed:
+        show_message_dialog(
+            parent=None,
+            title="Sequence hierarchy build cancelled",
+            message=(
+                f"The sequence hierarchy of {sequence_root_name} is "
+                "partially built. Build it again to create the rest."
+            ),
+            level="warning")
+
 
 def build_sequence_hierarchy():
     """
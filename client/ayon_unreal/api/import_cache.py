@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Project wide cache of imported representations.
+
+Maps loader, representation id and import options to the content
+directory the representation was imported into, so loading the same
+representation again reuses the imported assets instead of importing
+them again. The cache is stored in the `Saved` directory of the project
+and every entry is validated against the container in the directory
+before it is used.
+
+Changes are written once per editor tick, loading many representations
+at once (e.g. a layout) rewrites the cache file only once.
+"""
+import os
+import json
+
+import unreal
+
+from ayon_unreal.api.content_hash import get_data_hash
+
+IMPORT_CACHE_FILE = "import_cache.json"
+
+_import_cache = None
+
+
+def get_import_key(loader_name, repre_id, import_options=None):
+    """Get cache key of imported representation.
+
+    Args:
+        loader_name (str): Name of the loader class.
+        repre_id (str): Representation id.
+        import_options (dict, optional): Options affecting the import.
+
+    Returns:
+        str: Cache key.
+    """
+    return "{}:{}:{}".format(
+        loader_name, repre_id, get_data_hash(import_options or {}))
+
+
+class ImportCache:
+    """Content directories of imported representations.
+
+    Args:
+        path (str): Path to JSON file the cache is stored in.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = None
+        self._dirty = False
+        self._tick_handle = None
+
+    def _get_entries(self):
+        if self._entries is None:
+            self._entries = {}
+            if os.path.isfile(self.path):
+                try:
+                    with open(self.path, "r") as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError):
+                    unreal.log_warning(
+                        f"Failed to read import cache {self.path}")
+        return self._entries
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(self._entries, f, indent=2)
+
+    def _schedule_save(self):
+        self._dirty = True
+        if self._tick_handle is None:
+            self._tick_handle = unreal.register_slate_post_tick_callback(
+                self._tick)
+
+    def _tick(self, delta_time):
+        self.flush()
+
+    def flush(self):
+        """Write changed entries into the cache file."""
+        if self._tick_handle is not None:
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+        if not self._dirty:
+            return
+        self._save()
+        self._dirty = False
+
+    def get(self, key, repre_id):
+        """Get container of imported representation.
+
+        Args:
+            key (str): Cache key, see `get_import_key`.
+            repre_id (str): Representation id, the container in the cached
+                directory must still hold this representation.
+
+        Returns:
+            Optional[str]: Path to the container in the content directory
+                with the imported assets.
+        """
+        entry = self._get_entries().get(key)
+        if not entry:
+            return None
+
+        container_path = f"{entry['asset_dir']}/{entry['container_name']}"
+        container = None
+        if unreal.EditorAssetLibrary.does_asset_exist(container_path):
+            container = unreal.EditorAssetLibrary.load_asset(container_path)
+        if container is None or unreal.EditorAssetLibrary.get_metadata_tag(
+            container, "representation"
+        ) != repre_id:
+            # Container was removed or updated to another representation
+            self._entries.pop(key)
+            self._schedule_save()
+            return None
+        return container_path
+
+    def add(self, key, asset_dir, container_name):
+        """Store content directory of imported representation.
+
+        Args:
+            key (str): Cache key, see `get_import_key`.
+            asset_dir (str): Content directory with the imported assets.
+            container_name (str): Name of the container in the directory.
+        """
+        self._get_entries()[key] = {
+            "asset_dir": asset_dir,
+            "container_name": container_name,
+        }
+        self._schedule_save()
+
+
+def get_import_cache():
+    """Get import cache of the current Unreal project.
+
+    Returns:
+        ImportCache: The import cache.
+    """
+    global _import_cache
+
+    path = os.path.join(
+        unreal.Paths.convert_relative_path_to_full(
+            unreal.Paths.project_saved_dir()),
+        "Ayon",
+        IMPORT_CACHE_FILE
+    )
+    if _import_cache is None or _import_cache.path != path:
+        if _import_cache is not None:
+            _import_cache.flush()
+        _import_cache = ImportCache(path)
+    return _import_cache
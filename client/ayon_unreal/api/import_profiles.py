@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+"""Import profiles used by loaders to build `AssetImportTask` options.
+
+Each profile describes the import options of one kind of import, like
+static mesh from FBX or geometry cache from Alembic, with values taken
+from `import_settings` of project settings. Options of a profile are
+resolved once into a template, which is cached by the profile name and
+its arguments. Every import task then gets its own options object filled
+from the template by a single `set_editor_properties` call per object.
+
+Templates save resolving the settings again when many representations
+are imported, e.g. by a layout. A single import still creates its
+options object and copies struct values of the template.
+"""
+import unreal
+
+from ayon_unreal.api.pipeline import UNREAL_VERSION
+from ayon_unreal.api.content_hash import get_data_hash
+
+_templates = {}
+
+
+class OptionsTemplate:
+    """Resolved import options of a profile.
+
+    Args:
+        options_class (type): Class of the options object, for example
+            `unreal.FbxImportUI`.
+        properties (dict[str, Any]): Editor properties of the options.
+            Struct values are copied for each created options object.
+        sub_object_properties (dict[str, dict[str, Any]]): Editor
+            properties of sub-objects the options object owns, like
+            `skeletal_mesh_import_data` of `unreal.FbxImportUI`.
+    """
+
+    def __init__(
+        self, options_class, properties=None, sub_object_properties=None
+    ):
+        self.options_class = options_class
+        self.properties = properties or {}
+        self.sub_object_properties = sub_object_properties or {}
+
+    @staticmethod
+    def _copy_properties(properties, overrides=None):
+        properties = dict(properties, **(overrides or {}))
+        return {
+            name: value.copy() if isinstance(value, unreal.StructBase)
+            else value
+            for name, value in properties.items()
+        }
+
+    def create(self, properties=None, sub_object_properties=None):
+        """Create options object from the template.
+
+        Args:
+            properties (dict[str, Any], optional): Properties overriding
+                the template, like skeleton the animation is imported to.
+            sub_object_properties (dict[str, dict[str, Any]], optional):
+                Sub-object properties overriding the template.
+
+        Returns:
+            unreal.Object: New options object.
+        """
+        options = self.options_class()
+        options.set_editor_properties(
+            self._copy_properties(self.properties, properties))
+
+        sub_object_properties = sub_object_properties or {}
+        for name in set(self.sub_object_properties) | set(
+            sub_object_properties
+        ):
+            sub_object = options.get_editor_property(name)
+            sub_object.set_editor_properties(self._copy_properties(
+                self.sub_object_properties.get(name, {}),
+                sub_object_properties.get(name)
+            ))
+        return options
+
+
+def get_abc_conversion_settings(conversion_preset, custom_preset=None):
+    """Get Alembic conversion settings of a preset.
+
+    Presets `maya` and `3dsmax` use the engine presets when the engine
+    version has them and equal custom values otherwise.
+
+    Args:
+        conversion_preset (str): One of `maya`, `3dsmax` or `custom`.
+        custom_preset (dict, optional): Values of the custom preset from
+            `import_settings/custom` of project settings.
+
+    Returns:
+        unreal.AbcConversionSettings: Conversion settings.
+    """
+    if conversion_preset == "maya":
+        if UNREAL_VERSION.major >= 5 and UNREAL_VERSION.minor >= 4:
+            return unreal.AbcConversionSettings(
+                preset=unreal.AbcConversionPreset.MAYA)
+        return unreal.AbcConversionSettings(
+            preset=unreal.AbcConversionPreset.CUSTOM,
+            flip_u=False, flip_v=True,
+            rotation=[90.0, 0.0, 0.0],
+            scale=[1.0, -1.0, 1.0])
+
+    if conversion_preset == "3dsmax":
+        if UNREAL_VERSION.major >= 5:
+            return unreal.AbcConversionSettings(
+                preset=unreal.AbcConversionPreset.MAX)
+        return unreal.AbcConversionSettings(
+            preset=unreal.AbcConversionPreset.CUSTOM,
+            flip_u=False, flip_v=True,
+            rotation=[0.0, 0.0, 0.0],
+            scale=[1.0, -1.0, 1.0])
+
+    preset = custom_preset or {}
+    return unreal.AbcConversionSettings(
+        preset=unreal.AbcConversionPreset.CUSTOM,
+        flip_u=preset.get("flip_u", False),
+        flip_v=preset.get("flip_v", True),
+        rotation=[
+            preset.get("rot_x", 90.0),
+            preset.get("rot_y", 0.0),
+            preset.get("rot_z", 0.0)
+        ],
+        scale=[
+            preset.get("scl_x", 1.0),
+            preset.get("scl_y", -1.0),
+            preset.get("scl_z", 1.0)
+        ]
+    )
+
+
+def get_abc_sampling_settings(frame_start=None, frame_end=None):
+    """Get Alembic sampling settings of a frame range.
+
+    Args:
+        frame_start (int, optional): First frame to import.
+        frame_end (int, optional): Last frame to import.
+
+    Returns:
+        unreal.AbcSamplingSettings: Sampling settings.
+    """
+    sampling_settings = unreal.AbcSamplingSettings()
+    if frame_start is not None:
+        sampling_settings.set_editor_property("frame_start", frame_start)
+    if frame_end is not None:
+        sampling_settings.set_editor_property("frame_end", frame_end)
+    return sampling_settings
+
+
+def _get_abc_material_settings(material_settings):
+    return unreal.AbcMaterialSettings(
+        create_materials=material_settings == "create_materials",
+        find_materials=material_settings == "find_materials"
+    )
+
+
+def _get_abc_properties(
+    import_type, conversion_preset=None, custom_preset=None
+):
+    properties = {"import_type": import_type}
+    # Without preset the default conversion of the engine is used
+    if conversion_preset:
+        properties["conversion_settings"] = get_abc_conversion_settings(
+            conversion_preset, custom_preset)
+    return properties
+
+
+def _build_fbx_static_mesh(use_nanite=True):
+    return OptionsTemplate(
+        unreal.FbxImportUI,
+        {
+            "automated_import_should_detect_type": False,
+            "import_animations": False,
+        },
+        {
+            "static_mesh_import_data": {
+                "combine_meshes": True,
+                "remove_degenerates": False,
+                "build_nanite": use_nanite,
+            },
+        }
+    )
+
+
+def _build_fbx_skeletal_mesh():
+    return OptionsTemplate(
+        unreal.FbxImportUI,
+        {
+            "automated_import_should_detect_type": False,
+            "import_as_skeletal": True,
+            "import_animations": False,
+            "import_mesh": True,
+            "import_materials": False,
+            "import_textures": False,
+            "skeleton": None,
+            "create_physics_asset": False,
+            "mesh_type_to_import": unreal.FBXImportType.FBXIT_SKELETAL_MESH,
+        },
+        {
+            "skeletal_mesh_import_data": {
+                "import_content_type": unreal.FBXImportContentType.FBXICT_ALL,
+                "normal_import_method": (
+                    unreal.FBXNormalImportMethod.FBXNIM_IMPORT_NORMALS),
+            },
+        }
+    )
+
+
+def _build_fbx_animation():
+    anim_sequence_properties = {
+        "animation_length": (
+            unreal.FBXAnimationLengthImportType.FBXALIT_SET_RANGE),
+        "import_meshes_in_bone_hierarchy": False,
+        "use_default_sample_rate": False,
+        "import_custom_attribute": True,
+        "import_bone_tracks": True,
+        "remove_redundant_keys": False,
+        "convert_scene": True,
+        "force_front_x_axis": False,
+    }
+    if UNREAL_VERSION.major == 5 and UNREAL_VERSION.minor <= 4:
+        anim_sequence_properties["import_rotation"] = unreal.Rotator(
+            roll=90.0, pitch=0.0, yaw=0.0)
+    return OptionsTemplate(
+        unreal.FbxImportUI,
+        {
+            "automated_import_should_detect_type": True,
+            "original_import_type": unreal.FBXImportType.FBXIT_SKELETAL_MESH,
+            "mesh_type_to_import": unreal.FBXImportType.FBXIT_ANIMATION,
+            "import_mesh": False,
+            "import_animations": True,
+            "override_full_name": True,
+        },
+        {"anim_sequence_import_data": anim_sequence_properties}
+    )
+
+
+def _build_abc_static_mesh(
+    conversion_preset=None,
+    custom_preset=None,
+    material_settings=None,
+    merge_meshes=True
+):
+    properties = _get_abc_properties(
+        unreal.AlembicImportType.STATIC_MESH, conversion_preset, custom_preset)
+    properties["static_mesh_settings"] = unreal.AbcStaticMeshSettings(
+        merge_meshes=merge_meshes)
+    properties["material_settings"] = _get_abc_material_settings(
+        material_settings)
+    return OptionsTemplate(unreal.AbcImportSettings, properties)
+
+
+def _build_abc_skeletal_mesh(
+    conversion_preset=None, custom_preset=None, material_settings=None
+):
+    properties = _get_abc_properties(
+        unreal.AlembicImportType.SKELETAL, conversion_preset, custom_preset)
+    # Engine default material settings are kept with default conversion
+    if conversion_preset:
+        properties["material_settings"] = _get_abc_material_settings(
+            material_settings)
+    return OptionsTemplate(unreal.AbcImportSettings, properties)
+
+
+def _build_abc_animation(conversion_preset=None, custom_preset=None):
+    properties = _get_abc_properties(
+        unreal.AlembicImportType.SKELETAL, conversion_preset, custom_preset)
+    properties["static_mesh_settings"] = unreal.AbcStaticMeshSettings()
+    return OptionsTemplate(unreal.AbcImportSettings, properties)
+
+
+def _build_abc_geometry_cache(conversion_preset=None, custom_preset=None):
+    properties = _get_abc_properties(
+        unreal.AlembicImportType.GEOMETRY_CACHE,
+        conversion_preset,
+        custom_preset
+    )
+    properties["geometry_cache_settings"] = unreal.AbcGeometryCacheSettings(
+        flatten_tracks=False)
+    return OptionsTemplate(unreal.AbcImportSettings, properties)
+
+
+def _build_abc_default():
+    return OptionsTemplate(unreal.AbcImportSettings)
+
+
+IMPORT_PROFILES = {
+    "fbx_static_mesh": _build_fbx_static_mesh,
+    "fbx_skeletal_mesh": _build_fbx_skeletal_mesh,
+    "fbx_animation": _build_fbx_animation,
+    "abc_static_mesh": _build_abc_static_mesh,
+    "abc_skeletal_mesh": _build_abc_skeletal_mesh,
+    "abc_animation": _build_abc_animation,
+    "abc_geometry_cache": _build_abc_geometry_cache,
+    "abc_default": _build_abc_default,
+}
+
+
+def get_options_template(profile_name, **profile_args):
+    """Get cached options template of an import profile.
+
+    Args:
+        profile_name (str): Name of the profile, key of `IMPORT_PROFILES`.
+        **profile_args: Arguments of the profile, mostly values from
+            `import_settings` of project settings and loader options.
+
+    Returns:
+        OptionsTemplate: Template of the profile options.
+    """
+    key = (profile_name, get_data_hash(profile_args))
+    template = _templates.get(key)
+    if template is None:
+        template = IMPORT_PROFILES[profile_name](**profile_args)
+        _templates[key] = template
+    return template
+
+
+def clear_options_templates():
+    """Clear cached options templates, e.g. after the editor reloaded."""
+    _templates.clear()
+
+
+def create_import_task(
+    filename,
+    asset_dir,
+    asset_name,
+    replace=False,
+    automated=True,
+    save=True,
+    options=None
+):
+    """Create import task.
+
+    Args:
+        filename (str): Path to the imported file.
+        asset_dir (str): Content directory to import to.
+        asset_name (str): Name of the imported asset.
+        replace (bool): Replace existing asset.
+        automated (bool): Import without showing the import dialog.
+        save (bool): Save the imported assets.
+        options (unreal.Object, optional): Import options, see
+            `OptionsTemplate.create`.
+
+    Returns:
+        unreal.AssetImportTask: Import task.
+    """
+    task = unreal.AssetImportTask()
+    task.set_editor_properties({
+        "filename": filename,
+        "destination_path": asset_dir,
+        "destination_name": asset_name,
+        "replace_existing": replace,
+        "automated": automated,
+        "save": save,
+    })
+    if options is not None:
+        task.options = options
+    return task
@@ -0,0 +1,627 @@
+# -*- coding: utf-8 -*-
+"""Reading and writing of layout representations.
+
+Layout files of set dressing can have hundreds of thousands of elements.
+They are read incrementally, one element at a time, and each element is
+kept only as a compact `LayoutElement` record with the values loaders
+use. The whole JSON document is never held in memory.
+
+Besides JSON, layouts can be published in a binary format. It has a JSON
+header with the element data followed by float32 arrays of transform
+matrices, rotations and basis matrices, aligned so the arrays can be
+memory-mapped:
+
+    8 bytes   magic `BINARY_LAYOUT_MAGIC`
+    8 bytes   size of the header, unsigned little-endian
+    header    UTF-8 JSON padded to `BINARY_LAYOUT_ALIGNMENT`
+    payload   little-endian float32 arrays described by the header
+"""
+import re
+import sys
+import json
+import math
+import array
+import struct
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LAYOUT_READ_CHUNK_SIZE = 1024 * 1024
+
+BINARY_LAYOUT_EXTENSION = "ulayout"
+BINARY_LAYOUT_MAGIC = b"AYLAYOUT"
+BINARY_LAYOUT_VERSION = 1
+BINARY_LAYOUT_ALIGNMENT = 64
+BINARY_LAYOUT_READ_ROWS = 4096
+# Relative and absolute tolerance of comparing placements, binary layouts
+# store transforms as float32
+PLACEMENT_TOLERANCE = 1e-6
+# Values of elements stored in the header, the remaining columns of
+# element rows are basis index, transform and rotation flags
+BINARY_ELEMENT_FIELDS = (
+    "representation",
+    "version",
+    "extension",
+    "product_base_type",
+    "instance_name",
+    "asset_name",
+    "animation",
+    "unreal_import",
+)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_json_array(fp, chunk_size=LAYOUT_READ_CHUNK_SIZE):
+    """Iterate items of JSON array without reading the whole document.
+
+    Args:
+        fp (io.TextIOBase): File object with JSON array.
+        chunk_size (int): Number of characters read at once.
+
+    Yields:
+        Any: Decoded items of the array.
+
+    Raises:
+        ValueError: When the content is not a valid JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    # Opening bracket of the array
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer):
+            break
+        if not fill():
+            raise ValueError("Layout data are empty")
+    if buffer[pos] != "[":
+        raise ValueError("Layout data must be a JSON array")
+    pos += 1
+
+    # 'first' item or end, 'next' separator or end, 'item' after separator
+    state = "first"
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if not fill():
+                raise ValueError("Unexpected end of layout data")
+            continue
+
+        char = buffer[pos]
+        if char == "]" and state != "item":
+            return
+        if state == "next":
+            if char != ",":
+                raise ValueError(
+                    f"Expected ',' in layout data, got {char!r}")
+            pos += 1
+            state = "item"
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Item continues in the next chunk
+            if not fill():
+                raise
+            continue
+        if not eof:
+            # Numbers at the end of the buffer can be truncated, item is
+            # complete only when it is followed by separator or end
+            next_pos = _WHITESPACE.match(buffer, end).end()
+            if (
+                next_pos == len(buffer) or buffer[next_pos] not in ",]"
+            ) and fill():
+                continue
+        pos = end
+        state = "next"
+        yield item
+
+
+def _to_matrix(rows):
+    if not rows:
+        return None
+    return tuple(tuple(row) for row in rows)
+
+
+def _matrix_from_values(values):
+    return (
+        tuple(values[0:4]),
+        tuple(values[4:8]),
+        tuple(values[8:12]),
+        tuple(values[12:16]),
+    )
+
+
+class LayoutElement:
+    """Compact record of a layout element.
+
+    Attributes:
+        representation (Optional[str]): Id of the placed representation.
+        version (Optional[str]): Id of the placed version.
+        extension (str): Representation name of the placed asset.
+        product_base_type (Optional[str]): Product base type of the asset.
+        instance_name (Optional[str]): Name of the placed instance.
+        asset_name (Optional[str]): Name of the placed asset.
+        animation (Optional[str]): Extension of animation file.
+        unreal_import (bool): Layout was published from Unreal.
+        transform_matrix (Optional[tuple]): Rows of 4x4 transform matrix.
+        basis (Optional[tuple]): Rows of 4x4 basis matrix.
+        rotation (Optional[tuple[float, float, float]]): Euler rotation.
+    """
+
+    __slots__ = (
+        "representation",
+        "version",
+        "extension",
+        "product_base_type",
+        "instance_name",
+        "asset_name",
+        "animation",
+        "unreal_import",
+        "transform_matrix",
+        "basis",
+        "rotation",
+    )
+
+    def __init__(
+        self,
+        representation=None,
+        version=None,
+        extension="ma",
+        product_base_type=None,
+        instance_name=None,
+        asset_name=None,
+        animation=None,
+        unreal_import=False,
+        transform_matrix=None,
+        basis=None,
+        rotation=None,
+    ):
+        self.representation = representation
+        self.version = version
+        self.extension = extension
+        self.product_base_type = product_base_type
+        self.instance_name = instance_name
+        self.asset_name = asset_name
+        self.animation = animation
+        self.unreal_import = unreal_import
+        self.transform_matrix = transform_matrix
+        self.basis = basis
+        self.rotation = rotation
+
+    @classmethod
+    def from_data(cls, data, bases=None):
+        """Create record from element data of layout JSON.
+
+        Args:
+            data (dict[str, Any]): Element data.
+            bases (dict[tuple, tuple], optional): Already read basis
+                matrices, equal bases of elements share one tuple.
+
+        Returns:
+            LayoutElement: Layout element.
+        """
+        basis = _to_matrix(data.get("basis"))
+        if basis is not None and bases is not None:
+            basis = bases.setdefault(basis, basis)
+        rotation = data.get("rotation")
+        if rotation:
+            rotation = (rotation["x"], rotation["y"], rotation["z"])
+        return cls(
+            representation=data.get("representation"),
+            version=data.get("version"),
+            extension=data.get("extension", "ma"),
+            product_base_type=(
+                data.get("product_base_type")
+                or data.get("product_type")
+                or data.get("family")
+            ),
+            instance_name=data.get("instance_name"),
+            asset_name=data.get("asset_name"),
+            animation=data.get("animation"),
+            unreal_import="unreal" in (data.get("host") or []),
+            transform_matrix=_to_matrix(data.get("transform_matrix")),
+            basis=basis,
+            rotation=rotation or None,
+        )
+
+
+def get_element_keys(elements):
+    """Get stable identity keys of layout elements.
+
+    Element is identified by its instance name and its order among
+    elements of the same instance name. Keys stay the same between
+    versions of a layout when placements are moved, or added after the
+    existing placements of the instance.
+
+    Args:
+        elements (Iterable[LayoutElement]): Layout elements.
+
+    Returns:
+        dict[LayoutElement, str]: Key by element.
+    """
+    counts = {}
+    keys = {}
+    for element in elements:
+        name = element.instance_name or element.asset_name or ""
+        index = counts.get(name, 0)
+        counts[name] = index + 1
+        keys[element] = f"{name}#{index}"
+    return keys
+
+
+def _iter_values(values):
+    for value in values:
+        if isinstance(value, (tuple, list)):
+            yield from value
+        else:
+            yield value
+
+
+def _is_close(values, other_values):
+    """Compare matrices or vectors of placements with tolerance."""
+    if values == other_values:
+        return True
+    if values is None or other_values is None:
+        return False
+    values = list(_iter_values(values))
+    other_values = list(_iter_values(other_values))
+    return len(values) == len(other_values) and all(
+        math.isclose(
+            value, other_value,
+            rel_tol=PLACEMENT_TOLERANCE, abs_tol=PLACEMENT_TOLERANCE
+        )
+        for value, other_value in zip(values, other_values)
+    )
+
+
+def diff_layout_elements(old_elements, new_elements):
+    """Compare placements of two versions of a layout.
+
+    Elements are matched by keys from `get_element_keys`. Placement of
+    the same representation with a different transform is moved.
+    Transforms are compared with `PLACEMENT_TOLERANCE`, so versions
+    published in JSON and binary format can be compared.
+    Placement of another representation, or placement with animation,
+    which belongs to the layout version, is replaced and reported as
+    both removed and added.
+
+    Args:
+        old_elements (Iterable[LayoutElement]): Elements of loaded layout.
+        new_elements (Iterable[LayoutElement]): Elements of new layout.
+
+    Returns:
+        dict[str, list[str]]: Keys of "unchanged", "moved", "added" and
+            "removed" placements.
+    """
+    old_by_key = {
+        key: element
+        for element, key in get_element_keys(old_elements).items()
+    }
+    diff = {"unchanged": [], "moved": [], "added": [], "removed": []}
+    new_keys = set()
+    for element, key in get_element_keys(new_elements).items():
+        new_keys.add(key)
+        old_element = old_by_key.get(key)
+        if old_element is None:
+            diff["added"].append(key)
+        elif (
+            old_element.representation != element.representation
+            or old_element.animation
+            or element.animation
+        ):
+            diff["removed"].append(key)
+            diff["added"].append(key)
+        elif (
+            _is_close(old_element.transform_matrix, element.transform_matrix)
+            and _is_close(old_element.basis, element.basis)
+            and _is_close(old_element.rotation, element.rotation)
+            and old_element.unreal_import == element.unreal_import
+        ):
+            diff["unchanged"].append(key)
+        else:
+            diff["moved"].append(key)
+    diff["removed"].extend(key for key in old_by_key if key not in new_keys)
+    return diff
+
+
+IDENTITY_MATRIX = (
+    (1.0, 0.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0),
+)
+
+
+def _multiply_matrices(matrix_a, columns_b):
+    """Multiply matrix by matrix given by its columns."""
+    return tuple(
+        tuple(
+            sum(value_a * value_b for value_a, value_b in zip(row, column))
+            for column in columns_b
+        )
+        for row in matrix_a
+    )
+
+
+def _invert_matrix(matrix):
+    """Invert 4x4 matrix by Gauss-Jordan elimination."""
+    size = len(matrix)
+    rows = [
+        list(row) + [float(index == row_index) for index in range(size)]
+        for row_index, row in enumerate(matrix)
+    ]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda r: abs(rows[r][column]))
+        if abs(rows[pivot][column]) < 1e-12:
+            raise ValueError("Basis matrix is not invertible")
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        pivot_value = rows[column][column]
+        rows[column] = [value / pivot_value for value in rows[column]]
+        for row_index in range(size):
+            if row_index == column:
+                continue
+            factor = rows[row_index][column]
+            if factor:
+                rows[row_index] = [
+                    value - factor * pivot_row_value
+                    for value, pivot_row_value in zip(
+                        rows[row_index], rows[column])
+                ]
+    return tuple(tuple(row[size:]) for row in rows)
+
+
+def _convert_group(matrices, basis, unreal_import):
+    """Convert transform matrices sharing the same basis."""
+    if numpy is not None:
+        converted = numpy.array(matrices, dtype=numpy.float64)
+        basis_matrix = numpy.array(basis, dtype=numpy.float64)
+        if not unreal_import:
+            converted = numpy.linalg.inv(basis_matrix) @ converted
+        return (converted @ basis_matrix).tolist()
+
+    basis_columns = tuple(zip(*basis))
+    if unreal_import:
+        return [
+            _multiply_matrices(matrix, basis_columns) for matrix in matrices
+        ]
+    inverse_basis = _invert_matrix(basis)
+    return [
+        _multiply_matrices(
+            _multiply_matrices(inverse_basis, tuple(zip(*matrix))),
+            basis_columns
+        )
+        for matrix in matrices
+    ]
+
+
+def convert_basis_matrices(elements):
+    """Convert transform matrices of layout elements from their basis.
+
+    Layouts from other hosts are converted by `basis^-1 * matrix * basis`
+    and layouts published from Unreal by `matrix * basis`. Elements are
+    grouped by basis, so the inverse is computed once per basis, and
+    each group is converted in one NumPy operation. Without NumPy the
+    conversion falls back to pure Python. Elements with identity basis
+    are returned unchanged.
+
+    Args:
+        elements (list[LayoutElement]): Layout elements.
+
+    Returns:
+        list[Optional[tuple]]: Rows of converted matrices in order of the
+            elements, None for elements without transform.
+    """
+    output = [None] * len(elements)
+    groups = {}
+    for index, element in enumerate(elements):
+        if element.transform_matrix is None:
+            continue
+        basis = element.basis or IDENTITY_MATRIX
+        if basis == IDENTITY_MATRIX:
+            output[index] = element.transform_matrix
+            continue
+        groups.setdefault((basis, element.unreal_import), []).append(index)
+
+    for (basis, unreal_import), indexes in groups.items():
+        converted = _convert_group(
+            [elements[index].transform_matrix for index in indexes],
+            basis,
+            unreal_import
+        )
+        for index, matrix in zip(indexes, converted):
+            output[index] = matrix
+    return output
+
+
+def is_binary_layout(path):
+    """Check whether layout file is in the binary format."""
+    with open(path, "rb") as f:
+        return f.read(len(BINARY_LAYOUT_MAGIC)) == BINARY_LAYOUT_MAGIC
+
+
+def iter_layout_elements(path):
+    """Iterate elements of layout file one at a time.
+
+    Args:
+        path (str): Path to layout JSON or binary layout file.
+
+    Yields:
+        LayoutElement: Layout elements in order of the file.
+    """
+    if is_binary_layout(path):
+        yield from iter_binary_layout_elements(path)
+        return
+
+    bases = {}
+    with open(path, "r") as fp:
+        for data in iter_json_array(fp):
+            yield LayoutElement.from_data(data, bases)
+
+
+def write_binary_layout(path, elements):
+    """Write layout elements in the binary layout format.
+
+    Args:
+        path (str): Path to the output file.
+        elements (list[LayoutElement]): Layout elements.
+    """
+    transforms = array.array("f")
+    rotations = array.array("f")
+    bases = array.array("f")
+    basis_indexes = {}
+    rows = []
+    for element in elements:
+        basis_index = -1
+        if element.basis is not None:
+            basis_index = basis_indexes.get(element.basis)
+            if basis_index is None:
+                basis_index = len(basis_indexes)
+                basis_indexes[element.basis] = basis_index
+                for row in element.basis:
+                    bases.extend(row)
+        for row in element.transform_matrix or IDENTITY_MATRIX:
+            transforms.extend(row)
+        rotations.extend(element.rotation or (0.0, 0.0, 0.0))
+        rows.append([
+            getattr(element, field) for field in BINARY_ELEMENT_FIELDS
+        ] + [
+            basis_index,
+            element.transform_matrix is not None,
+            element.rotation is not None,
+        ])
+
+    count = len(rows)
+    arrays = {}
+    offset = 0
+    for name, values, width in (
+        ("transforms", transforms, 16),
+        ("rotations", rotations, 3),
+        ("bases", bases, 16),
+    ):
+        arrays[name] = {
+            "offset": offset,
+            "shape": [len(values) // width, width],
+        }
+        offset += len(values) * values.itemsize
+
+    header = json.dumps({
+        "version": BINARY_LAYOUT_VERSION,
+        "count": count,
+        "dtype": "<f4",
+        "fields": list(BINARY_ELEMENT_FIELDS),
+        "arrays": arrays,
+        "elements": rows,
+    }, separators=(",", ":")).encode("utf-8")
+    prefix_size = len(BINARY_LAYOUT_MAGIC) + 8
+    padding = -(prefix_size + len(header)) % BINARY_LAYOUT_ALIGNMENT
+    header += b" " * padding
+
+    with open(path, "wb") as f:
+        f.write(BINARY_LAYOUT_MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for values in (transforms, rotations, bases):
+            if sys.byteorder != "little":
+                values.byteswap()
+            values.tofile(f)
+
+
+def _read_binary_arrays(path, payload_offset, header):
+    arrays = {}
+    # Empty payload can not be memory-mapped
+    has_payload = any(info["shape"][0] for info in header["arrays"].values())
+    if numpy is not None and has_payload:
+        payload = numpy.memmap(
+            path, dtype=header["dtype"], mode="r", offset=payload_offset)
+        for name, info in header["arrays"].items():
+            start = info["offset"] // payload.itemsize
+            rows, width = info["shape"]
+            arrays[name] = payload[start:start + rows * width].reshape(
+                rows, width)
+        return arrays
+
+    payload = array.array("f")
+    with open(path, "rb") as f:
+        f.seek(payload_offset)
+        payload.frombytes(f.read())
+    if sys.byteorder != "little":
+        payload.byteswap()
+    for name, info in header["arrays"].items():
+        arrays[name] = (
+            payload, info["offset"] // payload.itemsize, info["shape"][1])
+    return arrays
+
+
+def _get_rows(values, start, stop):
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return values[start:stop].tolist()
+    payload, offset, width = values
+    return [
+        payload[offset + index * width:offset + (index + 1) * width]
+        for index in range(start, stop)
+    ]
+
+
+def iter_binary_layout_elements(path):
+    """Iterate elements of binary layout file.
+
+    Float arrays are memory-mapped when NumPy is available and converted
+    to Python values in chunks of `BINARY_LAYOUT_READ_ROWS` elements.
+
+    Args:
+        path (str): Path to binary layout file.
+
+    Yields:
+        LayoutElement: Layout elements in order of the file.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(BINARY_LAYOUT_MAGIC)) != BINARY_LAYOUT_MAGIC:
+            raise ValueError(f"{path} is not a binary layout file")
+        header_size = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(header_size).decode("utf-8"))
+    if header["version"] > BINARY_LAYOUT_VERSION:
+        raise ValueError(
+            f"Binary layout version {header['version']} is not supported")
+
+    payload_offset = len(BINARY_LAYOUT_MAGIC) + 8 + header_size
+    arrays = _read_binary_arrays(path, payload_offset, header)
+    bases = [
+        _matrix_from_values(values)
+        for values in _get_rows(
+            arrays["bases"], 0, header["arrays"]["bases"]["shape"][0])
+    ]
+    fields = header["fields"]
+    rows = header["elements"]
+    for chunk_start in range(0, len(rows), BINARY_LAYOUT_READ_ROWS):
+        chunk_stop = min(chunk_start + BINARY_LAYOUT_READ_ROWS, len(rows))
+        transforms = _get_rows(
+            arrays["transforms"], chunk_start, chunk_stop)
+        rotations = _get_rows(arrays["rotations"], chunk_start, chunk_stop)
+        for offset, row in enumerate(rows[chunk_start:chunk_stop]):
+            element = LayoutElement(**dict(zip(fields, row)))
+            basis_index, has_transform, has_rotation = row[len(fields):]
+            if basis_index >= 0:
+                element.basis = bases[basis_index]
+            if has_transform:
+                element.transform_matrix = _matrix_from_values(
+                    transforms[offset])
+            if has_rotation:
+                element.rotation = tuple(rotations[offset])
+            yield element
@@ -24,12 +24,15 @@ from ayon_core.pipeline import (
     get_current_project_name,
 )
 from ayon_core.lib import StringTemplate
+from ayon_core.settings import get_project_settings
 from ayon_core.pipeline.context_tools import (
     get_current_folder_entity
 )
 from ayon_core.tools.utils import host_tools
 from ayon_core.host import HostBase, ILoadHost, IPublishHost
 from ayon_unreal import UNREAL_ADDON_ROOT
+from ayon_unreal.api import publish_profiler
+from ayon_unreal.uproject import get_project_descriptor
 
 import unreal  # noqa
 
@@ -66,6 +69,17 @@ class UnrealHost(HostBase, ILoadHost, IPublishHost):
     def get_containers(self):
         return ls()
 
+    @staticmethod
+    def get_project_descriptor():
+        """Get descriptor of the opened Unreal project.
+
+        Returns:
+            UProjectDescriptor: Cached descriptor of the `.uproject` file.
+        """
+        project_file = unreal.Paths.convert_relative_path_to_full(
+            unreal.Paths.get_project_file_path())
+        return get_project_descriptor(project_file)
+
     @staticmethod
     def show_tools_popup():
         """Show tools popup with actions leading to show other tools."""
@@ -138,6 +152,7 @@ def install():
     register_loader_plugin_path(str(LOAD_PATH))
     register_creator_plugin_path(str(CREATE_PATH))
     register_inventory_action_path(str(INVENTORY_PATH))
+    _register_publish_profiler()
     _register_callbacks()
     _register_events()
 
@@ -148,6 +163,15 @@ def uninstall():
     deregister_loader_plugin_path(str(LOAD_PATH))
     deregister_creator_plugin_path(str(CREATE_PATH))
     deregister_inventory_action_path(str(INVENTORY_PATH))
+    publish_profiler.deregister_profiler()
+
+
+def _register_publish_profiler():
+    project_settings = None
+    project_name = get_current_project_name()
+    if project_name:
+        project_settings = get_project_settings(project_name)
+    publish_profiler.register_profiler(project_settings)
 
 
 def _register_callbacks():
@@ -526,78 +550,206 @@ def get_subsequences(sequence: unreal.LevelSequence):
     return []
 
 
-def set_sequence_hierarchy(
-    seq_i, seq_j, max_frame_i, min_frame_j, max_frame_j, map_paths
-):
-    # Get existing sequencer tracks or create them if they don't exist
-    tracks = get_tracks(seq_i)
-    subscene_track = None
-    visibility_track = None
-    for t in tracks:
-        if t.get_class() == unreal.MovieSceneSubTrack.static_class():
-            subscene_track = t
-        if (t.get_class() ==
-                unreal.MovieSceneLevelVisibilityTrack.static_class()):
-            visibility_track = t
+def get_level_name(map_path):
+    """Get asset name of a level without loading it.
+
+    Uses asset registry data when the level is already registered,
+    otherwise the name is taken from the object path. Newly created
+    levels might not be registered yet.
+
+    Args:
+        map_path (str): Object or package path of the level,
+            e.g. `/Game/Ayon/sh010/sh010_map.sh010_map`.
+
+    Returns:
+        str: Level asset name
+    """
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    asset_data = ar.get_asset_by_object_path(map_path)
+    if asset_data.is_valid():
+        return str(asset_data.asset_name)
+    return map_path.rsplit("/", 1)[-1].split(".")[-1]
+
+
+def link_child_sequences(parent, children, max_frame_parent):
+    """Add child sequences into a parent sequence in one pass.
+
+    Tracks of the parent are looked up once, each child gets a sub-scene
+    section (unless it is already linked) and a visibility section showing
+    its levels during the child frame range and hiding them outside of it.
+    Children listed more than once are linked once with all their levels.
+    Levels are never loaded.
+
+    Args:
+        parent (unreal.LevelSequence): Parent sequence.
+        children (list[dict]): Child `sequence` with its `frame_start`,
+            `frame_end` and list of `maps` (level paths).
+        max_frame_parent (int): Last frame of the parent sequence.
+    """
+    tracks = get_tracks(parent)
+    subscene_track = next(
+        iter(filter_tracks_by_class(
+            tracks, unreal.MovieSceneSubTrack, exact=True)),
+        None)
+    visibility_track = next(
+        iter(filter_tracks_by_class(
+            tracks, unreal.MovieSceneLevelVisibilityTrack, exact=True)),
+        None)
     if not subscene_track:
-        subscene_track = add_track(seq_i, unreal.MovieSceneSubTrack)
+        subscene_track = add_track(parent, unreal.MovieSceneSubTrack)
     if not visibility_track:
         visibility_track = add_track(
-            seq_i, unreal.MovieSceneLevelVisibilityTrack)
-
-    # Create the sub-scene section
-    subscenes = subscene_track.get_sections()
-    subscene = None
-    for s in subscenes:
-        if s.get_editor_property('sub_sequence') == seq_j:
-            subscene = s
-            break
-    if not subscene:
+            parent, unreal.MovieSceneLevelVisibilityTrack)
+
+    # Merge children listed multiple times
+    merged_children = {}
+    for child in children:
+        child_path = child["sequence"].get_path_name()
+        merged = merged_children.get(child_path)
+        if merged is None:
+            merged_children[child_path] = dict(child, maps=list(child["maps"]))
+            continue
+        merged["maps"].extend(
+            m for m in child["maps"] if m not in merged["maps"])
+
+    # Create the sub-scene sections
+    subscenes = {
+        section.get_editor_property('sub_sequence').get_path_name()
+        for section in subscene_track.get_sections()
+        if section.get_editor_property('sub_sequence')
+    }
+    for child_path, child in merged_children.items():
+        if child_path in subscenes:
+            continue
         subscene = subscene_track.add_section()
         subscene.set_row_index(len(subscene_track.get_sections()))
-        subscene.set_editor_property('sub_sequence', seq_j)
-        subscene.set_range(
-            min_frame_j,
-            max_frame_j + 1)
+        subscene.set_editor_property('sub_sequence', child["sequence"])
+        subscene.set_range(child["frame_start"], child["frame_end"] + 1)
+        subscenes.add(child_path)
+
+    # Create the visibility sections
+    level_names = {}
+    for child in merged_children.values():
+        min_frame = child["frame_start"]
+        max_frame = child["frame_end"]
+        maps = []
+        for m in child["maps"]:
+            if m not in level_names:
+                level_names[m] = get_level_name(m)
+            maps.append(level_names[m])
+
+        vis_section = visibility_track.add_section()
+        index = len(visibility_track.get_sections())
+
+        vis_section.set_range(min_frame, max_frame + 1)
+        vis_section.set_visibility(unreal.LevelVisibility.VISIBLE)
+        vis_section.set_row_index(index)
+        vis_section.set_level_names(maps)
+
+        if min_frame > 1:
+            hid_section = visibility_track.add_section()
+            hid_section.set_range(1, min_frame)
+            hid_section.set_visibility(unreal.LevelVisibility.HIDDEN)
+            hid_section.set_row_index(index)
+            hid_section.set_level_names(maps)
+        if max_frame < max_frame_parent:
+            hid_section = visibility_track.add_section()
+            hid_section.set_range(max_frame + 1, max_frame_parent + 1)
+            hid_section.set_visibility(unreal.LevelVisibility.HIDDEN)
+            hid_section.set_row_index(index)
+            hid_section.set_level_names(maps)
 
-    # Create the visibility section
-    ar = unreal.AssetRegistryHelpers.get_asset_registry()
-    maps = []
-    for m in map_paths:
-        # Unreal requires to load the level to get the map name
-        unreal.EditorLevelLibrary.save_all_dirty_levels()
-        unreal.EditorLevelLibrary.load_level(m)
-        maps.append(str(ar.get_asset_by_object_path(m).asset_name))
-
-    vis_section = visibility_track.add_section()
-    index = len(visibility_track.get_sections())
-
-    vis_section.set_range(
-        min_frame_j,
-        max_frame_j + 1)
-    vis_section.set_visibility(unreal.LevelVisibility.VISIBLE)
-    vis_section.set_row_index(index)
-    vis_section.set_level_names(maps)
-
-    if min_frame_j > 1:
-        hid_section = visibility_track.add_section()
-        hid_section.set_range(
-            1,
-            min_frame_j)
-        hid_section.set_visibility(unreal.LevelVisibility.HIDDEN)
-        hid_section.set_row_index(index)
-        hid_section.set_level_names(maps)
-    if max_frame_j < max_frame_i:
-        hid_section = visibility_track.add_section()
-        hid_section.set_range(
-            max_frame_j + 1,
-            max_frame_i + 1)
-        hid_section.set_visibility(unreal.LevelVisibility.HIDDEN)
-        hid_section.set_row_index(index)
-        hid_section.set_level_names(maps)
-
-
-def generate_sequence(h, h_dir):
+
+def set_sequence_hierarchy(
+    seq_i, seq_j, max_frame_i, min_frame_j, max_frame_j, map_paths
+):
+    """Add sequence as a child of a parent sequence.
+
+    See `link_child_sequences` to link many children at once.
+
+    Args:
+        seq_i (unreal.LevelSequence): Parent sequence.
+        seq_j (unreal.LevelSequence): Child sequence.
+        max_frame_i (int): Last frame of the parent sequence.
+        min_frame_j (int): First frame of the child sequence.
+        max_frame_j (int): Last frame of the child sequence.
+        map_paths (list[str]): Levels visible during the child sequence.
+    """
+    link_child_sequences(
+        seq_i,
+        [{
+            "sequence": seq_j,
+            "frame_start": min_frame_j,
+            "frame_end": max_frame_j,
+            "maps": map_paths,
+        }],
+        max_frame_i
+    )
+
+
+def get_sequence_folder_path(h_dir):
+    """Get folder path of the sequence hierarchy directory.
+
+    Args:
+        h_dir (str): Content directory of the sequence,
+            e.g. `/Game/Ayon/ep01/sq01`.
+
+    Returns:
+        str: Folder path, e.g. `/ep01/sq01`.
+
+    """
+    filtered_dir = "/Game/Ayon/"
+    return "/{}".format(h_dir.replace(filtered_dir, "").strip("/"))
+
+
+def get_folder_attributes_by_path(project_name, folder_paths):
+    """Query frame range and fps attributes of folders in one request.
+
+    Args:
+        project_name (str): Project name.
+        folder_paths (Iterable[str]): Folder paths.
+
+    Returns:
+        dict[str, dict]: Attributes of found folders by folder path.
+
+    """
+    folder_paths = {
+        "/{}".format(folder_path.strip("/"))
+        for folder_path in folder_paths
+    }
+    if not folder_paths:
+        return {}
+
+    return {
+        folder_entity["path"]: folder_entity["attrib"]
+        for folder_entity in ayon_api.get_folders(
+            project_name,
+            folder_paths=folder_paths,
+            fields={
+                "path",
+                "attrib.fps",
+                "attrib.clipIn",
+                "attrib.clipOut"
+            }
+        )
+    }
+
+
+def generate_sequence(h, h_dir, folder_attributes_by_path=None):
+    """Create level sequence with frame range and fps of its folder.
+
+    Args:
+        h (str): Sequence name.
+        h_dir (str): Content directory of the sequence.
+        folder_attributes_by_path (dict[str, dict], optional): Prefetched
+            folder attributes by folder path, see
+            `get_folder_attributes_by_path`. Folder is queried from the
+            server when not provided.
+
+    Returns:
+        tuple: Level sequence and its frame range.
+
+    """
     tools = unreal.AssetToolsHelpers().get_asset_tools()
 
     sequence = tools.create_asset(
@@ -607,27 +759,20 @@ def generate_sequence(h, h_dir):
         factory=unreal.LevelSequenceFactoryNew()
     )
 
-    project_name = get_current_project_name()
-    filtered_dir = "/Game/Ayon/"
-    folder_path = h_dir.replace(filtered_dir, "")
-    folder_entity = ayon_api.get_folder_by_path(
-        project_name,
-        folder_path,
-        fields={
-            "id",
-            "attrib.fps",
-            "attrib.clipIn",
-            "attrib.clipOut"
-        }
-    )
+    folder_path = get_sequence_folder_path(h_dir)
+    if folder_attributes_by_path is None:
+        folder_attributes_by_path = get_folder_attributes_by_path(
+            get_current_project_name(), [folder_path])
+    folder_attributes = folder_attributes_by_path.get(folder_path)
+
     # unreal default frame range value
     fps = 60.0
     min_frame = sequence.get_playback_start()
     max_frame = sequence.get_playback_end()
-    if folder_entity:
-        min_frame = folder_entity["attrib"]["clipIn"]
-        max_frame = folder_entity["attrib"]["clipOut"]
-        fps = folder_entity["attrib"]["fps"]
+    if folder_attributes:
+        min_frame = folder_attributes["clipIn"]
+        max_frame = folder_attributes["clipOut"]
+        fps = folder_attributes["fps"]
     else:
         unreal.log_warning(
             "Folder Entity not found. Using default Unreal frame range value."
@@ -1016,17 +1161,20 @@ def find_camera_actors_in_camera_tracks(sequence) -> list[Any]:
     return actors
 
 
-def get_frame_range(sequence):
+def get_frame_range(sequence, camera_tracks=None):
     """Get the Clip in/out value from the camera tracks located inside
     the level sequence
 
     Args:
         sequence (Object): Level Sequence
+        camera_tracks (list, optional): Camera cut tracks of the sequence,
+            looked up when not provided.
 
     Returns:
         int32, int32 : Start Frame, End Frame
     """
-    camera_tracks = get_camera_tracks(sequence)
+    if camera_tracks is None:
+        camera_tracks = get_camera_tracks(sequence)
     if not camera_tracks:
         return sequence.get_playback_start(), sequence.get_playback_end()
     for camera_track in camera_tracks:
@@ -1035,21 +1183,327 @@ def get_frame_range(sequence):
             return section.get_start_frame(), section.get_end_frame()
 
 
-def get_camera_tracks(sequence):
+def get_camera_tracks(sequence, tracks=None):
     """Get the list of movie scene camera cut tracks in the level sequence
 
     Args:
         sequence (Object): Level Sequence
+        tracks (list, optional): Tracks of the sequence, looked up when
+            not provided.
 
     Returns:
         list: list of movie scene camera cut tracks
     """
-    camera_tracks = []
-    tracks = get_tracks(sequence)
-    for track in tracks:
-        if str(track).count("MovieSceneCameraCutTrack"):
-            camera_tracks.append(track)
-    return camera_tracks
+    if tracks is None:
+        tracks = get_tracks(sequence)
+    return filter_tracks_by_class(tracks, unreal.MovieSceneCameraCutTrack)
+
+
+def filter_tracks_by_class(tracks, track_class, exact=False):
+    """Filter movie scene tracks by their class.
+
+    Args:
+        tracks (list): Movie scene tracks.
+        track_class (type): Class inherited from `unreal.MovieSceneTrack`.
+        exact (bool): Skip tracks of classes inherited from `track_class`,
+            e.g. cinematic shot tracks when filtering sub tracks.
+
+    Returns:
+        list: Tracks of the given class or its subclasses.
+    """
+    if exact:
+        static_class = track_class.static_class()
+        return [
+            track for track in tracks if track.get_class() == static_class
+        ]
+    return [track for track in tracks if isinstance(track, track_class)]
+
+
+def get_asset_class_name(asset_data):
+    """Get class name of an asset from its asset registry data.
+
+    Args:
+        asset_data (unreal.AssetData): Asset registry data.
+
+    Returns:
+        str: Asset class name
+    """
+    if UNREAL_VERSION.major == 5 and UNREAL_VERSION.minor > 0:
+        return str(asset_data.asset_class_path.asset_name)
+    return str(asset_data.asset_class)
+
+
+def get_package_state(
+    package_name, dirty_packages=None, extension="uasset"
+):
+    """Get state of a package used to invalidate cached data.
+
+    Args:
+        package_name (str): Package name, e.g. `/Game/Ayon/sh010`.
+        dirty_packages (set, optional): Names of packages with unsaved
+            changes, looked up when not provided.
+        extension (str): Extension of the package file, `umap` for
+            levels.
+
+    Returns:
+        tuple: Dirty flag, modification time and size of the package file.
+    """
+    if dirty_packages is None:
+        dirty_packages = get_dirty_package_names()
+    mtime = size = None
+    package_file = get_package_file(package_name, extension)
+    if package_file:
+        try:
+            stat = os.stat(package_file)
+            mtime, size = stat.st_mtime, stat.st_size
+        except OSError:
+            pass
+    return package_name in dirty_packages, mtime, size
+
+
+def get_package_file(package_name, extension="uasset"):
+    """Get path to the file of a project content package.
+
+    Args:
+        package_name (str): Package name, e.g. `/Game/Ayon/sh010`.
+        extension (str): Extension of the package file.
+
+    Returns:
+        Optional[str]: Path to the package file, None for packages outside
+            of the project content directory.
+    """
+    if not package_name.startswith("/Game/"):
+        return None
+    content_dir = unreal.Paths.convert_relative_path_to_full(
+        unreal.Paths.project_content_dir())
+    return os.path.join(
+        content_dir, f"{package_name[len('/Game/'):]}.{extension}")
+
+
+def get_dirty_package_names():
+    """Get names of content and map packages with unsaved changes.
+
+    Returns:
+        set[str]: Package names
+    """
+    utils = unreal.EditorLoadingAndSavingUtils
+    return {
+        package.get_name()
+        for packages in (
+            utils.get_dirty_content_packages(),
+            utils.get_dirty_map_packages(),
+        )
+        for package in packages
+    }
+
+
+class SceneSnapshot:
+    """Level actors and asset registry data shared by publish plugins.
+
+    Actors of the editor world are listed once and indexed by their path,
+    they are listed again only when another level gets loaded. Asset
+    registry data, loaded assets and asset containers are cached by path.
+
+    Use `get_scene_snapshot` to get the snapshot of a publish context.
+    """
+
+    def __init__(self):
+        self._asset_registry = (
+            unreal.AssetRegistryHelpers.get_asset_registry())
+        self._world_path = None
+        self._actors = None
+        self._asset_data = {}
+        self._assets = {}
+        self._containers = {}
+
+    def get_actors_by_path(self):
+        """Get actors of the editor world by their path name.
+
+        Returns:
+            dict[str, unreal.Actor]: Actors in the order of the level.
+        """
+        world_path = (
+            unreal.EditorLevelLibrary.get_editor_world().get_path_name())
+        if self._actors is None or world_path != self._world_path:
+            actor_subsystem = unreal.EditorActorSubsystem()
+            self._world_path = world_path
+            self._actors = {
+                actor.get_path_name(): actor
+                for actor in actor_subsystem.get_all_level_actors()
+            }
+        return self._actors
+
+    def get_actors(self, actor_paths):
+        """Get actors of the editor world by their path name.
+
+        Args:
+            actor_paths (Iterable[str]): Actor path names.
+
+        Returns:
+            list[unreal.Actor]: Existing actors in the order of the level.
+        """
+        actor_paths = set(actor_paths)
+        return [
+            actor
+            for path, actor in self.get_actors_by_path().items()
+            if path in actor_paths
+        ]
+
+    def get_asset_data(self, object_path):
+        """Get asset registry data of an asset.
+
+        Args:
+            object_path (str): Object path to the asset.
+
+        Returns:
+            unreal.AssetData: Asset registry data.
+        """
+        asset_data = self._asset_data.get(object_path)
+        if asset_data is None:
+            asset_data = self._asset_registry.get_asset_by_object_path(
+                object_path)
+            self._asset_data[object_path] = asset_data
+        return asset_data
+
+    def get_asset_class_name(self, object_path):
+        """Get class name of an asset without loading it."""
+        return get_asset_class_name(self.get_asset_data(object_path))
+
+    def get_asset(self, object_path):
+        """Get loaded asset, the asset is loaded only once.
+
+        Args:
+            object_path (str): Object path to the asset.
+
+        Returns:
+            unreal.Object: Loaded asset.
+        """
+        asset = self._assets.get(object_path)
+        if asset is None:
+            asset = self.get_asset_data(object_path).get_asset()
+            self._assets[object_path] = asset
+        return asset
+
+    def get_asset_container(self, package_path):
+        """Get AYON asset container in a content directory.
+
+        Args:
+            package_path (str): Content directory, e.g. `/Game/Ayon/Asset`.
+
+        Returns:
+            Optional[unreal.Object]: The asset container.
+        """
+        if package_path not in self._containers:
+            ar_filter = unreal.ARFilter(
+                class_names=["AyonAssetContainer"],
+                package_paths=[package_path])
+            containers = self._asset_registry.get_assets(ar_filter)
+            self._containers[package_path] = (
+                containers[0].get_asset() if containers else None)
+        return self._containers[package_path]
+
+    def invalidate(self):
+        """Drop all cached actors and assets."""
+        self._world_path = None
+        self._actors = None
+        self._asset_data.clear()
+        self._assets.clear()
+        self._containers.clear()
+
+
+def get_scene_snapshot(context):
+    """Get scene snapshot shared by plugins of a publish context.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        SceneSnapshot: Snapshot stored in the context data.
+    """
+    snapshot = context.data.get("unrealSceneSnapshot")
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+        context.data["unrealSceneSnapshot"] = snapshot
+    return snapshot
+
+
+class LevelSequenceCache:
+    """Inspect level sequences once and share the results.
+
+    Loaded sequence, its camera cut tracks and frame range are cached by
+    sequence path together with the state of its package. When the package
+    gets saved or dirty, the sequence is inspected again. Changes made to an
+    already dirty package are not detected, code modifying sequences should
+    call `invalidate` afterwards.
+
+    Use `get_level_sequence_cache` to get the cache of a publish context.
+
+    Args:
+        scene_snapshot (SceneSnapshot, optional): Snapshot to look up asset
+            registry data in.
+    """
+
+    def __init__(self, scene_snapshot=None):
+        self._entries = {}
+        if scene_snapshot is None:
+            scene_snapshot = SceneSnapshot()
+        self._scene_snapshot = scene_snapshot
+
+    def get(self, sequence_path):
+        """Get cached information of a level sequence.
+
+        Args:
+            sequence_path (str): Object path to the level sequence.
+
+        Returns:
+            Optional[dict]: Cached `sequence`, `tracks`, `camera_tracks`
+                and `frame_range`. None if the asset is not a level
+                sequence.
+        """
+        asset_data = self._scene_snapshot.get_asset_data(sequence_path)
+        if get_asset_class_name(asset_data) != "LevelSequence":
+            return None
+
+        state = get_package_state(str(asset_data.package_name))
+        entry = self._entries.get(sequence_path)
+        if entry is not None and entry["state"] == state:
+            return entry
+
+        sequence = asset_data.get_asset()
+        tracks = get_tracks(sequence)
+        camera_tracks = get_camera_tracks(sequence, tracks)
+        entry = {
+            "state": state,
+            "sequence": sequence,
+            "tracks": tracks,
+            "camera_tracks": camera_tracks,
+            "frame_range": get_frame_range(sequence, camera_tracks),
+        }
+        self._entries[sequence_path] = entry
+        return entry
+
+    def invalidate(self, sequence_path=None):
+        """Drop cached information of a sequence or of all sequences."""
+        if sequence_path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(sequence_path, None)
+
+
+def get_level_sequence_cache(context):
+    """Get level sequence cache shared by plugins of a publish context.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        LevelSequenceCache: Cache stored in the context data.
+    """
+    cache = context.data.get("unrealLevelSequenceCache")
+    if cache is None:
+        cache = LevelSequenceCache(get_scene_snapshot(context))
+        context.data["unrealLevelSequenceCache"] = cache
+    return cache
 
 
 def get_frame_range_from_folder_attributes(folder_entity=None):
@@ -1187,6 +1641,8 @@ def generate_master_level_sequence(tools, asset_dir, asset_name,
         asset_level,
         unreal.LevelStreamingDynamic
     )
+    # Loading another level discards unsaved changes of the master level
+    unreal.EditorLevelLibrary.save_all_dirty_levels()
     sequences = []
     frame_ranges = []
     root_content = unreal.EditorAssetLibrary.list_assets(
@@ -1273,3 +1729,44 @@ def add_track(sequence, track):
         return sequence.add_track(track)
     else:
         return sequence.add_master_track(track)
+
+
+def retime_sequence_keys(sequence, frame_start, frame_end, offset):
+    """Set range of possessable sections and move their keys by offset.
+
+    Keys are not touched at all when the offset is zero, then only the
+    ranges of the sections are changed. Otherwise time of each key is
+    read and set, scripting channels have no call moving many keys.
+
+    Args:
+        sequence (unreal.LevelSequence): Level Sequence
+        frame_start (int): Start frame of the sections.
+        frame_end (int): End frame of the sections, exclusive.
+        offset (int): Number of frames to move keys by.
+
+    Returns:
+        int: Number of retimed keys.
+    """
+    sections = [
+        section
+        for possessable in sequence.get_possessables()
+        for track in possessable.get_tracks()
+        for section in track.get_sections()
+    ]
+    for section in sections:
+        section.set_range(frame_start, frame_end)
+
+    if not offset:
+        return 0
+
+    key_count = 0
+    for section in sections:
+        for channel in section.get_all_channels():
+            keys = channel.get_keys()
+            for key in keys:
+                frame = key.get_time().get_editor_property(
+                    "frame_number").get_editor_property("value")
+                key.set_time(unreal.FrameNumber(value=frame + offset))
+            key_count += len(keys)
+
+    return key_count
@@ -2,6 +2,7 @@
 from __future__ import annotations
 import ast
 import collections
+import json
 from abc import ABC
 from typing import Any, Optional
 
@@ -9,12 +10,22 @@ import unreal
 import ayon_api
 
 from .pipeline import (
+    cast_map_to_str_dict,
+    create_container,
     create_publish_instance,
     imprint,
     ls_inst,
     UNREAL_VERSION
 )
 from .lib import remove_loaded_asset
+from .content_hash import get_source_file_data, is_source_file_unchanged
+from .import_cache import get_import_cache, get_import_key
+from .layout import convert_basis_matrices
+from .spawn import (
+    get_placement_transform,
+    spawn_actors,
+    spawn_instanced_actor,
+)
 from ayon_core.lib import (
     BoolDef,
     UILabelDef,
@@ -296,13 +307,147 @@ class UnrealActorCreator(UnrealBaseCreator):
 class Loader(LoaderPlugin, ABC):
     """This serves as skeleton for future Ayon specific functionality"""
 
+    def _get_import_key(self, context, options):
+        import_options = {
+            key: value
+            for key, value in (options or {}).items()
+            if key != "layout"
+        }
+        return get_import_key(
+            self.__class__.__name__,
+            context["representation"]["id"],
+            import_options
+        )
+
+    def get_cached_import(self, context, options=None):
+        """Get content of the representation if it is already imported.
+
+        Args:
+            context (dict): Context of the representation.
+            options (dict, optional): Load options.
+
+        The load gets its own container in the directory, with the same
+        data as the container of the first load, so it is listed in the
+        scene inventory. The directory is removed with its last container,
+        see `remove_container_directory`.
+
+        Returns:
+            Optional[list[str]]: Content of the directory the representation
+                was imported into by the same loader with the same options.
+        """
+        repre_id = context["representation"]["id"]
+        container_path = get_import_cache().get(
+            self._get_import_key(context, options), repre_id)
+        if not container_path:
+            return None
+
+        asset_dir = container_path.rsplit("/", 1)[0]
+        self.log.info(
+            f"Representation {repre_id} is already imported "
+            f"in {asset_dir}, reusing it.")
+        data = cast_map_to_str_dict(
+            unreal.EditorAssetLibrary.get_metadata_tag_values(
+                unreal.EditorAssetLibrary.load_asset(container_path)))
+        tools = unreal.AssetToolsHelpers().get_asset_tools()
+        _, container_name = tools.create_unique_asset_name(
+            container_path, suffix="")
+        create_container(container=container_name, path=asset_dir)
+        imprint(f"{asset_dir}/{container_name}", data)
+
+        return unreal.EditorAssetLibrary.list_assets(
+            asset_dir, recursive=True, include_folder=True
+        )
+
+    def remove_container_directory(self, container):
+        """Remove the directory with assets loaded by the container.
+
+        Directory shared by loads of an already imported representation,
+        see `get_cached_import`, is kept until its last container is
+        removed, only the container is removed before.
+
+        Args:
+            container (dict): Container metadata.
+        """
+        path = container["namespace"]
+        if not unreal.EditorAssetLibrary.does_directory_exist(path):
+            return
+        container_path = f"{path}/{container['objectName']}"
+        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        other_containers = [
+            asset_data
+            for asset_data in ar.get_assets(unreal.ARFilter(
+                class_names=["AyonAssetContainer"],
+                package_paths=[path],
+                recursive_paths=False
+            ))
+            if str(asset_data.asset_name) != container["objectName"]
+        ]
+        if other_containers:
+            unreal.EditorAssetLibrary.delete_asset(container_path)
+            return
+        unreal.EditorAssetLibrary.delete_directory(path)
+
+    def cache_import(self, context, asset_dir, container_name, options=None):
+        """Store directory the representation was imported into.
+
+        Args:
+            context (dict): Context of the representation.
+            asset_dir (str): Content directory with the imported assets.
+            container_name (str): Name of the container in the directory.
+            options (dict, optional): Load options.
+        """
+        get_import_cache().add(
+            self._get_import_key(context, options), asset_dir, container_name)
+
+    def imprint_source_file(self, container_path, path):
+        """Store data of the imported source file into container metadata.
+
+        Args:
+            container_path (str): Path to the container asset.
+            path (str): Path to the imported file.
+        """
+        imprint(container_path, get_source_file_data(path))
+
+    def update_unchanged_source(self, container, context):
+        """Update container without import if its source did not change.
+
+        When the file of the new representation has the same content as
+        the file imported by the container, only the representation in
+        container metadata is updated.
+
+        Args:
+            container (dict): Container metadata.
+            context (dict): Context of the new representation.
+
+        Returns:
+            bool: The container was updated without import.
+        """
+        path = self.filepath_from_context(context)
+        if not is_source_file_unchanged(container, path):
+            return False
+
+        repre_entity = context["representation"]
+        self.log.info(
+            f"{path} has the same content as already imported file, "
+            "skipping import.")
+        imprint(
+            f"{container['namespace']}/{container['objectName']}",
+            {
+                "representation": repre_entity["id"],
+                "parent": repre_entity["versionId"],
+                "project_name": context["project"]["name"],
+                **get_source_file_data(path),
+            }
+        )
+        return True
+
 
 class LayoutLoader(Loader):
     """Load Layout from a JSON file"""
 
     product_base_types = {"layout"}
     product_types = product_base_types
-    representations = {"json"}
+    representations = {"json", "ulayout"}
 
     label = "Load Layout"
     icon = "code-fork"
@@ -310,6 +455,7 @@ class LayoutLoader(Loader):
     loaded_layout_dir = "{folder[path]}/{product[name]}"
     loaded_layout_name = "{folder[name]}_{product[name]}_{version[version]}"
     remove_loaded_assets = False
+    instanced_mesh_threshold = 0
 
     @staticmethod
     def _get_fbx_loader(loaders, family):
@@ -373,22 +519,119 @@ class LayoutLoader(Loader):
 
         return new_transform.transform()
 
-    def _get_repre_entities_by_version_id(self, project_name, data, repre_extension, force_loaded=False):
-        version_ids = {
-            element.get("version")
-            for element in data
-            if element.get("representation")
+    def _transforms_from_basis(self, elements):
+        """Get transforms of layout elements converted from their basis.
+
+        Conversion of all elements is done in one batch, see
+        `convert_basis_matrices`, and matrices are turned into
+        transforms afterwards.
+
+        Args:
+            elements (list[LayoutElement]): Layout elements.
+
+        Returns:
+            dict[LayoutElement, unreal.Transform]: Transform by element,
+                elements without transform matrix are not included.
+        """
+        return {
+            element: unreal.Matrix(*rows).transform()
+            for element, rows in zip(
+                elements, convert_basis_matrices(elements))
+            if rows is not None
+        }
+
+    def _get_placement_transforms(self, elements):
+        """Get transforms actors of layout elements are placed with.
+
+        Args:
+            elements (list[LayoutElement]): Layout elements.
+
+        Returns:
+            dict[LayoutElement, unreal.Transform]: Transform by element,
+                elements without transform matrix are not included.
+        """
+        return {
+            element: get_placement_transform(transform, element.rotation)
+            for element, transform in self._transforms_from_basis(
+                elements).items()
         }
+
+    def _is_instanced(self, obj, count, instanced_meshes=False):
+        """Check whether placements of an asset are spawned as instances.
+
+        Args:
+            obj (unreal.Object): Asset to spawn actors from.
+            count (int): Number of placements of the asset.
+            instanced_meshes (bool): Instance all static meshes.
+
+        Returns:
+            bool: Placements are instances of one actor.
+        """
+        if obj.get_class().get_name() != "StaticMesh":
+            return False
+        if instanced_meshes:
+            return True
+        return bool(
+            self.instanced_mesh_threshold
+            and count > self.instanced_mesh_threshold
+        )
+
+    def _spawn_placements(
+        self, obj, transforms, instanced_meshes=False, count=None
+    ):
+        """Spawn actors of an asset for placement transforms.
+
+        Static mesh placed more times than `instanced_mesh_threshold`, or
+        any static mesh with `instanced_meshes`, is spawned as instances
+        of one actor.
+
+        Args:
+            obj (unreal.Object): Asset to spawn actors from.
+            transforms (list[unreal.Transform]): Placement transforms.
+            instanced_meshes (bool): Instance all static meshes.
+            count (int, optional): Number of all placements of the asset
+                in the layout, instancing is decided by it when only some
+                of them are spawned. Defaults to number of transforms.
+
+        Returns:
+            list[unreal.Actor]: Actor of every placement.
+        """
+        if not transforms:
+            return []
+        if count is None:
+            count = len(transforms)
+        if self._is_instanced(obj, count, instanced_meshes):
+            actor, _, _ = spawn_instanced_actor(obj, transforms)
+            return [actor] * len(transforms)
+        return spawn_actors(obj, transforms)
+
+    def _get_repre_entities_by_version_id(
+        self, project_name, elements, repre_extension, force_loaded=False
+    ):
+        """Get representations of versions placed by layout elements.
+
+        Args:
+            project_name (str): Project name.
+            elements (Iterable[LayoutElement]): Layout elements.
+            repre_extension (str): Representation name the layout assets
+                are loaded from when `force_loaded` is enabled.
+            force_loaded (bool): Load all assets from `repre_extension`.
+
+        Returns:
+            dict[str, list[dict]]: Representation entities by version id.
+        """
+        version_ids = set()
+        # Extract extensions from data with backward compatibility for "ma"
+        extensions = set()
+        for element in elements:
+            if not element.representation:
+                continue
+            version_ids.add(element.version)
+            extensions.add(element.extension)
         version_ids.discard(None)
         output = collections.defaultdict(list)
         if not version_ids:
             return output
-        # Extract extensions from data with backward compatibility for "ma"
-        extensions = {
-            element.get("extension", "ma")
-            for element in data
-            if element.get("representation")
-        }
 
         # Update extensions based on the force_loaded flag
         updated_extensions = set()
@@ -424,6 +667,9 @@ class LayoutLoader(Loader):
         container_name: str,
         project_name: str,
         hierarchy_dir: Optional[str] = None,
+        instanced_meshes: bool = False,
+        instanced_placements: Optional[dict[str, list[str]]] = None,
+        placements: Optional[dict[str, list[str]]] = None,
     ) -> None:
         """Imprint the container with the necessary data.
 
@@ -438,6 +684,13 @@ class LayoutLoader(Loader):
             project_name (str): The name of the project.
             hierarchy_dir (str, optional): The directory of the hierarchy.
                 Defaults to None.
+            instanced_meshes (bool): All static meshes are loaded as
+                instances. Defaults to False.
+            instanced_placements (dict, optional): Keys of layout elements
+                by name of actor placing them as instances, in order of
+                instance indexes. Defaults to None.
+            placements (dict, optional): Names of actors by key of layout
+                element they place. Defaults to None.
 
         Note:
             This method is re-implemented with different signatures in
@@ -463,6 +716,12 @@ class LayoutLoader(Loader):
         }
         if hierarchy_dir is not None:
             data["master_directory"] = hierarchy_dir
+        if instanced_meshes:
+            data["instanced_meshes"] = True
+        if instanced_placements is not None:
+            data["instanced_placements"] = json.dumps(instanced_placements)
+        if placements is not None:
+            data["placements"] = json.dumps(placements)
         imprint(f"{asset_dir}/{container_name}", data)
 
     def _load_assets(
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""Profiling of Unreal publish plugins.
+
+When enabled, every publish plugin discovered from the addon publish path
+is wrapped to record its wall time, number of `unreal` API calls by
+category and peak Python memory, for each instance it processes. Records
+of a publish are written as JSON report and as folded stacks, which can be
+opened by flamegraph tools like speedscope or `flamegraph.pl`.
+
+Profiling is enabled by `AYON_UNREAL_PUBLISH_PROFILE` environment variable
+or by `publish_profiler` project settings.
+"""
+import os
+import sys
+import json
+import time
+import types
+import tracemalloc
+
+import pyblish.api
+import unreal
+
+PROFILE_ENV = "AYON_UNREAL_PUBLISH_PROFILE"
+PROFILE_DIR_ENV = "AYON_UNREAL_PUBLISH_PROFILE_DIR"
+
+_registered_profiler = None
+
+UNREAL_CALL_CATEGORIES = {
+    "asset_loads": {
+        "get_asset",
+        "load_asset",
+        "load_object",
+        "load_blueprint_class",
+        "load_level",
+        "load_package",
+    },
+    "registry_queries": {
+        "get_asset_by_object_path",
+        "get_assets",
+        "get_assets_by_class",
+        "get_assets_by_package_name",
+        "get_assets_by_path",
+        "get_all_assets",
+        "get_dependencies",
+        "get_referencers",
+        "find_asset_data",
+        "does_asset_exist",
+        "does_directory_exist",
+        "list_assets",
+    },
+    "saves": {
+        "save_asset",
+        "save_loaded_asset",
+        "save_loaded_assets",
+        "save_directory",
+        "save_packages",
+        "save_dirty_packages",
+        "save_current_level",
+        "save_all_dirty_levels",
+    },
+}
+_CATEGORY_BY_NAME = {
+    name: category
+    for category, names in UNREAL_CALL_CATEGORIES.items()
+    for name in names
+}
+
+
+def is_profiling_enabled(project_settings=None):
+    """Check whether publish profiling is enabled.
+
+    Args:
+        project_settings (dict, optional): Project settings.
+
+    Returns:
+        bool: Profiling is enabled by environment or settings.
+    """
+    if os.getenv(PROFILE_ENV, "").lower() in {"1", "true", "yes"}:
+        return True
+    if not project_settings:
+        return False
+    profiler_settings = (
+        project_settings.get("unreal", {}).get("publish_profiler", {}))
+    return bool(profiler_settings.get("enabled"))
+
+
+def get_report_dir(project_settings=None):
+    """Get directory publish profile reports are written to."""
+    report_dir = os.getenv(PROFILE_DIR_ENV)
+    if not report_dir and project_settings:
+        report_dir = (
+            project_settings.get("unreal", {})
+            .get("publish_profiler", {})
+            .get("report_dir")
+        )
+    if not report_dir:
+        report_dir = os.path.join(
+            unreal.Paths.project_saved_dir(), "Ayon", "PublishProfiles")
+    return os.path.normpath(report_dir)
+
+
+def _get_call_category(func):
+    """Get category of a called C function if it belongs to `unreal`."""
+    category = _CATEGORY_BY_NAME.get(getattr(func, "__name__", None))
+    owner = getattr(func, "__self__", None)
+    if owner is None:
+        return None
+    if isinstance(owner, types.ModuleType):
+        module_name = owner.__name__
+    elif isinstance(owner, type):
+        module_name = owner.__module__
+    else:
+        module_name = type(owner).__module__
+    if module_name != "unreal":
+        return None
+    return category or "other"
+
+
+def _normalize_dir(path):
+    return os.path.normcase(os.path.realpath(path))
+
+
+def _get_plugin_file(plugin):
+    """Get path of the file a plugin was discovered in.
+
+    Pyblish executes plugin files as modules stored in `sys.modules` by
+    their path, the module name of discovered plugins is set to it.
+    """
+    module = sys.modules.get(plugin.__module__)
+    return getattr(module, "__file__", None)
+
+
+class PublishProfiler:
+    """Collect profile records of publish plugins and write reports.
+
+    Args:
+        report_dir (str): Directory reports are written to.
+    """
+
+    def __init__(self, report_dir):
+        self.report_dir = report_dir
+        self._call_counts = None
+
+    def discovery_filter(self, plugins):
+        """Wrap publish plugins of the addon, used as discovery filter."""
+        from ayon_unreal.api.pipeline import PUBLISH_PATH
+
+        publish_path = _normalize_dir(PUBLISH_PATH)
+        for plugin in plugins:
+            plugin_file = _get_plugin_file(plugin)
+            if not plugin_file:
+                continue
+            if _normalize_dir(os.path.dirname(plugin_file)) != publish_path:
+                continue
+            if plugin.__dict__.get("_ayon_profiled"):
+                continue
+            self._wrap_plugin(plugin)
+
+    def _wrap_plugin(self, plugin):
+        process = plugin.process
+        profiler = self
+
+        if plugin.__instanceEnabled__:
+            def profiled_process(self, instance):
+                return profiler.run(
+                    self, instance.context, instance,
+                    lambda: process(self, instance))
+        else:
+            def profiled_process(self, context):
+                return profiler.run(
+                    self, context, None,
+                    lambda: process(self, context))
+
+        profiled_process.__doc__ = process.__doc__
+        plugin.process = profiled_process
+        plugin._ayon_profiled = True
+
+    def _profile_call(self, frame, event, arg):
+        if event != "c_call":
+            return
+        category = _get_call_category(arg)
+        if category:
+            self._call_counts[category] = (
+                self._call_counts.get(category, 0) + 1)
+
+    def run(self, plugin, context, instance, process):
+        """Run plugin process and record its profile.
+
+        Args:
+            plugin (pyblish.api.Plugin): Plugin being processed.
+            context (pyblish.api.Context): Publish context.
+            instance (pyblish.api.Instance): Processed instance, None for
+                context plugins.
+            process (Callable): Original process of the plugin.
+
+        Returns:
+            Any: Result of the process.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        memory_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        self._call_counts = {}
+        previous_profile = sys.getprofile()
+        sys.setprofile(self._profile_call)
+        start = time.perf_counter()
+        success = False
+        try:
+            result = process()
+            success = True
+            return result
+        finally:
+            duration = time.perf_counter() - start
+            sys.setprofile(previous_profile)
+            memory_peak = tracemalloc.get_traced_memory()[1]
+            self._record(context, {
+                "plugin": type(plugin).__name__,
+                "label": plugin.label or type(plugin).__name__,
+                "order": plugin.order,
+                "instance": instance.data.get("name") if instance else None,
+                "duration": duration,
+                "success": success,
+                "unreal_calls": self._call_counts,
+                "peak_memory": max(0, memory_peak - memory_start),
+            })
+            self._call_counts = None
+
+    def _record(self, context, record):
+        profile = context.data.get("unrealPublishProfile")
+        if profile is None:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            profile = {
+                "path": os.path.join(
+                    self.report_dir, f"publish_profile_{timestamp}"),
+                "records": [],
+            }
+            context.data["unrealPublishProfile"] = profile
+        profile["records"].append(record)
+        # Reports are rewritten after each plugin, so even publish which
+        # crashes or gets stopped leaves a report behind.
+        self.write(profile)
+
+    def write(self, profile):
+        """Write JSON report and folded stacks of a publish profile."""
+        os.makedirs(self.report_dir, exist_ok=True)
+        records = profile["records"]
+        with open(f"{profile['path']}.json", "w") as f:
+            json.dump({
+                "duration": sum(record["duration"] for record in records),
+                "records": records,
+            }, f, indent=2)
+
+        with open(f"{profile['path']}.folded", "w") as f:
+            for record in records:
+                stack = ["publish", record["label"]]
+                if record["instance"]:
+                    stack.append(record["instance"])
+                microseconds = int(record["duration"] * 1000000)
+                f.write(f"{';'.join(stack)} {microseconds}\n")
+
+
+def register_profiler(project_settings=None):
+    """Register profiling of publish plugins if enabled.
+
+    Args:
+        project_settings (dict, optional): Project settings.
+
+    Returns:
+        Optional[PublishProfiler]: Registered profiler.
+    """
+    global _registered_profiler
+
+    if _registered_profiler is not None:
+        return _registered_profiler
+    if not is_profiling_enabled(project_settings):
+        return None
+    profiler = PublishProfiler(get_report_dir(project_settings))
+    pyblish.api.register_discovery_filter(profiler.discovery_filter)
+    _registered_profiler = profiler
+    unreal.log(
+        f"Publish profiling enabled, reports in {profiler.report_dir}")
+    return profiler
+
+
+def deregister_profiler():
+    """Stop profiling of newly discovered publish plugins."""
+    global _registered_profiler
+
+    if _registered_profiler is None:
+        return
+    pyblish.api.deregister_discovery_filter(
+        _registered_profiler.discovery_filter)
+    _registered_profiler = None
@@ -1,17 +1,22 @@
 import os
 import ast
+import time
 from typing import Optional
 
 import unreal
 
 from ayon_core.settings import get_project_settings
 from ayon_core.pipeline import Anatomy
+from ayon_unreal import render_jobs, render_telemetry
 from ayon_unreal.api import pipeline
 from ayon_core.tools.utils import show_message_dialog
 
 
 queue = None
 executor = None
+telemetry = None
+rendered_jobs = []
+LOCAL_RENDER_PROGRESS_INTERVAL = 5.0
 
 SUPPORTED_EXTENSION_MAP = {
     "png": unreal.MoviePipelineImageSequenceOutput_PNG,
@@ -24,6 +29,14 @@ SUPPORTED_EXTENSION_MAP = {
 def _queue_finish_callback(exec, success):
     unreal.log(f"Render completed. Success: {str(success)}")
 
+    global telemetry
+    if telemetry:
+        record = telemetry.finish_queue(success)
+        unreal.log(
+            f"Rendered {record['frame_count']} frames in "
+            f"{record['duration']:.1f}s. Telemetry: {telemetry.path}")
+        telemetry = None
+
     # Delete our reference so we don't keep it alive.
     global executor
     global queue
@@ -38,6 +51,81 @@ def _job_finish_callback(job, success):
     # into the editor world.
     unreal.log("Individual job completed.")
 
+    if not telemetry:
+        return
+    job_data = next(
+        (data for queued_job, data in rendered_jobs if queued_job == job),
+        None
+    )
+    if job_data is None:
+        return
+    record = telemetry.record_job(job_data, success)
+    unreal.log(
+        f"{record['name']}: {record['frame_count']} frames in "
+        f"{record['duration']:.1f}s (warm-up {record['warm_up']:.1f}s, "
+        f"{record['output_bytes']} bytes)")
+
+
+class LocalRenderMonitor:
+    """Report progress of local render processes from the editor tick.
+
+    Every local render has its own executor and monitor, so renders
+    started while others are still running do not affect each other.
+
+    Args:
+        executor (render_jobs.LocalRenderExecutor): Started executor.
+        telemetry (render_telemetry.RenderTelemetry): Telemetry to record
+            the rendered jobs to.
+    """
+
+    def __init__(self, executor, telemetry):
+        self.executor = executor
+        self.telemetry = telemetry
+        self._last_report = 0.0
+        self._tick_handle = None
+
+    def start(self):
+        self._tick_handle = unreal.register_slate_post_tick_callback(
+            self._tick)
+
+    def _tick(self, delta_time):
+        if self.executor.poll():
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+            self._finish()
+            return
+
+        now = time.time()
+        if now - self._last_report < LOCAL_RENDER_PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        for progress in self.executor.get_progress():
+            unreal.log(
+                f"Render shard {progress['shard']}: "
+                f"{progress['rendered']}/{progress['expected']} frames")
+
+    def _finish(self):
+        results = self.executor.merge_results()
+        for shard, shard_result in zip(
+            self.executor.shards, results["shards"]
+        ):
+            unreal.log(
+                f"Render shard {shard_result['shard']} finished with return "
+                f"code {shard_result['returncode']}, rendered "
+                f"{shard_result['rendered']} frames. "
+                f"Log: {shard_result['log']}")
+            self.telemetry.record_process_jobs(
+                shard.jobs, shard.start_time, shard.end_time,
+                shard_result["success"])
+        if results["missing"]:
+            unreal.log_warning(
+                f"{len(results['missing'])} frames were not rendered.")
+        record = self.telemetry.finish_queue(results["success"])
+        unreal.log(
+            f"Rendered {record['frame_count']} frames in "
+            f"{record['duration']:.1f}s. Telemetry: {self.telemetry.path}")
+        unreal.log(f"Render completed. Success: {results['success']}")
+
 
 def get_render_config(
         project_name: str,
@@ -136,6 +224,225 @@ def set_output_extension_from_settings(render_format, config):
     return config
 
 
+def get_output_extension(config):
+    """Get output extension set in render config.
+
+    Args:
+        config (unreal.MoviePipelineMasterConfig): render config
+
+    Returns:
+        Optional[str]: extension of the first supported image output
+    """
+    for ext, cls in SUPPORTED_EXTENSION_MAP.items():
+        if config.find_setting_by_class(cls):
+            return ext
+    return None
+
+
+def execute_local_processes(queue, jobs, render_settings, render_dir):
+    """Render jobs in parallel headless editor processes.
+
+    Jobs are sharded by shots, each shard is saved as a queue manifest
+    and rendered by its own `UnrealEditor-Cmd` process. Progress is
+    reported from the editor tick, so the editor is not blocked. The
+    queue is emptied once the manifests are saved.
+
+    Args:
+        queue (unreal.MoviePipelineQueue): Queue containing the jobs.
+        jobs (list[tuple[unreal.MoviePipelineExecutorJob, dict]]): Queue
+            jobs with their render job data.
+        render_settings (dict): Render setup settings.
+        render_dir (str): Root directory of the renders.
+
+    Returns:
+        LocalRenderMonitor: Monitor of the started render.
+    """
+    # Headless processes load the project from disk
+    unreal.EditorLoadingAndSavingUtils.save_dirty_packages(True, True)
+
+    project_file = unreal.Paths.convert_relative_path_to_full(
+        unreal.Paths.get_project_file_path())
+    engine_dir = unreal.Paths.convert_relative_path_to_full(
+        unreal.Paths.engine_dir())
+    manifest_dir = f"{render_dir}/{render_jobs.RENDER_MANIFEST_DIR}"
+    executor = render_jobs.LocalRenderExecutor(
+        render_jobs.get_editor_cmd_path(engine_dir),
+        project_file,
+        manifest_dir
+    )
+
+    queue_jobs_by_id = {id(job_data): job for job, job_data in jobs}
+    shards = render_jobs.shard_jobs(
+        [job_data for _, job_data in jobs],
+        render_settings.get("local_processes", 1)
+    )
+    for shard in shards:
+        shard_queue = unreal.MoviePipelineQueue()
+        for job_data in shard:
+            shard_queue.duplicate_job(queue_jobs_by_id[id(job_data)])
+        _, manifest_path = (
+            unreal.MoviePipelineEditorLibrary.save_queue_to_manifest_file(
+                shard_queue))
+        manifest_text = (
+            unreal.MoviePipelineEditorLibrary
+            .convert_manifest_file_to_string(manifest_path))
+        executor.add_shard(manifest_text, shard)
+    queue.delete_all_jobs()
+
+    unreal.log(
+        f"Rendering {len(jobs)} jobs in {len(shards)} local processes.")
+    telemetry = render_telemetry.RenderTelemetry(
+        f"{manifest_dir}/{render_telemetry.TELEMETRY_FILE_NAME}")
+    telemetry.start_queue()
+    executor.start()
+    monitor = LocalRenderMonitor(executor, telemetry)
+    monitor.start()
+    return monitor
+
+
+def _set_engine_warm_up(job_config, preroll_frames):
+    if not preroll_frames:
+        return
+    aa_settings = job_config.find_or_add_setting_by_class(
+        unreal.MoviePipelineAntiAliasingSetting)
+    aa_settings.engine_warm_up_count = preroll_frames
+
+
+def restrict_jobs_to_missing_frames(queue, jobs, render_settings):
+    """Restrict rendering jobs to frames which are not rendered yet.
+
+    Frames found in the output directory are validated (size, header and
+    trailer) and complete ones are skipped. Jobs with all frames rendered
+    are removed from the queue, jobs with gaps are split into a job per
+    missing frame range.
+
+    Args:
+        queue (unreal.MoviePipelineQueue): Queue containing the jobs.
+        jobs (list[tuple[unreal.MoviePipelineExecutorJob, dict]]): Queue
+            jobs with their render job data.
+        render_settings (dict): Render setup settings.
+
+    Returns:
+        list[tuple[unreal.MoviePipelineExecutorJob, dict]]: Jobs left
+            to render.
+    """
+    preroll_frames = render_settings.get("preroll_frames", 0)
+    resumed_jobs = []
+    skipped_total = 0
+    frames_total = 0
+    for job, job_data in jobs:
+        missing_ranges = render_jobs.get_missing_frame_ranges(job_data)
+        frame_count = render_jobs.get_job_frame_count(job_data)
+        skipped = frame_count - sum(
+            end - start + 1 for start, end in missing_ranges)
+        skipped_total += skipped
+        frames_total += frame_count
+        if skipped:
+            unreal.log(
+                f"{job_data['name']} ({job_data['frame_start']}-"
+                f"{job_data['frame_end']}): skipping {skipped} of "
+                f"{frame_count} frames already rendered.")
+
+        if not missing_ranges:
+            queue.delete_job(job)
+            continue
+
+        for index, (start, end) in enumerate(missing_ranges):
+            range_job = job if index == 0 else queue.duplicate_job(job)
+            job_config = range_job.get_configuration()
+            settings = job_config.find_or_add_setting_by_class(
+                unreal.MoviePipelineOutputSetting)
+            settings.custom_start_frame = start
+            settings.custom_end_frame = end + 1
+            if start != job_data["frame_start"]:
+                range_job.job_name = f"{job_data['name']}_{start}-{end}"
+                _set_engine_warm_up(job_config, preroll_frames)
+            resumed_jobs.append(
+                (range_job, dict(job_data, frame_start=start, frame_end=end))
+            )
+
+    unreal.log(
+        f"Resuming render: skipped {skipped_total} of {frames_total} "
+        f"frames, {frames_total - skipped_total} frames left to render.")
+    return resumed_jobs
+
+
+def _create_render_job(
+        queue, inst_data, config, render_setting, frame_range, render_dir,
+        render_settings, chunked=False, preset=None):
+    """Allocate rendering job in the queue.
+
+    Args:
+        queue (unreal.MoviePipelineQueue): Queue to allocate the job in.
+        inst_data (dict): Render instance data.
+        config (unreal.MoviePipelineMasterConfig): render config
+        render_setting (dict): Sequence to render with its output.
+        frame_range (tuple[int, int]): Inclusive frame range of the job.
+        render_dir (str): Root directory of the renders.
+        render_settings (dict): Render setup settings.
+        chunked (bool): Job renders only a chunk of the sequence.
+        preset (str): Name of the render preset, stored for telemetry.
+
+    Returns:
+        tuple[unreal.MoviePipelineExecutorJob, dict]: Job and its
+            render job data.
+    """
+    job = queue.allocate_new_job(unreal.MoviePipelineExecutorJob)
+    job.sequence = unreal.SoftObjectPath(inst_data["master_sequence"])
+    job.map = unreal.SoftObjectPath(inst_data["master_level"])
+    job.author = "Ayon"
+
+    job.set_configuration(config)
+
+    # If we have a saved configuration, copy it to the job.
+    if config:
+        job.get_configuration().copy_from(config)
+
+    job_config = job.get_configuration()
+    # User data could be used to pass data to the job, that can be
+    # read in the job's OnJobFinished callback. We could,
+    # for instance, pass the AyonPublishInstance's path to the job.
+    # job.user_data = ""
+
+    output_dir = render_setting.get('output')
+    shot_name = render_setting.get('sequence').get_name()
+
+    settings = job_config.find_or_add_setting_by_class(
+        unreal.MoviePipelineOutputSetting)
+    settings.output_resolution = unreal.IntPoint(1920, 1080)
+    settings.custom_start_frame = frame_range[0]
+    settings.custom_end_frame = frame_range[1] + 1
+    settings.use_custom_playback_range = True
+    settings.file_name_format = f"{shot_name}" + ".{frame_number}"
+    settings.output_directory.path = f"{render_dir}/{output_dir}"
+
+    job_config.find_or_add_setting_by_class(
+        unreal.MoviePipelineDeferredPassBase)
+
+    render_format = render_settings.get("render_format", "png")
+
+    set_output_extension_from_settings(render_format, job_config)
+
+    if chunked:
+        job.job_name = f"{shot_name}_{frame_range[0]}-{frame_range[1]}"
+        # Chunks don't start from the beginning of the shot, so the engine
+        # has to warm up before the first rendered frame of every chunk.
+        _set_engine_warm_up(
+            job_config, render_settings.get("preroll_frames", 0))
+
+    return job, {
+        "name": shot_name,
+        "output_dir": settings.output_directory.path,
+        "ext": get_output_extension(job_config) or render_format,
+        "frame_start": frame_range[0],
+        "frame_end": frame_range[1],
+        "padding": settings.zero_pad_frame_numbers,
+        "map": inst_data["master_level"],
+        "sequence": inst_data["master_sequence"],
+        "preset": preset,
+    }
+
+
 def start_rendering():
     """
     Start the rendering process.
@@ -185,8 +492,7 @@ def start_rendering():
     # subsystem = unreal.get_editor_subsystem(
     #     unreal.MoviePipelineQueueSubsystem)
     # queue = subsystem.get_queue()
-    global queue
-    queue = unreal.MoviePipelineQueue()
+    render_queue = unreal.MoviePipelineQueue()
 
     ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
@@ -198,6 +504,8 @@ def start_rendering():
     current_level = les.get_current_level()
     current_level_name = current_level.get_outer().get_path_name()
 
+    jobs = []
+
     for i in inst_data:
         # for some reason the instance data has strings, convert them
         # back to their original types
@@ -205,7 +513,7 @@ def start_rendering():
             "render_preset"
         )
 
-        _, config = get_render_config(
+        config_path, config = get_render_config(
             project_name, render_preset, render_settings)
 
 
@@ -251,49 +559,45 @@ def start_rendering():
             )
             i["master_level"] = current_level_name
 
-        # Create the rendering jobs and add them to the queue.
+        # Create the rendering jobs and add them to the queue. Long shots
+        # are split into chunks of frames, each rendered by its own job.
+        chunk_size = render_settings.get("chunk_size", 0)
         for render_setting in render_list:
-            job = queue.allocate_new_job(unreal.MoviePipelineExecutorJob)
-            job.sequence = unreal.SoftObjectPath(i["master_sequence"])
-            job.map = unreal.SoftObjectPath(i["master_level"])
-            job.author = "Ayon"
-
-            job.set_configuration(config)
-
-            # If we have a saved configuration, copy it to the job.
-            if config:
-                job.get_configuration().copy_from(config)
-
-            job_config = job.get_configuration()
-            # User data could be used to pass data to the job, that can be
-            # read in the job's OnJobFinished callback. We could,
-            # for instance, pass the AyonPublishInstance's path to the job.
-            # job.user_data = ""
-
-            output_dir = render_setting.get('output')
-            shot_name = render_setting.get('sequence').get_name()
-
-            settings = job_config.find_or_add_setting_by_class(
-                unreal.MoviePipelineOutputSetting)
-            settings.output_resolution = unreal.IntPoint(1920, 1080)
-            settings.custom_start_frame = render_setting.get("frame_range")[0]
-            settings.custom_end_frame = render_setting.get("frame_range")[1]
-            settings.use_custom_playback_range = True
-            settings.file_name_format = f"{shot_name}" + ".{frame_number}"
-            settings.output_directory.path = f"{render_dir}/{output_dir}"
-
-            job_config.find_or_add_setting_by_class(
-                unreal.MoviePipelineDeferredPassBase)
-
-            render_format = render_settings.get("render_format",
-                                                "png")
-
-            set_output_extension_from_settings(render_format,
-                                               job_config)
+            frame_start, frame_end = render_setting.get("frame_range")
+            chunks = render_jobs.split_frame_range(
+                frame_start, frame_end - 1, chunk_size)
+            for chunk_start, chunk_end in chunks:
+                jobs.append(_create_render_job(
+                    render_queue, i, config, render_setting,
+                    (chunk_start, chunk_end),
+                    render_dir, render_settings, chunked=len(chunks) > 1,
+                    preset=render_preset or config_path
+                ))
+
+    if jobs and render_settings.get("resume_renders"):
+        jobs = restrict_jobs_to_missing_frames(
+            render_queue, jobs, render_settings)
+
+    if (
+        jobs
+        and render_settings.get("render_executor") == "local_processes"
+    ):
+        execute_local_processes(
+            render_queue, jobs, render_settings, render_dir)
+        return
 
     # If there are jobs in the queue, start the rendering process.
-    if queue.get_jobs():
+    if render_queue.get_jobs():
+        # References are kept until the executor finishes
+        global queue
         global executor
+        global telemetry
+        global rendered_jobs
+        rendered_jobs = jobs
+        queue = render_queue
+        telemetry = render_telemetry.RenderTelemetry(
+            f"{render_dir}/{render_jobs.RENDER_MANIFEST_DIR}/"
+            f"{render_telemetry.TELEMETRY_FILE_NAME}")
         executor = unreal.MoviePipelinePIEExecutor()
         preroll_frames = render_settings.get("preroll_frames", 0)
 
@@ -305,4 +609,5 @@ def start_rendering():
             _queue_finish_callback)
         executor.on_individual_job_finished_delegate.add_callable_unique(
             _job_finish_callback)  # Only available on PIE Executor
+        telemetry.start_queue()
         executor.execute(queue)
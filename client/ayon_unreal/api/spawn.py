@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Bulk spawning of actors placed by layouts."""
+import unreal
+from unreal import EditorLevelLibrary
+
+# Number of spawned actors between progress updates
+PROGRESS_STEP = 100
+
+
+def get_placement_transform(transform, rotation=None):
+    """Get transform an actor of layout element is placed with.
+
+    Args:
+        transform (unreal.Transform): Transform converted from basis.
+        rotation (Optional[tuple[float, float, float]]): Rotation of layout
+            element in euler degrees, overrides rotation of transform.
+
+    Returns:
+        unreal.Transform: Placement transform.
+    """
+    if not rotation:
+        return transform
+    rotator = unreal.Rotator(
+        roll=rotation[0], pitch=rotation[2], yaw=-rotation[1])
+    return unreal.Transform(
+        transform.translation, rotator, transform.scale3d)
+
+
+def spawn_actors(obj, transforms, label="Spawning layout actors..."):
+    """Spawn actor of an asset for every transform.
+
+    All actors are spawned in one editor transaction, so they are undone
+    together, and progress is shown in one slow task dialog.
+
+    Args:
+        obj (unreal.Object): Asset to spawn actors from.
+        transforms (list[unreal.Transform]): Placement transforms.
+        label (str): Label of transaction and progress dialog.
+
+    Returns:
+        list[unreal.Actor]: Spawned actors in order of transforms.
+    """
+    actors = []
+    origin = unreal.Vector(0.0, 0.0, 0.0)
+    with unreal.ScopedEditorTransaction(label):
+        with unreal.ScopedSlowTask(len(transforms), label) as slow_task:
+            slow_task.make_dialog(False)
+            for index, transform in enumerate(transforms):
+                if index % PROGRESS_STEP == 0:
+                    slow_task.enter_progress_frame(
+                        min(PROGRESS_STEP, len(transforms) - index))
+                actor = EditorLevelLibrary.spawn_actor_from_object(
+                    obj, origin)
+                actor.set_actor_transform(transform, False, True)
+                actors.append(actor)
+    return actors
+
+
+def spawn_instanced_actor(obj, transforms, hierarchical=True):
+    """Spawn one actor placing static mesh as instances.
+
+    Args:
+        obj (unreal.StaticMesh): Static mesh to instance.
+        transforms (list[unreal.Transform]): Transforms of instances.
+        hierarchical (bool): Use hierarchical instanced static mesh
+            component, which culls and builds LODs per cluster.
+
+    Returns:
+        tuple[unreal.Actor, unreal.InstancedStaticMeshComponent, list[int]]:
+            Spawned actor, its component and instance indexes in order
+            of transforms.
+    """
+    component_class = unreal.InstancedStaticMeshComponent
+    if hierarchical:
+        component_class = unreal.HierarchicalInstancedStaticMeshComponent
+
+    label = f"Spawning {obj.get_name()} instances..."
+    with unreal.ScopedEditorTransaction(label):
+        actor = EditorLevelLibrary.spawn_actor_from_class(
+            unreal.Actor, unreal.Vector(0.0, 0.0, 0.0))
+        actor.set_actor_label(f"{obj.get_name()}_instances")
+
+        subsystem = unreal.get_engine_subsystem(
+            unreal.SubobjectDataSubsystem)
+        root_handle = subsystem.k2_gather_subobject_data_for_instance(
+            actor)[0]
+        handle, fail_reason = subsystem.add_new_subobject(
+            unreal.AddNewSubobjectParams(
+                parent_handle=root_handle,
+                new_class=component_class
+            )
+        )
+        subobject_lib = unreal.SubobjectDataBlueprintFunctionLibrary
+        if not subobject_lib.is_handle_valid(handle):
+            raise RuntimeError(
+                f"Failed to add instanced component: {fail_reason}")
+        component = subobject_lib.get_object(subobject_lib.get_data(handle))
+        component.set_static_mesh(obj)
+        indexes = component.add_instances(transforms, True, True)
+    return actor, component, list(indexes)
+
+
+def set_instances(actor, transforms):
+    """Replace instances of actor spawned by `spawn_instanced_actor`.
+
+    Args:
+        actor (unreal.Actor): Instanced actor.
+        transforms (list[unreal.Transform]): Transforms of instances.
+    """
+    component = actor.get_component_by_class(
+        unreal.InstancedStaticMeshComponent)
+    component.clear_instances()
+    component.add_instances(transforms, False, True)
+
+
+def get_instanced_actors(actors):
+    """Get actors spawned by `spawn_instanced_actor` by their static mesh.
+
+    Args:
+        actors (Iterable[unreal.Actor]): Actors to search.
+
+    Returns:
+        dict[str, unreal.Actor]: Instanced actors by path of static mesh
+            they instance.
+    """
+    instanced_actors = {}
+    for actor in actors:
+        if actor.get_class().get_name() != "Actor":
+            continue
+        component = actor.get_component_by_class(
+            unreal.InstancedStaticMeshComponent)
+        if not component:
+            continue
+        mesh = component.get_editor_property("static_mesh")
+        if mesh:
+            instanced_actors.setdefault(mesh.get_path_name(), actor)
+    return instanced_actors
+
+
+def bind_actors(sequence, actors):
+    """Get possessable bindings of actors, add missing ones to sequence.
+
+    Args:
+        sequence (unreal.LevelSequence): Level sequence.
+        actors (list[unreal.Actor]): Actors to bind.
+
+    Returns:
+        list[unreal.MovieSceneBindingProxy]: Bindings in order of actors.
+    """
+    possessables = {
+        possessable.get_name(): possessable
+        for possessable in sequence.get_possessables()
+    }
+    bindings = []
+    for actor in actors:
+        binding = possessables.get(actor.get_name())
+        if not binding:
+            binding = sequence.add_possessable(actor)
+            possessables[actor.get_name()] = binding
+        bindings.append(binding)
+    return bindings
@@ -21,6 +21,7 @@ from ayon_core.settings import get_project_settings
 from ayon_core.pipeline import get_current_project_name
 from ayon_core.pipeline.workfile import get_workfile_template_key
 import ayon_unreal.lib as unreal_lib
+from ayon_unreal.uproject import get_project_descriptor
 from ayon_unreal.ue_workers import (
     UEProjectGenerationWorker,
     UEPluginInstallWorker
@@ -338,19 +339,15 @@ class UnrealPrelaunchHook(PreLaunchHook):
         if not uproject_path.is_file():
             raise FileNotFoundError(f"File not found: {uproject_path}")
 
+        descriptor = get_project_descriptor(uproject_path)
         try:
-            data = json.loads(uproject_path.read_text(encoding="utf-8"))
+            descriptor.set_engine_association(new_version)
 
         except json.JSONDecodeError as e:
             raise ApplicationLaunchFailed(
                 f"{self.signature} Malformed .uproject file at {uproject_path}: {e}"
             ) from e
 
-        # Set the new engine version
-        data["EngineAssociation"] = new_version
-
-        uproject_path.write_text(json.dumps(data, indent=4), encoding="utf-8")
-
         self.log.info(
             f"Engine version set to '{new_version}' for {uproject_path}"
         )
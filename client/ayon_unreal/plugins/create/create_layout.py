@@ -15,6 +15,14 @@ class CreateLayout(UnrealActorCreator):
     icon = "cubes"
     default_variants = ["Main"]
 
+    def create(self, product_name, instance_data, pre_create_data):
+        if not instance_data.get("creator_attributes"):
+            instance_data["creator_attributes"] = {}
+        instance_data["creator_attributes"]["export_binary_layout"] = (
+            pre_create_data.get("export_binary_layout", False))
+        super(CreateLayout, self).create(
+            product_name, instance_data, pre_create_data)
+
     def get_pre_create_attr_defs(self):
         defs = super(CreateLayout, self).get_pre_create_attr_defs()
         return defs + [
@@ -22,5 +30,21 @@ class CreateLayout(UnrealActorCreator):
                 "export_blender",
                 label="Export to Blender",
                 default=False
-            )
+            ),
+            self._get_export_binary_layout_def()
         ]
+
+    def get_instance_attr_defs(self):
+        return [self._get_export_binary_layout_def()]
+
+    @staticmethod
+    def _get_export_binary_layout_def():
+        return BoolDef(
+            "export_binary_layout",
+            label="Export Binary Layout",
+            tooltip=(
+                "Publish also compact binary layout with transforms"
+                " packed as float32 arrays, loadable only in Unreal"
+            ),
+            default=False
+        )
@@ -7,7 +7,11 @@ from ayon_core.lib import EnumDef
 from ayon_core.pipeline import AYON_CONTAINER_ID
 from ayon_unreal.api import plugin
 from ayon_unreal.api import pipeline as unreal_pipeline
-from ayon_core.settings import get_current_project_settings
+from ayon_unreal.api.import_profiles import (
+    create_import_task,
+    get_abc_sampling_settings,
+    get_options_template
+)
 import unreal  # noqa
 
 
@@ -27,6 +31,7 @@ class AnimationAlembicLoader(plugin.Loader):
     loaded_asset_dir = "{folder[path]}/{product[name]}_{version[version]}"
     loaded_asset_name = "{folder[name]}_{product[name]}_{version[version]}_{representation[name]}"      # noqa
     show_dialog = False
+    abc_custom_preset = {}
 
     @classmethod
     def apply_settings(cls, project_settings):
@@ -34,6 +39,7 @@ class AnimationAlembicLoader(plugin.Loader):
         # Apply import settings
         unreal_settings = project_settings["unreal"]["import_settings"]
         cls.abc_conversion_preset = unreal_settings["abc_conversion_preset"]
+        cls.abc_custom_preset = unreal_settings["custom"]
         cls.loaded_asset_dir = unreal_settings["loaded_asset_dir"]
         cls.loaded_asset_name = unreal_settings["loaded_asset_name"]
         cls.show_dialog = unreal_settings["show_dialog"]
@@ -53,71 +59,28 @@ class AnimationAlembicLoader(plugin.Loader):
             )
         ]
 
-    def get_task(self, filename, asset_dir, asset_name, replace, loaded_options=None):
-        task = unreal.AssetImportTask()
-        options = unreal.AbcImportSettings()
-        sm_settings = unreal.AbcStaticMeshSettings()
-        conversion_settings = unreal.AbcConversionSettings()
-        abc_conversion_preset = loaded_options.get("abc_conversion_preset")
-        if abc_conversion_preset == "maya":
-            if unreal_pipeline.UNREAL_VERSION.major >= 5 and (
-                unreal_pipeline.UNREAL_VERSION.minor >= 4):
-                    conversion_settings = unreal.AbcConversionSettings(
-                        preset= unreal.AbcConversionPreset.MAYA)
-            else:
-                conversion_settings = unreal.AbcConversionSettings(
-                    preset=unreal.AbcConversionPreset.CUSTOM,
-                    flip_u=False, flip_v=True,
-                    rotation=[90.0, 0.0, 0.0],
-                    scale=[1.0, -1.0, 1.0])
-        elif abc_conversion_preset == "3dsmax":
-            if unreal_pipeline.UNREAL_VERSION.major >= 5:
-                    conversion_settings = unreal.AbcConversionSettings(
-                        preset=unreal.AbcConversionPreset.MAX)
-            else:
-                conversion_settings = unreal.AbcConversionSettings(
-                    preset=unreal.AbcConversionPreset.CUSTOM,
-                    flip_u=False, flip_v=True,
-                    rotation=[0.0, 0.0, 0.0],
-                    scale=[1.0, -1.0, 1.0])
-        else:
-            data = get_current_project_settings()
-            preset = (
-                data["unreal"]["import_settings"]["custom"]
-            )
-            conversion_settings = unreal.AbcConversionSettings(
-                preset=unreal.AbcConversionPreset.CUSTOM,
-                flip_u=preset["flip_u"],
-                flip_v=preset["flip_v"],
-                rotation=[
-                    preset["rot_x"],
-                    preset["rot_y"],
-                    preset["rot_z"]
-                ],
-                scale=[
-                    preset["scl_x"],
-                    preset["scl_y"],
-                    preset["scl_z"]
-                ]
+    def get_task(
+        self, filename, asset_dir, asset_name, replace, loaded_options=None
+    ):
+        loaded_options = loaded_options or {}
+        # Conversion falls back to the custom preset of project settings
+        template = get_options_template(
+            "abc_animation",
+            conversion_preset=(
+                loaded_options.get("abc_conversion_preset") or "custom"),
+            custom_preset=self.abc_custom_preset
+        )
+        options = template.create({
+            "sampling_settings": get_abc_sampling_settings(
+                loaded_options.get("frameStart"),
+                loaded_options.get("frameEnd")
             )
-
-        options.sampling_settings.frame_start = loaded_options.get("frameStart")
-        options.sampling_settings.frame_end = loaded_options.get("frameEnd")
-        task.set_editor_property('filename', filename)
-        task.set_editor_property('destination_path', asset_dir)
-        task.set_editor_property('destination_name', asset_name)
-        task.set_editor_property('replace_existing', replace)
-        task.set_editor_property('automated', not self.show_dialog)
-        task.set_editor_property('save', True)
-
-        options.set_editor_property(
-            'import_type', unreal.AlembicImportType.SKELETAL)
-
-        options.static_mesh_settings = sm_settings
-        options.conversion_settings = conversion_settings
-        task.options = options
-
-        return task
+        })
+        return create_import_task(
+            filename, asset_dir, asset_name, replace,
+            automated=not self.show_dialog,
+            options=options
+        )
 
     def import_and_containerize(
         self, filepath, asset_dir, asset_name, container_name, loaded_options
@@ -216,6 +179,9 @@ class AnimationAlembicLoader(plugin.Loader):
         Returns:
             list(str): list of container content
         """
+        cached_content = self.get_cached_import(context, options)
+        if cached_content is not None:
+            return cached_content
 
         # Create directory for asset and ayon container
         folder_entity = context["folder"]
@@ -270,6 +236,10 @@ class AnimationAlembicLoader(plugin.Loader):
             project_name=context["project"]["name"],
             layout=should_use_layout
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
+        self.cache_import(
+            context, asset_dir, container_name, options)
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
@@ -281,6 +251,9 @@ class AnimationAlembicLoader(plugin.Loader):
         return asset_content
 
     def update(self, container, context):
+        if self.update_unchanged_source(container, context):
+            return
+
         folder_path = context["folder"]["path"]
         product_base_type = context["product"]["productBaseType"]
         repre_entity = context["representation"]
@@ -336,6 +309,8 @@ class AnimationAlembicLoader(plugin.Loader):
             project_name=context["project"]["name"],
             layout=should_use_layout
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", source_path)
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
         )
@@ -344,6 +319,4 @@ class AnimationAlembicLoader(plugin.Loader):
             unreal.EditorAssetLibrary.save_asset(a)
 
     def remove(self, container):
-        path = container["namespace"]
-        if unreal.EditorAssetLibrary.does_directory_exist(path):
-            unreal.EditorAssetLibrary.delete_directory(path)
+        self.remove_container_directory(container)
@@ -13,6 +13,10 @@ from ayon_core.pipeline.context_tools import get_current_folder_entity
 from ayon_core.pipeline.load import LoadError
 from ayon_unreal.api import pipeline as unreal_pipeline
 from ayon_unreal.api import plugin
+from ayon_unreal.api.import_profiles import (
+    create_import_task,
+    get_options_template
+)
 from unreal import (EditorAssetLibrary, MovieSceneSkeletalAnimationSection,
                     MovieSceneSkeletalAnimationTrack)
 
@@ -81,61 +85,27 @@ class AnimationFBXLoader(plugin.Loader):
         skeleton, automated, replace=False,
         loaded_options=None
     ):
-        task = unreal.AssetImportTask()
-        task.options = unreal.FbxImportUI()
-
         folder_entity = get_current_folder_entity(fields=["attrib.fps"])
 
-        task.set_editor_property('filename', path)
-        task.set_editor_property('destination_path', asset_dir)
-        task.set_editor_property('destination_name', asset_name)
-        task.set_editor_property('replace_existing', replace)
-        task.set_editor_property('automated', not cls.show_dialog)
-        task.set_editor_property('save', False)
-
-        # set import options here
-        task.options.set_editor_property(
-            'automated_import_should_detect_type', True)
-        task.options.set_editor_property(
-            'original_import_type', unreal.FBXImportType.FBXIT_SKELETAL_MESH)
-        task.options.set_editor_property(
-            'mesh_type_to_import', unreal.FBXImportType.FBXIT_ANIMATION)
-        task.options.set_editor_property('import_mesh', False)
-        task.options.set_editor_property('import_animations', True)
-        task.options.set_editor_property('override_full_name', True)
-        task.options.set_editor_property('skeleton', skeleton)
-        task.options.anim_sequence_import_data.set_editor_property(
-            'animation_length',
-            unreal.FBXAnimationLengthImportType.FBXALIT_SET_RANGE
+        options = get_options_template("fbx_animation").create(
+            {"skeleton": skeleton},
+            {
+                "anim_sequence_import_data": {
+                    "frame_import_range": unreal.Int32Interval(
+                        min=loaded_options.get("frameStart"),
+                        max=loaded_options.get("frameEnd")
+                    ),
+                    "custom_sample_rate": (
+                        folder_entity.get("attrib", {}).get("fps")),
+                },
+            }
+        )
+        task = create_import_task(
+            path, asset_dir, asset_name, replace,
+            automated=not cls.show_dialog,
+            save=False,
+            options=options
         )
-        task.options.anim_sequence_import_data.set_editor_property(
-            'frame_import_range', unreal.Int32Interval(
-                min=loaded_options.get("frameStart"),
-                max=loaded_options.get("frameEnd")
-        ))
-        task.options.anim_sequence_import_data.set_editor_property(
-            'import_meshes_in_bone_hierarchy', False)
-        task.options.anim_sequence_import_data.set_editor_property(
-            'use_default_sample_rate', False)
-        task.options.anim_sequence_import_data.set_editor_property(
-            'custom_sample_rate', folder_entity.get("attrib", {}).get("fps"))
-        task.options.anim_sequence_import_data.set_editor_property(
-            'import_custom_attribute', True)
-        task.options.anim_sequence_import_data.set_editor_property(
-            'import_bone_tracks', True)
-        task.options.anim_sequence_import_data.set_editor_property(
-            'remove_redundant_keys', False)
-        task.options.anim_sequence_import_data.set_editor_property(
-            'convert_scene', True)
-        task.options.anim_sequence_import_data.set_editor_property(
-            'force_front_x_axis', False)
-        if unreal_pipeline.UNREAL_VERSION.major == 5 and (
-            unreal_pipeline.UNREAL_VERSION.minor <=4
-            ):
-                task.options.anim_sequence_import_data.set_editor_property(
-                    'import_rotation',
-                    unreal.Rotator(roll=90.0, pitch=0.0, yaw=0.0)
-                )
 
         unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
 
@@ -17,7 +17,8 @@ from ayon_unreal.api.pipeline import (
     AYON_ROOT_DIR,
     get_top_hierarchy_folder,
     generate_hierarchy_path,
-    remove_map_and_sequence
+    remove_map_and_sequence,
+    retime_sequence_keys
 )
 
 
@@ -151,6 +152,10 @@ class CameraLoader(plugin.Loader):
             clip_in, clip_out,
             [level])
 
+        # Camera is imported into the shot level
+        EditorLevelLibrary.save_all_dirty_levels()
+        EditorLevelLibrary.load_level(level)
+
         settings = unreal.MovieSceneUserImportFBXSettings()
         settings.set_editor_property('reduce_keys', False)
 
@@ -171,20 +176,9 @@ class CameraLoader(plugin.Loader):
         # Set range of all sections
         # Changing the range of the section is not enough. We need to change
         # the frame of all the keys in the section.
-        for possessable in cam_seq.get_possessables():
-            for tracks in possessable.get_tracks():
-                for section in tracks.get_sections():
-                    section.set_range(clip_in, clip_out + 1)
-                    for channel in section.get_all_channels():
-                        for key in channel.get_keys():
-                            old_time = key.get_time().get_editor_property(
-                                'frame_number')
-                            old_time_value = old_time.get_editor_property(
-                                'value')
-                            new_time = old_time_value + (
-                                clip_in - folder_attributes.get('frameStart')
-                            )
-                            key.set_time(unreal.FrameNumber(value=new_time))
+        retime_sequence_keys(
+            cam_seq, clip_in, clip_out + 1,
+            clip_in - folder_attributes.get('frameStart'))
         return master_level
 
     def load(self, context, name, namespace, options):
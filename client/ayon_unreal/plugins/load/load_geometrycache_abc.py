@@ -8,10 +8,13 @@ from ayon_unreal.api.pipeline import (
     create_container,
     imprint as _imprint,
     format_asset_directory,
-    UNREAL_VERSION,
     get_dir_from_existing_asset
 )
-from ayon_core.settings import get_current_project_settings
+from ayon_unreal.api.import_profiles import (
+    create_import_task,
+    get_abc_sampling_settings,
+    get_options_template
+)
 
 import unreal  # noqa
 
@@ -31,6 +34,7 @@ class PointCacheAlembicLoader(plugin.Loader):
     loaded_asset_dir = "{folder[path]}/{product[name]}_{version[version]}"
     loaded_asset_name = "{folder[name]}_{product[name]}_{version[version]}_{representation[name]}"      # noqa
     show_dialog = False
+    abc_custom_preset = {}
 
     @classmethod
     def apply_settings(cls, project_settings):
@@ -38,6 +42,7 @@ class PointCacheAlembicLoader(plugin.Loader):
         # Apply import settings
         unreal_settings = project_settings["unreal"]["import_settings"]
         cls.abc_conversion_preset = unreal_settings["abc_conversion_preset"]
+        cls.abc_custom_preset = unreal_settings["custom"]
         cls.loaded_asset_dir = unreal_settings["loaded_asset_dir"]
         cls.loaded_asset_name = unreal_settings["loaded_asset_name"]
         cls.show_dialog = unreal_settings["show_dialog"]
@@ -57,84 +62,28 @@ class PointCacheAlembicLoader(plugin.Loader):
             )
         ]
 
-    @staticmethod
+    @classmethod
     def get_task(
-        filename, asset_dir, asset_name, replace,
+        cls, filename, asset_dir, asset_name, replace,
         frame_start=None, frame_end=None, loaded_options=None
     ):
-        task = unreal.AssetImportTask()
-        options = unreal.AbcImportSettings()
-        gc_settings = unreal.AbcGeometryCacheSettings()
-        conversion_settings = unreal.AbcConversionSettings()
-        sampling_settings = unreal.AbcSamplingSettings()
-        abc_conversion_preset = loaded_options.get("abc_conversion_preset")
-        if abc_conversion_preset == "maya":
-            if UNREAL_VERSION.major >= 5 and UNREAL_VERSION.minor >= 4:
-                conversion_settings = unreal.AbcConversionSettings(
-                    preset=unreal.AbcConversionPreset.MAYA)
-            else:
-                conversion_settings = unreal.AbcConversionSettings(
-                    preset=unreal.AbcConversionPreset.CUSTOM,
-                    flip_u=False, flip_v=True,
-                    rotation=[90.0, 0.0, 0.0],
-                    scale=[1.0, -1.0, 1.0])
-        elif abc_conversion_preset == "3dsmax":
-            if UNREAL_VERSION.major >= 5:
-                conversion_settings = unreal.AbcConversionSettings(
-                    preset=unreal.AbcConversionPreset.MAX)
-            else:
-                conversion_settings = unreal.AbcConversionSettings(
-                    preset=unreal.AbcConversionPreset.CUSTOM,
-                    flip_u=False, flip_v=True,
-                    rotation=[0.0, 0.0, 0.0],
-                    scale=[1.0, -1.0, 1.0])
-        else:
-            data = get_current_project_settings()
-            preset = (
-                data["unreal"]["import_settings"]["custom"]
-            )
-            conversion_settings = unreal.AbcConversionSettings(
-                preset=unreal.AbcConversionPreset.CUSTOM,
-                flip_u=preset["flip_u"],
-                flip_v=preset["flip_v"],
-                rotation=[
-                    preset["rot_x"],
-                    preset["rot_y"],
-                    preset["rot_z"]
-                ],
-                scale=[
-                    preset["scl_x"],
-                    preset["scl_y"],
-                    preset["scl_z"]
-                ]
-            )
-
-        task.set_editor_property('filename', filename)
-        task.set_editor_property('destination_path', asset_dir)
-        task.set_editor_property('destination_name', asset_name)
-        task.set_editor_property('replace_existing', replace)
-        task.set_editor_property(
-            'automated', not loaded_options.get("show_dialog"))
-        task.set_editor_property('save', True)
-
-        options.set_editor_property(
-            'import_type', unreal.AlembicImportType.GEOMETRY_CACHE)
-        options.sampling_settings.frame_start = frame_start
-        options.sampling_settings.frame_end = frame_end
-
-        gc_settings.set_editor_property('flatten_tracks', False)
-
-        if frame_start is not None:
-            sampling_settings.set_editor_property('frame_start', frame_start)
-        if frame_end is not None:
-            sampling_settings.set_editor_property('frame_end', frame_end)
-
-        options.geometry_cache_settings = gc_settings
-        options.conversion_settings = conversion_settings
-        options.sampling_settings = sampling_settings
-        task.options = options
-
-        return task
+        loaded_options = loaded_options or {}
+        # Conversion falls back to the custom preset of project settings
+        template = get_options_template(
+            "abc_geometry_cache",
+            conversion_preset=(
+                loaded_options.get("abc_conversion_preset") or "custom"),
+            custom_preset=cls.abc_custom_preset
+        )
+        options = template.create({
+            "sampling_settings": get_abc_sampling_settings(
+                frame_start, frame_end)
+        })
+        return create_import_task(
+            filename, asset_dir, asset_name, replace,
+            automated=not loaded_options.get("show_dialog"),
+            options=options
+        )
 
     def import_and_containerize(
         self, filepath, asset_dir, asset_name, container_name,
@@ -228,6 +177,10 @@ class PointCacheAlembicLoader(plugin.Loader):
         Returns:
             list(str): list of container content
         """
+        cached_content = self.get_cached_import(context, options)
+        if cached_content is not None:
+            return cached_content
+
         # Create directory for asset and Ayon container
         folder_entity = context["folder"]
         folder_path = folder_entity["path"]
@@ -283,6 +236,10 @@ class PointCacheAlembicLoader(plugin.Loader):
             project_name=context["project"]["name"],
             layout=should_use_layout,
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
+        self.cache_import(
+            context, asset_dir, container_name, options)
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
         )
@@ -293,6 +250,9 @@ class PointCacheAlembicLoader(plugin.Loader):
         return asset_content
 
     def update(self, container, context):
+        if self.update_unchanged_source(container, context):
+            return
+
         # Create directory for folder and Ayon container
         folder_path = context["folder"]["path"]
         product_base_type = context["product"]["productBaseType"]
@@ -340,6 +300,8 @@ class PointCacheAlembicLoader(plugin.Loader):
             project_name=context["project"]["name"],
             layout=should_use_layout,
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=False
@@ -349,6 +311,4 @@ class PointCacheAlembicLoader(plugin.Loader):
             unreal.EditorAssetLibrary.save_asset(a)
 
     def remove(self, container):
-        path = container["namespace"]
-        if unreal.EditorAssetLibrary.does_directory_exist(path):
-            unreal.EditorAssetLibrary.delete_directory(path)
+        self.remove_container_directory(container)
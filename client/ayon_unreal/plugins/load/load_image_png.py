@@ -147,6 +147,10 @@ class TexturePNGLoader(plugin.Loader):
         Returns:
             list(str): list of container content
         """
+        cached_content = self.get_cached_import(context, options)
+        if cached_content is not None:
+            return cached_content
+
         # Create directory for asset and Ayon container
         folder_path = context["folder"]["path"]
         suffix = "_CON"
@@ -172,6 +176,10 @@ class TexturePNGLoader(plugin.Loader):
             product_base_type=context["product"]["productBaseType"],
             project_name=context["project"]["name"],
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
+        self.cache_import(
+            context, asset_dir, container_name, options)
 
         asset_contents = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
@@ -182,6 +190,9 @@ class TexturePNGLoader(plugin.Loader):
         return asset_contents
 
     def update(self, container, context):
+        if self.update_unchanged_source(container, context):
+            return
+
         folder_path = context["folder"]["path"]
         product_base_type = context["product"]["productBaseType"]
         repre_entity = context["representation"]
@@ -210,6 +221,8 @@ class TexturePNGLoader(plugin.Loader):
             product_base_type=product_base_type,
             project_name=context["project"]["name"],
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
 
         asset_contents = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=False
@@ -218,6 +231,4 @@ class TexturePNGLoader(plugin.Loader):
             unreal.EditorAssetLibrary.save_asset(unreal_asset)
 
     def remove(self, container):
-        path = container["namespace"]
-        if unreal.EditorAssetLibrary.does_directory_exist(path):
-            unreal.EditorAssetLibrary.delete_directory(path)
+        self.remove_container_directory(container)
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Loader for layouts."""
+import os
+import collections
 import json
 from pathlib import Path
 import unreal
@@ -10,7 +12,10 @@ from unreal import (
 )
 import ayon_api
 
-from ayon_core.pipeline import get_current_project_name
+from ayon_core.pipeline import (
+    get_current_project_name,
+    get_representation_path,
+)
 from ayon_core.settings import get_current_project_settings
 from ayon_unreal.api import plugin
 from ayon_unreal.api.pipeline import (
@@ -22,13 +27,20 @@ from ayon_unreal.api.pipeline import (
     get_top_hierarchy_folder,
     generate_hierarchy_path,
     update_container,
+    imprint,
     remove_map_and_sequence,
     get_tracks
 )
 from ayon_unreal.api.lib import (
     import_animation
 )
-from ayon_core.lib import EnumDef
+from ayon_unreal.api.layout import (
+    diff_layout_elements,
+    get_element_keys,
+    iter_layout_elements,
+)
+from ayon_unreal.api.spawn import bind_actors, set_instances
+from ayon_core.lib import BoolDef, EnumDef
 
 
 class LayoutLoader(plugin.LayoutLoader):
@@ -54,6 +66,9 @@ class LayoutLoader(plugin.LayoutLoader):
         cls.loaded_layout_dir = import_settings["loaded_layout_dir"]
         cls.loaded_layout_name = import_settings["loaded_layout_name"]
         cls.remove_loaded_assets = import_settings["remove_loaded_assets"]
+        cls.instanced_mesh_threshold = (
+            import_settings["instanced_mesh_threshold"]
+        )
 
     @classmethod
     def get_options(cls, contexts):
@@ -71,62 +86,120 @@ class LayoutLoader(plugin.LayoutLoader):
                     default=cls.folder_representation_type
                 )
             )
+        defs.append(
+            BoolDef(
+                "instanced_meshes",
+                label="Load static meshes as instances",
+                tooltip=(
+                    "Placements of each static mesh are loaded as instances"
+                    " of one Hierarchical Instanced Static Mesh actor"
+                ),
+                default=False
+            )
+        )
         return defs
 
     def _process_family(
-        self, assets, class_name, transform, basis, sequence,
-        rotation=None, unreal_import=False
+        self, assets, class_name, transforms, sequence,
+        instanced_meshes=False, count=None
     ):
+        """Spawn actors of loaded assets for placements.
+
+        Args:
+            assets (list[str]): Paths of loaded assets.
+            class_name (str): Class of assets to spawn actors from.
+            transforms (list[unreal.Transform]): Placement transforms.
+            sequence (unreal.LevelSequence): Sequence to bind actors to.
+            instanced_meshes (bool): Spawn static meshes as instances.
+            count (int, optional): Number of all placements of the assets
+                in the layout. Defaults to number of transforms.
+
+        Returns:
+            tuple[list[list[unreal.Actor]], list[list], list[str]]: Actors
+                and bindings of every placement, and names of actors
+                placing all the transforms as instances.
+        """
+        if not transforms:
+            return [], [], []
+        if count is None:
+            count = len(transforms)
         ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
-        actors = []
-        bindings = []
+        actors = [[] for _ in transforms]
+        bindings = [[] for _ in transforms]
+        instanced_actors = []
 
         for asset in assets:
             obj = ar.get_asset_by_object_path(asset).get_asset()
-            if obj.get_class().get_name() == class_name:
-                t = self._transform_from_basis(
-                    transform, basis, unreal_import=unreal_import)
-                actor = EditorLevelLibrary.spawn_actor_from_object(
-                    obj, t.translation
-                )
-                actor_rotation = t.rotation.rotator()
-                if rotation:
-                    actor_rotation = unreal.Rotator(
-                        roll=rotation["x"], pitch=rotation["z"],
-                        yaw=-rotation["y"])
-                actor.set_actor_rotation(actor_rotation, False)
-                actor.set_actor_scale3d(t.scale3d)
-
-                if class_name == 'SkeletalMesh':
+            if obj.get_class().get_name() != class_name:
+                continue
+
+            spawned = self._spawn_placements(
+                obj, transforms, instanced_meshes, count)
+            if spawned and self._is_instanced(obj, count, instanced_meshes):
+                instanced_actors.append(spawned[0].get_name())
+            if class_name == 'SkeletalMesh':
+                for actor in spawned:
                     skm_comp = actor.get_editor_property(
                         'skeletal_mesh_component')
                     skm_comp.set_bounds_scale(10.0)
 
-                actors.append(actor)
+            for placement_actors, actor in zip(actors, spawned):
+                placement_actors.append(actor)
 
-                if sequence:
-                    binding = None
-                    for p in sequence.get_possessables():
-                        if p.get_name() == actor.get_name():
-                            binding = p
-                            break
+            if sequence:
+                spawned_bindings = bind_actors(sequence, spawned)
+                for placement_bindings, binding in zip(
+                    bindings, spawned_bindings
+                ):
+                    placement_bindings.append(binding)
 
-                    if not binding:
-                        binding = sequence.add_possessable(actor)
-
-                    bindings.append(binding)
-
-        return actors, bindings
+        return actors, bindings, instanced_actors
 
     def _process(self, lib_path, project_name, asset_dir, sequence,
                  repr_loaded=None, loaded_extension=None,
-                 force_loaded=False):
-        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+                 force_loaded=False, instanced_meshes=False,
+                 instanced_placements=None, placements=None, keys=None):
+        """Load assets of layout and spawn actors of its placements.
+
+        Args:
+            lib_path (str): Path to layout file.
+            project_name (str): Project name.
+            asset_dir (str): Asset directory of the layout.
+            sequence (unreal.LevelSequence): Sequence to bind actors to.
+            repr_loaded (list[str], optional): Ids of already loaded
+                representations.
+            loaded_extension (str, optional): Representation name to load
+                assets by.
+            force_loaded (bool): Load assets by `loaded_extension`.
+            instanced_meshes (bool): Spawn all static meshes as instances,
+                not only those placed more times than
+                `instanced_mesh_threshold`.
+            instanced_placements (dict, optional): Filled with keys of
+                elements by name of actor placing them as instances.
+            placements (dict, optional): Filled with names of actors by
+                key of element they place.
+            keys (set[str], optional): Spawn actors only for elements with
+                these keys. Assets of all elements are loaded.
 
-        with open(lib_path, "r") as fp:
-            data = json.load(fp)
+        Returns:
+            list[str]: Paths of loaded asset containers.
+        """
+        ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
+        # Layout elements are streamed into compact records, elements
+        # placing the same version are processed together
+        elements = list(iter_layout_elements(lib_path))
+        element_keys = get_element_keys(elements)
+        elements_by_version_id = collections.defaultdict(list)
+        for element in elements:
+            if element.version:
+                elements_by_version_id[element.version].append(element)
+        # Basis conversion of all spawned placements is done at once
+        transforms = self._get_placement_transforms([
+            element for element in elements
+            if keys is None or element_keys[element] in keys
+        ])
 
         if not repr_loaded:
             repr_loaded = []
@@ -140,20 +213,21 @@ class LayoutLoader(plugin.LayoutLoader):
         loaded_assets = []
 
         repre_entities_by_version_id = self._get_repre_entities_by_version_id(
-            project_name, data, loaded_extension, force_loaded=force_loaded
+            project_name, elements, loaded_extension,
+            force_loaded=force_loaded
         )
-        for element in data:
+        for element in elements:
             repre_id = None
             repr_format = None
-            if element.get('representation'):
-                version_id = element.get("version")
+            if element.representation:
+                version_id = element.version
                 repre_entities = repre_entities_by_version_id[version_id]
                 if not repre_entities:
                     self.log.error(
                         f"No valid representation found for version"
                         f" {version_id}")
                     continue
-                extension = element.get("extension", "ma")
+                extension = element.extension
                 repre_entity = None
                 if not force_loaded or loaded_extension == "json":
                     repre_entity = next((repre_entity for repre_entity in repre_entities
@@ -170,21 +244,19 @@ class LayoutLoader(plugin.LayoutLoader):
             # If reference is None, this element is skipped, as it cannot be
             # imported in Unreal
             if not repr_format:
-                self.log.warning(f"Representation name not defined for element: {element}")
+                self.log.warning(
+                    "Representation name not defined for element:"
+                    f" {element.instance_name}")
                 continue
 
-            instance_name = element.get('instance_name')
+            instance_name = element.instance_name
 
             skeleton = None
 
             if repre_id not in repr_loaded:
                 repr_loaded.append(repre_id)
 
-                product_base_type = (
-                    element.get("product_base_type")
-                    or element.get("product_type")
-                    or element.get("family")
-                )
+                product_base_type = element.product_base_type
 
                 assets = self._load_assets(
                     instance_name, repre_id, product_base_type, repr_format
@@ -201,44 +273,66 @@ class LayoutLoader(plugin.LayoutLoader):
                     if container is not None:
                         loaded_assets.append(container.get_path_name())
 
+                version_elements = elements_by_version_id.get(
+                    element.version, [])
                 instances = [
-                    item for item in data
-                    if ((item.get('version') and
-                        item.get('version') == element.get('version'))
-                        )]
-
-                for instance in instances:
-                    transform = instance.get('transform_matrix')
-                    rotation = instance.get('rotation', {})
-                    basis = instance.get('basis')
-                    inst = instance.get('instance_name')
-                    unreal_import = (
-                        True if "unreal" in instance.get("host", []) else False
+                    instance
+                    for instance in version_elements
+                    if instance in transforms
+                ]
+                # Instancing is decided by all placements of the version
+                # in the layout, also when only added ones are spawned
+                placement_count = sum(
+                    1 for instance in version_elements
+                    if instance.transform_matrix is not None
+                )
+                instance_transforms = [
+                    transforms[instance] for instance in instances
+                ]
+
+                actors = []
+                instanced_actors = []
+                if product_base_type in ['model', 'staticMesh']:
+                    actors, _, instanced_actors = self._process_family(
+                        assets, 'StaticMesh', instance_transforms, sequence,
+                        instanced_meshes=instanced_meshes,
+                        count=placement_count
                     )
-
-                    actors = []
-
-                    if product_base_type in ['model', 'staticMesh']:
-                        actors, _ = self._process_family(
-                            assets, 'StaticMesh', transform, basis,
-                            sequence, rotation, unreal_import=unreal_import
-                        )
-                    elif product_base_type in ['rig', 'skeletalMesh']:
-                        actors, bindings = self._process_family(
-                            assets, 'SkeletalMesh', transform, basis,
-                            sequence, rotation, unreal_import=unreal_import
-                        )
-                        actors_dict[inst] = actors
-                        bindings_dict[inst] = bindings
+                    if instanced_placements is not None:
+                        for actor_name in instanced_actors:
+                            instanced_placements[actor_name] = [
+                                element_keys[instance]
+                                for instance in instances
+                            ]
+                elif product_base_type in ['rig', 'skeletalMesh']:
+                    actors, bindings, _ = self._process_family(
+                        assets, 'SkeletalMesh', instance_transforms,
+                        sequence
+                    )
+                    for instance, inst_actors, inst_bindings in zip(
+                        instances, actors, bindings
+                    ):
+                        actors_dict[instance.instance_name] = inst_actors
+                        bindings_dict[instance.instance_name] = inst_bindings
+
+                if placements is not None and not instanced_actors:
+                    for instance, inst_actors in zip(instances, actors):
+                        placements[element_keys[instance]] = [
+                            actor.get_name() for actor in inst_actors
+                        ]
 
                 if skeleton:
                     skeleton_dict[repre_id] = skeleton
             else:
                 skeleton = skeleton_dict.get(repre_id)
 
-            animation_file = element.get('animation')
+            animation_file = element.animation
 
-            if animation_file and skeleton:
+            if (
+                animation_file
+                and skeleton
+                and (keys is None or element_keys[element] in keys)
+            ):
                 import_animation(
                     asset_dir, path, instance_name, skeleton, actors_dict,
                     animation_file, bindings_dict, sequence
@@ -246,6 +340,200 @@ class LayoutLoader(plugin.LayoutLoader):
 
         return loaded_assets
 
+    def _update_placements(
+        self, container, project_name, asset_dir, sequence, source_path,
+        placements, instanced_placements, instanced_meshes=False
+    ):
+        """Update only placements changed since the loaded layout version.
+
+        Layout loaded by the container is compared with the new layout by
+        `diff_layout_elements`. Actors of moved placements are moved,
+        actors of removed placements destroyed and only added placements
+        are spawned. Existing actors keep their sequence bindings.
+        Instanced actors get their instances set again when any of their
+        placements changed. Single actors of a static mesh instanced in
+        the new layout are replaced by instances of all its placements.
+
+        Args:
+            container (dict): Container data.
+            project_name (str): Project name.
+            asset_dir (str): Asset directory of the layout.
+            sequence (unreal.LevelSequence): Sequence of the layout.
+            source_path (str): Path to the new layout file.
+            placements (dict): Filled with names of actors by key of
+                element they place.
+            instanced_placements (dict): Filled with keys of elements by
+                name of actor placing them as instances.
+            instanced_meshes (bool): Spawn all static meshes as instances.
+
+        Returns:
+            Optional[list[str]]: Paths of loaded asset containers, None
+                when the container has no placements recorded or the
+                loaded layout file is not available.
+        """
+        # Containers without recorded instanced placements may have
+        # instanced actors which cannot be matched to their elements
+        if (
+            not container.get("placements")
+            or container.get("instanced_placements") is None
+        ):
+            return None
+        old_repre_entity = ayon_api.get_representation_by_id(
+            project_name, container["representation"])
+        if not old_repre_entity:
+            return None
+        old_path = get_representation_path(old_repre_entity)
+        if not old_path or not os.path.exists(old_path):
+            return None
+
+        placements.update(json.loads(container["placements"]))
+        instanced_placements.update(
+            json.loads(container["instanced_placements"]))
+
+        old_elements = list(iter_layout_elements(old_path))
+        new_elements = list(iter_layout_elements(source_path))
+        diff = diff_layout_elements(old_elements, new_elements)
+        old_by_key = {
+            key: element
+            for element, key in get_element_keys(old_elements).items()
+        }
+        new_by_key = {
+            key: element
+            for element, key in get_element_keys(new_elements).items()
+        }
+        actors_by_name = {
+            actor.get_name(): actor
+            for actor in EditorLevelLibrary.get_all_level_actors()
+        }
+        spawn_keys = set(diff["added"])
+
+        with unreal.ScopedEditorTransaction("Updating layout placements"):
+            for key in diff["removed"]:
+                for actor_name in placements.pop(key, []):
+                    actor = actors_by_name.get(actor_name)
+                    if actor:
+                        EditorLevelLibrary.destroy_actor(actor)
+
+            moved_keys = [key for key in diff["moved"] if key in placements]
+            transforms = self._get_placement_transforms(
+                [new_by_key[key] for key in moved_keys])
+            for key in moved_keys:
+                transform = transforms.get(new_by_key[key])
+                if transform is None:
+                    continue
+                for actor_name in placements[key]:
+                    actor = actors_by_name.get(actor_name)
+                    if actor:
+                        actor.set_actor_transform(transform, False, True)
+
+            if instanced_placements:
+                spawn_keys.difference_update(self._update_instanced_actors(
+                    instanced_placements, old_by_key, new_by_key,
+                    set(diff["moved"]), actors_by_name
+                ))
+
+            # Static mesh with added placements instanced in the new
+            # layout is spawned again as instances of all its placements
+            for version_keys in self._get_instanced_version_keys(
+                new_by_key, instanced_meshes
+            ):
+                if spawn_keys.isdisjoint(version_keys):
+                    continue
+                for key in version_keys:
+                    for actor_name in placements.pop(key, []):
+                        actor = actors_by_name.pop(actor_name, None)
+                        if actor:
+                            EditorLevelLibrary.destroy_actor(actor)
+                spawn_keys.update(version_keys)
+
+        loaded_assets = self._process(
+            source_path, project_name, asset_dir, sequence,
+            loaded_extension=self.folder_representation_type,
+            force_loaded=self.force_loaded,
+            instanced_meshes=instanced_meshes,
+            instanced_placements=instanced_placements,
+            placements=placements,
+            keys=spawn_keys
+        )
+        self.log.info(
+            f"Layout placements updated: {len(diff['unchanged'])} unchanged,"
+            f" {len(diff['moved'])} moved, {len(diff['added'])} added,"
+            f" {len(diff['removed'])} removed."
+        )
+        return loaded_assets
+
+    def _get_instanced_version_keys(self, elements_by_key, instanced_meshes):
+        """Get keys of static mesh placements spawned as instances.
+
+        Args:
+            elements_by_key (dict[str, LayoutElement]): Layout elements by
+                their key.
+            instanced_meshes (bool): All static meshes are instanced.
+
+        Returns:
+            list[list[str]]: Keys of placements of every static mesh
+                version spawned as instances.
+        """
+        keys_by_version = collections.defaultdict(list)
+        for key, element in elements_by_key.items():
+            if (
+                element.version
+                and element.product_base_type in ("model", "staticMesh")
+                and element.transform_matrix is not None
+            ):
+                keys_by_version[element.version].append(key)
+        return [
+            version_keys
+            for version_keys in keys_by_version.values()
+            if instanced_meshes or (
+                self.instanced_mesh_threshold
+                and len(version_keys) > self.instanced_mesh_threshold
+            )
+        ]
+
+    def _update_instanced_actors(
+        self, instanced_placements, old_by_key, new_by_key, moved_keys,
+        actors_by_name
+    ):
+        """Set instances of instanced actors to placements of new layout.
+
+        Instanced actor places all elements of one representation. Actor
+        without placements in the new layout is destroyed.
+
+        Returns:
+            set[str]: Keys of elements placed by existing instanced actors.
+        """
+        new_keys_by_repre_id = collections.defaultdict(list)
+        for key, element in new_by_key.items():
+            new_keys_by_repre_id[element.representation].append(key)
+
+        placed_keys = set()
+        for actor_name, actor_keys in list(instanced_placements.items()):
+            old_element = old_by_key.get(actor_keys[0]) if actor_keys else None
+            actor = actors_by_name.get(actor_name)
+            if old_element is None or actor is None:
+                instanced_placements.pop(actor_name)
+                continue
+
+            new_keys = new_keys_by_repre_id.get(old_element.representation, [])
+            placed_keys.update(new_keys)
+            if new_keys == actor_keys and moved_keys.isdisjoint(new_keys):
+                continue
+            if not new_keys:
+                EditorLevelLibrary.destroy_actor(actor)
+                instanced_placements.pop(actor_name)
+                continue
+
+            transforms = self._get_placement_transforms(
+                [new_by_key[key] for key in new_keys])
+            new_keys = [
+                key for key in new_keys if new_by_key[key] in transforms
+            ]
+            set_instances(
+                actor, [transforms[new_by_key[key]] for key in new_keys])
+            instanced_placements[actor_name] = new_keys
+        return placed_keys
+
     def load(self, context, name, namespace, options):
         """Load and containerise representation into Content Browser.
 
@@ -330,10 +618,16 @@ class LayoutLoader(plugin.LayoutLoader):
         extension = options.get(
             "folder_representation_type", self.folder_representation_type)
         path = self.filepath_from_context(context)
+        instanced_meshes = options.get("instanced_meshes", False)
+        instanced_placements = {}
+        placements = {}
         loaded_assets = self._process(
             path, project_name, asset_dir, shot,
             loaded_extension=extension,
-            force_loaded=self.force_loaded
+            force_loaded=self.force_loaded,
+            instanced_meshes=instanced_meshes,
+            instanced_placements=instanced_placements,
+            placements=placements
         )
 
         for s in sequences:
@@ -354,7 +648,10 @@ class LayoutLoader(plugin.LayoutLoader):
             asset_name,
             container_name,
             context["project"]["name"],
-            hierarchy_dir=hierarchy_dir
+            hierarchy_dir=hierarchy_dir,
+            instanced_meshes=instanced_meshes,
+            instanced_placements=instanced_placements,
+            placements=placements
         )
         save_dir = hierarchy_dir if create_sequences else asset_dir
 
@@ -420,21 +717,43 @@ class LayoutLoader(plugin.LayoutLoader):
         EditorLevelLibrary.save_all_dirty_levels()
         EditorLevelLibrary.load_level(layout_level)
 
-        # Delete all the actors in the level
-        actors = unreal.EditorLevelLibrary.get_all_level_actors()
-        for actor in actors:
-            unreal.EditorLevelLibrary.destroy_actor(actor)
-
-        if create_sequences:
-            EditorLevelLibrary.save_current_level()
         source_path = self.filepath_from_context(context)
-        loaded_assets = self._process(
-            source_path, project_name, asset_dir, sequence,
-            loaded_extension=self.folder_representation_type,
-            force_loaded=self.force_loaded
+        # Keep the layout instanced when it was loaded with instances
+        instanced_meshes = container.get("instanced_meshes") == "True"
+        instanced_placements = {}
+        placements = {}
+        loaded_assets = self._update_placements(
+            container, project_name, asset_dir, sequence, source_path,
+            placements, instanced_placements, instanced_meshes
         )
+        if loaded_assets is None:
+            # Layout cannot be updated incrementally, delete all the actors
+            # in the level and load the layout again
+            placements = {}
+            instanced_placements = {}
+            actors = unreal.EditorLevelLibrary.get_all_level_actors()
+            for actor in actors:
+                unreal.EditorLevelLibrary.destroy_actor(actor)
+
+            if create_sequences:
+                EditorLevelLibrary.save_current_level()
+            loaded_assets = self._process(
+                source_path, project_name, asset_dir, sequence,
+                loaded_extension=self.folder_representation_type,
+                force_loaded=self.force_loaded,
+                instanced_meshes=instanced_meshes,
+                instanced_placements=instanced_placements,
+                placements=placements
+            )
 
         update_container(container, project_name, repre_entity, loaded_assets=loaded_assets)
+        imprint(
+            f"{asset_dir}/{container.get('container_name')}",
+            {
+                "placements": json.dumps(placements),
+                "instanced_placements": json.dumps(instanced_placements),
+            }
+        )
 
         EditorLevelLibrary.save_current_level()
 
@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 
 import unreal
@@ -7,6 +6,12 @@ import ayon_api
 from ayon_core.pipeline.load import LoadError
 from ayon_unreal.api import plugin
 from ayon_unreal.api import pipeline as upipeline
+from ayon_unreal.api.layout import iter_layout_elements
+from ayon_unreal.api.spawn import (
+    bind_actors,
+    get_instanced_actors,
+    set_instances,
+)
 
 
 class ExistingLayoutLoader(plugin.LayoutLoader):
@@ -29,36 +34,27 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
         cls.loaded_layout_dir = import_settings["loaded_layout_dir"]
         cls.loaded_layout_name = import_settings["loaded_layout_name"]
         cls.remove_loaded_assets = import_settings["remove_loaded_assets"]
-
-    def _spawn_actor(self, obj, lasset, sequence):
-        actor = EditorLevelLibrary.spawn_actor_from_object(
-            obj, unreal.Vector(0.0, 0.0, 0.0)
-        )
-
-        transform = lasset.get('transform_matrix')
-        basis = lasset.get('basis')
-        rotation = lasset.get("rotation", {})
-        unreal_import = (
-            True if "unreal" in lasset.get("host", []) else False
+        cls.instanced_mesh_threshold = (
+            import_settings["instanced_mesh_threshold"]
         )
 
-        computed_transform = self._transform_from_basis(
-            transform, basis, unreal_import=unreal_import)
-
-        actor.set_actor_transform(computed_transform, False, True)
-        if rotation:
-            actor_rotation = unreal.Rotator(
-                roll=rotation["x"], pitch=rotation["z"],
-                yaw=-rotation["y"])
-            actor.set_actor_rotation(actor_rotation, False)
+    def _spawn_actors(self, obj, transforms, sequence):
+        actors = self._spawn_placements(obj, transforms)
         if sequence is not None:
-            sequence.add_possessable(actor)
+            bind_actors(sequence, actors)
         else:
             self.log.warning(
                 "No Level Sequence found for current level. "
-                "Skipping to add spawned actor into the sequence."
+                "Skipping to add spawned actors into the sequence."
             )
 
+    @staticmethod
+    def _add_spawn(spawns, obj, transform):
+        path = obj.get_path_name()
+        if path not in spawns:
+            spawns[path] = (obj, [])
+        spawns[path][1].append(transform)
+
     def _load_asset(
             self,
             repr_data,
@@ -80,24 +76,19 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
         ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
         actors = EditorLevelLibrary.get_all_level_actors()
-
-        with open(lib_path, "r") as fp:
-            data = json.load(fp)
-
-        elements = []
-        repre_ids = set()
-        extensions = []
-        # Get all the representations in the JSON from the database.
-        for element in data:
-            repre_id = element.get('representation')
-            extension = element.get("extension", "ma")
-            if repre_id:
-                repre_ids.add(repre_id)
-                elements.append(element)
-            if extension == "ma":
-                extensions.extend(["fbx", "abc"])
-            else:
-                extensions.append(extension)
+        # Static meshes placed as instances of one actor, they are matched
+        # by their mesh and get all its placements as instances
+        instanced_actors = get_instanced_actors(actors)
+
+        # Only elements with representation are matched, they are kept as
+        # compact records streamed from the layout file
+        elements = [
+            element for element in iter_layout_elements(lib_path)
+            if element.representation
+        ]
+        repre_ids = {element.representation for element in elements}
+        # Basis conversion of all placements is done at once
+        transforms = self._get_placement_transforms(elements)
 
         repre_entities = ayon_api.get_representations(
             project_name, representation_ids=repre_ids
@@ -109,7 +100,7 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
         layout_data = []
         version_ids = set()
         for element in elements:
-            repre_id = element.get("representation")
+            repre_id = element.representation
             repre_entity = repre_entities_by_id.get(repre_id)
             if not repre_entity:
                 raise AssertionError("Representation not found")
@@ -125,10 +116,13 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
             version_ids.add(repre_entity["versionId"])
 
         repre_entities_by_version_id = self._get_repre_entities_by_version_id(
-            project_name, data, "json"
+            project_name, elements, "json"
         )
         containers = []
         actors_matched = []
+        # Actors of placements not matched in the scene are spawned in
+        # bulk per asset after all placements are processed
+        spawns = {}
 
         for (repre_entity, lasset) in layout_data:
             # For every actor in the scene, check if it has a representation in
@@ -165,21 +159,8 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
                         container = obj
                         containers.append(container.get_path_name())
                 # Set the transform for the actor.
-                transform = lasset.get('transform_matrix')
-                basis = lasset.get('basis')
-                rotation = lasset.get("rotation", {})
-                unreal_import = (
-                    True if "unreal" in lasset.get("host", []) else False
-                )
-
-                computed_transform = self._transform_from_basis(
-                    transform, basis, unreal_import=unreal_import)
-                actor.set_actor_transform(computed_transform, False, True)
-                if rotation:
-                    actor_rotation = unreal.Rotator(
-                        roll=rotation["x"], pitch=rotation["z"],
-                        yaw=-rotation["y"])
-                    actor.set_actor_rotation(actor_rotation, False)
+                actor.set_actor_transform(
+                    transforms[lasset], False, True)
                 actors_matched.append(actor)
                 found = True
                 break
@@ -211,7 +192,7 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
 
                 for asset in assets:
                     obj = asset.get_asset()
-                    self._spawn_actor(obj, lasset, sequence)
+                    self._add_spawn(spawns, obj, transforms[lasset])
                 loaded = True
                 break
 
@@ -219,7 +200,7 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
             if loaded:
                 continue
 
-            version_id = lasset.get('version')
+            version_id = lasset.version
             repre_entities = repre_entities_by_version_id.get(version_id)
             if not repre_entities:
                 self.log.error(
@@ -227,18 +208,11 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
                     f" {version_id}")
                 continue
 
-            product_base_type = (
-                lasset.get("product_base_type")
-                or lasset.get("product_type")
-                or lasset.get("family")
-            )
-
-            extension = lasset.get("extension")
             assets = self._load_asset(
                 repre_entities,
-                lasset.get("instance_name"),
-                product_base_type,
-                extension
+                lasset.instance_name,
+                lasset.product_base_type,
+                lasset.extension
             )
             con = None
             for asset in assets:
@@ -246,11 +220,18 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
                 if obj.get_class().get_name() != "StaticMesh":
                     continue
 
-                self._spawn_actor(obj, lasset, sequence)
+                self._add_spawn(spawns, obj, transforms[lasset])
                 if obj.get_class().get_name() == "AyonAssetContainer":
                     con = obj
                     containers.append(con.get_path_name())
                 break
+        for path, (obj, obj_transforms) in spawns.items():
+            instanced_actor = instanced_actors.pop(path, None)
+            if instanced_actor:
+                set_instances(instanced_actor, obj_transforms)
+                continue
+            self._spawn_actors(obj, obj_transforms, sequence)
+
         # Check if an actor was not matched to a representation.
         # If so, remove it from the scene.
         for actor in actors:
@@ -260,6 +241,10 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
                 self.log.warning(f"Actor {actor.get_name()} not matched.")
                 if self.delete_unmatched_assets:
                     EditorLevelLibrary.destroy_actor(actor)
+        for actor in instanced_actors.values():
+            self.log.warning(f"Actor {actor.get_name()} not matched.")
+            if self.delete_unmatched_assets:
+                EditorLevelLibrary.destroy_actor(actor)
 
         return containers
 
@@ -9,10 +9,13 @@ from ayon_unreal.api.pipeline import (
     create_container,
     imprint as _imprint,
     format_asset_directory,
-    UNREAL_VERSION,
     get_dir_from_existing_asset
 )
-from ayon_core.settings import get_current_project_settings
+from ayon_unreal.api.import_profiles import (
+    create_import_task,
+    get_abc_sampling_settings,
+    get_options_template
+)
 import unreal  # noqa
 
 
@@ -31,6 +34,7 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
     loaded_asset_dir = "{folder[path]}/{product[name]}_{version[version]}"
     loaded_asset_name = "{folder[name]}_{product[name]}_{version[version]}_{representation[name]}"      # noqa
     show_dialog = False
+    abc_custom_preset = {}
 
     @classmethod
     def apply_settings(cls, project_settings):
@@ -38,6 +42,7 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
         # Apply import settings
         unreal_settings = project_settings["unreal"]["import_settings"]
         cls.abc_conversion_preset = unreal_settings["abc_conversion_preset"]
+        cls.abc_custom_preset = unreal_settings["custom"]
         cls.loaded_asset_dir = unreal_settings["loaded_asset_dir"]
         cls.loaded_asset_name = unreal_settings["loaded_asset_name"]
         cls.show_dialog = unreal_settings["show_dialog"]
@@ -68,87 +73,30 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
             )
         ]
 
-    @staticmethod
-    def get_task(filename, asset_dir, asset_name, replace, loaded_options):
-        task = unreal.AssetImportTask()
-        options = unreal.AbcImportSettings()
-        mat_settings = unreal.AbcMaterialSettings()
-        conversion_settings = unreal.AbcConversionSettings()
-
-        task.set_editor_property('filename', filename)
-        task.set_editor_property('destination_path', asset_dir)
-        task.set_editor_property('destination_name', asset_name)
-        task.set_editor_property('replace_existing', replace)
-        task.set_editor_property(
-            'automated', not loaded_options.get("show_dialog"))
-        task.set_editor_property('save', True)
-
-        options.set_editor_property(
-            'import_type', unreal.AlembicImportType.SKELETAL)
-        options.sampling_settings.frame_start = loaded_options.get("frameStart")
-        options.sampling_settings.frame_end = loaded_options.get("frameEnd")
-
-        if loaded_options.get("abc_material_settings") == "create_materials":
-            mat_settings.set_editor_property("create_materials", True)
-            mat_settings.set_editor_property("find_materials", False)
-        elif loaded_options.get("abc_material_settings") == "find_materials":
-            mat_settings.set_editor_property("create_materials", False)
-            mat_settings.set_editor_property("find_materials", True)
-        else:
-            mat_settings.set_editor_property("create_materials", False)
-            mat_settings.set_editor_property("find_materials", False)
-
+    @classmethod
+    def get_task(
+        cls, filename, asset_dir, asset_name, replace, loaded_options
+    ):
+        conversion_preset = None
         if not loaded_options.get("default_conversion"):
-            conversion_settings = None
-            abc_conversion_preset = loaded_options.get("abc_conversion_preset")
-            if abc_conversion_preset == "maya":
-                if UNREAL_VERSION.major >= 5 and UNREAL_VERSION.minor >= 4:
-                    conversion_settings = unreal.AbcConversionSettings(
-                        preset=unreal.AbcConversionPreset.MAYA)
-                else:
-                    conversion_settings = unreal.AbcConversionSettings(
-                        preset=unreal.AbcConversionPreset.CUSTOM,
-                        flip_u=False, flip_v=True,
-                        rotation=[90.0, 0.0, 0.0],
-                        scale=[1.0, -1.0, 1.0])
-            elif abc_conversion_preset == "3dsmax":
-                if UNREAL_VERSION.major >= 5:
-                    conversion_settings = unreal.AbcConversionSettings(
-                        preset=unreal.AbcConversionPreset.MAX)
-                else:
-                    conversion_settings = unreal.AbcConversionSettings(
-                        preset=unreal.AbcConversionPreset.CUSTOM,
-                        flip_u=False, flip_v=True,
-                        rotation=[0.0, 0.0, 0.0],
-                        scale=[1.0, -1.0, 1.0])
-            else:
-                data = get_current_project_settings()
-                preset = (
-                    data["unreal"]["import_settings"]["custom"]
-                )
-                conversion_settings = unreal.AbcConversionSettings(
-                    preset=unreal.AbcConversionPreset.CUSTOM,
-                    flip_u=preset["flip_u"],
-                    flip_v=preset["flip_v"],
-                    rotation=[
-                        preset["rot_x"],
-                        preset["rot_y"],
-                        preset["rot_z"]
-                    ],
-                    scale=[
-                        preset["scl_x"],
-                        preset["scl_y"],
-                        preset["scl_z"]
-                    ]
-                )
-
-            options.conversion_settings = conversion_settings
-
-            options.material_settings = mat_settings
-
-        task.options = options
-
-        return task
+            conversion_preset = loaded_options.get("abc_conversion_preset")
+        template = get_options_template(
+            "abc_skeletal_mesh",
+            conversion_preset=conversion_preset,
+            custom_preset=cls.abc_custom_preset,
+            material_settings=loaded_options.get("abc_material_settings")
+        )
+        options = template.create({
+            "sampling_settings": get_abc_sampling_settings(
+                loaded_options.get("frameStart"),
+                loaded_options.get("frameEnd")
+            )
+        })
+        return create_import_task(
+            filename, asset_dir, asset_name, replace,
+            automated=not loaded_options.get("show_dialog"),
+            options=options
+        )
 
     def import_and_containerize(
         self, filepath, asset_dir, asset_name,
@@ -239,6 +187,10 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
         Returns:
             list(str): list of container content
         """
+        cached_content = self.get_cached_import(context, options)
+        if cached_content is not None:
+            return cached_content
+
         # Create directory for asset and ayon container
         folder_entity = context["folder"]
         folder_path = folder_entity["path"]
@@ -288,6 +240,10 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
             project_name=context["project"]["name"],
             layout=should_use_layout,
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
+        self.cache_import(
+            context, asset_dir, container_name, options)
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
@@ -299,6 +255,9 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
         return asset_content
 
     def update(self, container, context):
+        if self.update_unchanged_source(container, context):
+            return
+
         folder_path = context["folder"]["path"]
         product_base_type = context["product"]["productBaseType"]
         repre_entity = context["representation"]
@@ -346,6 +305,8 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
             project_name=context["project"]["name"],
             layout=should_use_layout
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=False
@@ -355,6 +316,4 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
             unreal.EditorAssetLibrary.save_asset(a)
 
     def remove(self, container):
-        path = container["namespace"]
-        if unreal.EditorAssetLibrary.does_directory_exist(path):
-            unreal.EditorAssetLibrary.delete_directory(path)
+        self.remove_container_directory(container)
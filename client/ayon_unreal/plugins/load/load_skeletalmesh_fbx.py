@@ -10,6 +10,10 @@ from ayon_unreal.api.pipeline import (
     format_asset_directory,
     get_dir_from_existing_asset
 )
+from ayon_unreal.api.import_profiles import (
+    create_import_task,
+    get_options_template
+)
 import unreal  # noqa
 
 
@@ -38,41 +42,12 @@ class SkeletalMeshFBXLoader(plugin.Loader):
 
     @classmethod
     def get_task(cls, filename, asset_dir, asset_name, replace):
-        task = unreal.AssetImportTask()
-        options = unreal.FbxImportUI()
-
-        task.set_editor_property('filename', filename)
-        task.set_editor_property('destination_path', asset_dir)
-        task.set_editor_property('destination_name', asset_name)
-        task.set_editor_property('replace_existing', replace)
-        task.set_editor_property('automated', not cls.show_dialog)
-        task.set_editor_property('save', True)
-
-        options.set_editor_property(
-            'automated_import_should_detect_type', False)
-        options.set_editor_property('import_as_skeletal', True)
-        options.set_editor_property('import_animations', False)
-        options.set_editor_property('import_mesh', True)
-        options.set_editor_property('import_materials', False)
-        options.set_editor_property('import_textures', False)
-        options.set_editor_property('skeleton', None)
-        options.set_editor_property('create_physics_asset', False)
-
-        options.set_editor_property(
-            'mesh_type_to_import',
-            unreal.FBXImportType.FBXIT_SKELETAL_MESH)
-
-        options.skeletal_mesh_import_data.set_editor_property(
-            'import_content_type',
-            unreal.FBXImportContentType.FBXICT_ALL)
-
-        options.skeletal_mesh_import_data.set_editor_property(
-            'normal_import_method',
-            unreal.FBXNormalImportMethod.FBXNIM_IMPORT_NORMALS)
-
-        task.options = options
-
-        return task
+        template = get_options_template("fbx_skeletal_mesh")
+        return create_import_task(
+            filename, asset_dir, asset_name, replace,
+            automated=not cls.show_dialog,
+            options=template.create()
+        )
 
 
     def import_and_containerize(
@@ -158,6 +133,10 @@ class SkeletalMeshFBXLoader(plugin.Loader):
         Returns:
             list(str): list of container content
         """
+        cached_content = self.get_cached_import(context, options)
+        if cached_content is not None:
+            return cached_content
+
         # Create directory for asset and Ayon container
         folder_name = context["folder"]["name"]
         product_base_type = context["product"]["productBaseType"]
@@ -195,6 +174,10 @@ class SkeletalMeshFBXLoader(plugin.Loader):
             project_name=context["project"]["name"],
             layout=should_use_layout,
         )
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
+        self.cache_import(
+            context, asset_dir, container_name, options)
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
         )
@@ -205,6 +188,9 @@ class SkeletalMeshFBXLoader(plugin.Loader):
         return asset_content
 
     def update(self, container, context):
+        if self.update_unchanged_source(container, context):
+            return
+
         folder_path = context["folder"]["path"]
         product_base_type = context["product"]["productBaseType"]
         repre_entity = context["representation"]
@@ -243,6 +229,8 @@ class SkeletalMeshFBXLoader(plugin.Loader):
             product_base_type=product_base_type,
             project_name=context["project"]["name"],
             layout=should_use_layout)
+        self.imprint_source_file(
+            f"{asset_dir}/{container_name}", path)
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=False
@@ -252,6 +240,4 @@ class SkeletalMeshFBXLoader(plugin.Loader):
             unreal.EditorAssetLibrary.save_asset(a)
 
     def remove(self, container):
-        path = container["namespace"]
-        if unreal.EditorAssetLibrary.does_directory_exist(path):
-            unreal.EditorAssetLibrary.delete_directory(path)
+        self.remove_container_directory(container)
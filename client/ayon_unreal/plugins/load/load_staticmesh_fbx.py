@@ -10,6 +10,10 @@ from ayon_unreal.api.pipeline import (
     format_asset_directory,
     get_dir_from_existing_asset
 )
+from ayon_unreal.api.import_profiles import (
+    create_import_task,
+    get_options_template
+)
 import unreal  # noqa
 
 
@@ -44,30 +48,13 @@ class StaticMeshFBXLoader(plugin.Loader):
 
     @classmethod
     def get_task(cls, filename, asset_dir, asset_name, replace):
-        task = unreal.AssetImportTask()
-        options = unreal.FbxImportUI()
-        import_data = unreal.FbxStaticMeshImportData()
-
-        task.set_editor_property('filename', filename)
-        task.set_editor_property('destination_path', asset_dir)
-        task.set_editor_property('destination_name', asset_name)
-        task.set_editor_property('replace_existing', replace)
-        task.set_editor_property('automated', not cls.show_dialog)
-        task.set_editor_property('save', True)
-
-        # set import options here
-        options.set_editor_property(
-            'automated_import_should_detect_type', False)
-        options.set_editor_property('import_animations', False)
-
-        import_data.set_editor_property('combine_meshes', True)
-        import_data.set_editor_property('remove_degenerates', False)
-        import_data.set_editor_property('build_nanite', cls.use_nanite) #nanite
-
-        options.static_mesh_import_data = import_data
-        task.options = options
-
-        return task
+        template = get_options_template(
+            "fbx_static_mesh", use_nanite=cls.use_nanite)
+        return create_import_task(
+            filename, asset_dir, asset_name, replace,
+            automated=not cls.show_dialog,
+            options=template.create()
+        )
 
     @classmethod
     def import_and_containerize(
@@ -157,6 +144,10 @@ class StaticMeshFBXLoader(plugin.Loader):
         Returns:
             list(str): list of container content
         """
+        cached_content = self.get_cached_import(context, options)
+        if cached_content is not None:
+            return cached_content
+
         # Create directory for asset and Ayon container
         folder_path = context["folder"]["path"]
         suffix = "_CON"
@@ -193,6 +184,8 @@ class StaticMeshFBXLoader(plugin.Loader):
             project_name=context["project"]["name"],
             layout=should_use_layout
         )
+        self.cache_import(
+            context, asset_dir, container_name, options)
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
@@ -251,6 +244,4 @@ class StaticMeshFBXLoader(plugin.Loader):
             unreal.EditorAssetLibrary.save_asset(a)
 
     def remove(self, container):
-        path = container["namespace"]
-        if unreal.EditorAssetLibrary.does_directory_exist(path):
-            unreal.EditorAssetLibrary.delete_directory(path)
+        self.remove_container_directory(container)
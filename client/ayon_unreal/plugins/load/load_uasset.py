@@ -70,6 +70,9 @@ class UAssetLoader(plugin.Loader):
         Returns:
             list(str): list of container content
         """
+        cached_content = self.get_cached_import(context, options)
+        if cached_content is not None:
+            return cached_content
 
         # Create directory for asset and Ayon container
         folder_path = context["folder"]["path"]
@@ -117,6 +120,8 @@ class UAssetLoader(plugin.Loader):
         }
 
         unreal_pipeline.imprint(f"{asset_dir}/{container_name}", data)
+        self.cache_import(
+            context, asset_dir, container_name, options)
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
@@ -173,9 +178,7 @@ class UAssetLoader(plugin.Loader):
             unreal.EditorAssetLibrary.save_asset(a)
 
     def remove(self, container):
-        path = container["namespace"]
-        if unreal.EditorAssetLibrary.does_directory_exist(path):
-            unreal.EditorAssetLibrary.delete_directory(path)
+        self.remove_container_directory(container)
 
 
 class UMapLoader(UAssetLoader):
@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 """Loader for Yeti Cache."""
-import json
-
-from ayon_core.pipeline import AYON_CONTAINER_ID
+from ayon_core.pipeline import AYON_CONTAINER_ID, registered_host
 from ayon_unreal.api import plugin
 from ayon_unreal.api import pipeline as unreal_pipeline
+from ayon_unreal.api.content_hash import get_source_file_data
+from ayon_unreal.api.import_profiles import (
+    create_import_task,
+    get_options_template
+)
 import unreal  # noqa
 
 
@@ -32,19 +35,11 @@ class YetiLoader(plugin.Loader):
 
     @staticmethod
     def get_task(filename, asset_dir, asset_name, replace):
-        task = unreal.AssetImportTask()
-        options = unreal.AbcImportSettings()
-
-        task.set_editor_property('filename', filename)
-        task.set_editor_property('destination_path', asset_dir)
-        task.set_editor_property('destination_name', asset_name)
-        task.set_editor_property('replace_existing', replace)
-        task.set_editor_property('automated', True)
-        task.set_editor_property('save', True)
-
-        task.options = options
-
-        return task
+        template = get_options_template("abc_default")
+        return create_import_task(
+            filename, asset_dir, asset_name, replace,
+            options=template.create()
+        )
 
     @staticmethod
     def is_groom_module_active():
@@ -52,21 +47,11 @@ class YetiLoader(plugin.Loader):
         Check if Groom plugin is active.
 
         This is a workaround, because the Unreal python API don't have
-        any method to check if plugin is active.
+        any method to check if plugin is active. The project descriptor
+        is cached by the host and parsed again only when it changes.
         """
-        prj_file = unreal.Paths.get_project_file_path()
-
-        with open(prj_file, "r") as fp:
-            data = json.load(fp)
-
-        plugins = data.get("Plugins")
-
-        if not plugins:
-            return False
-
-        plugin_names = [p.get("Name") for p in plugins]
-
-        return "HairStrands" in plugin_names
+        descriptor = registered_host().get_project_descriptor()
+        return descriptor.is_plugin_enabled("HairStrands")
 
     def load(self, context, name, namespace, options):
         """Load and containerise representation into Content Browser.
@@ -90,6 +75,10 @@ class YetiLoader(plugin.Loader):
             list(str): list of container content
 
         """
+        cached_content = self.get_cached_import(context, options)
+        if cached_content is not None:
+            return cached_content
+
         # Check if Groom plugin is active
         if not self.is_groom_module_active():
             raise RuntimeError("Groom plugin is not activated.")
@@ -146,10 +135,13 @@ class YetiLoader(plugin.Loader):
             "product_type": context["product"]["productBaseType"],
             "family": context["product"]["productBaseType"],
             "project_name": context["project"]["name"],
-            "layout": should_use_layout
+            "layout": should_use_layout,
+            **get_source_file_data(path)
         }
 
         unreal_pipeline.imprint(f"{asset_dir}/{container_name}", data)
+        self.cache_import(
+            context, asset_dir, container_name, options)
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
@@ -161,6 +153,9 @@ class YetiLoader(plugin.Loader):
         return asset_content
 
     def update(self, container, context):
+        if self.update_unchanged_source(container, context):
+            return
+
         repre_entity = context["representation"]
         asset_name = container["asset_name"]
         source_path = self.filepath_from_context(context)
@@ -190,7 +185,8 @@ class YetiLoader(plugin.Loader):
             {
                 "representation": repre_entity["id"],
                 "parent": repre_entity["versionId"],
-                "project_name": context["project"]["name"]
+                "project_name": context["project"]["name"],
+                **get_source_file_data(source_path)
             }
         )
         asset_content = unreal.EditorAssetLibrary.list_assets(
@@ -201,6 +197,4 @@ class YetiLoader(plugin.Loader):
             unreal.EditorAssetLibrary.save_asset(a)
 
     def remove(self, container):
-        path = container["namespace"]
-        if unreal.EditorAssetLibrary.does_directory_exist(path):
-            unreal.EditorAssetLibrary.delete_directory(path)
+        self.remove_container_directory(container)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import unreal  # noqa
 import pyblish.api
-from ayon_unreal.api.pipeline import get_frame_range
+from ayon_unreal.api.pipeline import get_level_sequence_cache
 
 
 class CollectFrameRange(pyblish.api.InstancePlugin):
@@ -13,13 +13,10 @@ class CollectFrameRange(pyblish.api.InstancePlugin):
     families = ["camera"]
 
     def process(self, instance):
+        sequence_cache = get_level_sequence_cache(instance.context)
         for member in instance.data.get('members'):
-            ar = unreal.AssetRegistryHelpers.get_asset_registry()
-            data = ar.get_asset_by_object_path(member)
-            is_level_sequence = (
-                data.asset_class_path.asset_name == "LevelSequence")
-            if is_level_sequence:
-                sequence = data.get_asset()
-                frameStart, frameEnd = get_frame_range(sequence)
+            sequence_info = sequence_cache.get(member)
+            if sequence_info:
+                frameStart, frameEnd = sequence_info["frame_range"]
                 instance.data["clipIn"] = frameStart
                 instance.data["clipOut"] = frameEnd
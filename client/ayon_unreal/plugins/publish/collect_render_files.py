@@ -1,9 +1,11 @@
 from pathlib import Path
 import os
+import clique
 import unreal
 
 from ayon_core.pipeline import get_current_project_name, Anatomy
 from ayon_core.pipeline.publish import PublishError
+from ayon_unreal import render_jobs
 from ayon_unreal.api import pipeline
 import pyblish.api
 
@@ -13,6 +15,10 @@ class CollectRenderFiles(pyblish.api.InstancePlugin):
 
     Secondary step after local rendering. Should collect all rendered files and
     add them as representation.
+
+    Shots rendered in frame chunks write into the same output directory, the
+    chunks are reassembled into a single sequence representation and the
+    frames of chunks which failed to render are reported.
     """
     order = pyblish.api.CollectorOrder + 0.001
     families = ["render.local"]
@@ -107,6 +113,9 @@ class CollectRenderFiles(pyblish.api.InstancePlugin):
                 self.log.debug(f"Collecting render path: {render_path}")
                 frames = [str(x) for x in render_path.iterdir() if x.is_file()]
                 frames = pipeline.get_sequence(frames)
+                self._report_missing_chunks(
+                    seq_name, frames,
+                    new_data["frameStart"], new_data["frameEnd"])
                 image_format = next((os.path.splitext(x)[-1].lstrip(".")
                                      for x in frames), "exr")
 
@@ -123,3 +132,20 @@ class CollectRenderFiles(pyblish.api.InstancePlugin):
                     'tags': ['review']
                 }
                 new_instance.data["representations"].append(repr)
+
+    def _report_missing_chunks(self, seq_name, frames, frame_start, frame_end):
+        """Warn about frame ranges missing in reassembled render chunks."""
+        collections, _ = clique.assemble(
+            frames,
+            patterns=[clique.PATTERNS["frames"]],
+            minimum_items=1)
+        rendered = set(collections[0].indexes) if collections else set()
+        missing = set(range(frame_start, frame_end + 1)) - rendered
+        if not missing:
+            return
+        missing_ranges = ", ".join(
+            f"{start}-{end}"
+            for start, end in render_jobs.get_frame_ranges(missing))
+        self.log.warning(
+            f"{seq_name} is missing rendered frames {missing_ranges}. "
+            "Re-render the missing chunks before publishing.")
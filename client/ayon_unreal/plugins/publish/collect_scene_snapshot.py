@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""Collect scene snapshot shared by publish plugins."""
+import pyblish.api
+from ayon_unreal.api.pipeline import SceneSnapshot
+
+
+class CollectSceneSnapshot(pyblish.api.ContextPlugin):
+    """Inject scene snapshot into context.
+
+    Plugins look up level actors, asset registry data and loaded assets
+    in the snapshot instead of querying Unreal for each instance.
+    """
+
+    order = pyblish.api.CollectorOrder - 0.49
+    label = "Unreal Scene Snapshot"
+    hosts = ['unreal']
+
+    def process(self, context):
+        context.data["unrealSceneSnapshot"] = SceneSnapshot()
@@ -30,6 +30,8 @@ class UnrealRenderInstance(RenderInstance):
     app_version = attr.ib(default=None)
     output_settings = attr.ib(default=None)
     render_queue_path = attr.ib(default=None)
+    # Set only when chunking is configured
+    chunkSize = attr.ib(default=None)
 
 
 class CreateFarmRenderInstances(publish.AbstractCollectRender):
@@ -120,6 +122,7 @@ class CreateFarmRenderInstances(publish.AbstractCollectRender):
         render_settings = project_settings["unreal"]["render_setup"]
 
         output_ext_from_settings = render_settings["render_format"]
+        chunk_size = render_settings.get("chunk_size", 0)
 
         for inst in context:
             render_preset =inst.data.get("creator_attributes", {}).get(
@@ -283,6 +286,8 @@ class CreateFarmRenderInstances(publish.AbstractCollectRender):
                 deadline=inst.data.get("deadline"),
             )
             new_instance.farm = True
+            if chunk_size > 0:
+                new_instance.chunkSize = chunk_size
 
             instances.append(new_instance)
             instances_to_remove.append(inst)
@@ -292,6 +297,16 @@ class CreateFarmRenderInstances(publish.AbstractCollectRender):
             context.remove(instance)
         return instances
 
+    def add_additional_data(self, data):
+        """Remove chunk size of instances rendered without chunking.
+
+        Farm submitters use their own chunk size only when the instance
+        data have none.
+        """
+        if data.get("chunkSize") is None:
+            data.pop("chunkSize", None)
+        return data
+
     def _get_expected_file_name(
         self,
         file_name_format,
@@ -8,12 +8,25 @@ from ayon_core.pipeline import publish
 from ayon_unreal.api.pipeline import (
     UNREAL_VERSION,
     select_camera,
-    get_tracks
+    get_level_sequence_cache,
+    get_package_file,
+    get_package_state
+)
+from ayon_unreal.api.content_hash import (
+    PublishedContentHashes,
+    get_data_hash,
+    get_file_hash,
+    link_or_copy_file
 )
 
 
 class ExtractCamera(publish.Extractor):
-    """Extract a camera."""
+    """Extract a camera.
+
+    Each member sequence is exported into its own FBX file. Saved
+    sequences with the same fingerprint as in the last published version
+    are linked from it instead of being exported again.
+    """
 
     label = "Extract Camera"
     hosts = ["unreal"]
@@ -21,11 +34,10 @@ class ExtractCamera(publish.Extractor):
     optional = True
 
     def process(self, instance):
-        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        sequence_cache = get_level_sequence_cache(instance.context)
 
         # Define extract output file path
         staging_dir = self.staging_dir(instance)
-        fbx_filename = "{}.fbx".format(instance.name)
 
         # Perform extraction
         self.log.info("Performing extraction..")
@@ -38,67 +50,133 @@ class ExtractCamera(publish.Extractor):
         assert current_level == instance.data.get("level"), \
             "Wrong level loaded"
 
-        for member in instance.data.get('members'):
-            data = ar.get_asset_by_object_path(member)
+        if "representations" not in instance.data:
+            instance.data["representations"] = []
+
+        sequence_infos = [
+            sequence_info
+            for sequence_info in (
+                sequence_cache.get(member)
+                for member in instance.data.get('members')
+            )
+            if sequence_info
+        ]
+        published_hashes = PublishedContentHashes(instance)
+        level_state = get_package_state(
+            world.get_outermost().get_name(), extension="umap")
+
+        for sequence_info in sequence_infos:
+            sequence = sequence_info["sequence"]
+            repre_name = "fbx"
+            fbx_filename = "{}.fbx".format(instance.name)
+            clip_in = instance.data["clipIn"]
+            clip_out = instance.data["clipOut"]
+            if len(sequence_infos) > 1:
+                repre_name = f"fbx_{sequence.get_name()}"
+                fbx_filename = f"{instance.name}_{sequence.get_name()}.fbx"
+                clip_in, clip_out = sequence_info["frame_range"]
+            fbx_path = os.path.join(staging_dir, fbx_filename)
+
+            instance.data["representations"].append({
+                'name': repre_name,
+                'ext': 'fbx',
+                'files': fbx_filename,
+                'clipIn': clip_in,
+                'clipOut': clip_out,
+                "stagingDir": staging_dir,
+            })
+
+            # Unsaved changes of the sequence or of camera actors in the
+            # level are not in the fingerprint, sequence is exported
+            sequence_dirty = sequence_info["state"][0]
+            level_dirty = level_state[0]
+            fingerprint = None
+            if not sequence_dirty and not level_dirty:
+                fingerprint = self.get_sequence_fingerprint(
+                    sequence_info, current_level, level_state)
+            published_file = None
+            if fingerprint:
+                published_hashes.set_hash(repre_name, fingerprint)
+                published_file = published_hashes.get_published_file(
+                    repre_name, fingerprint)
+            if published_file:
+                self.log.info(
+                    f"{sequence.get_name()} did not change, "
+                    f"using {published_file}")
+                link_or_copy_file(published_file, fbx_path)
+                continue
+
+            self.export_sequence(world, sequence_info, fbx_path)
+            if not os.path.isfile(fbx_path):
+                raise RuntimeError("Failed to extract camera")
+
+    def export_sequence(self, world, sequence_info, fbx_path):
+        """Export cameras of a level sequence into FBX file."""
+        sequence = sequence_info["sequence"]
+        with select_camera(sequence):
             if UNREAL_VERSION.major == 5:
-                is_level_sequence = (
-                    data.asset_class_path.asset_name == "LevelSequence")
+                params = None
+                if UNREAL_VERSION.minor >= 4:
+                    params = unreal.SequencerExportFBXParams(
+                        world=world,
+                        root_sequence=sequence,
+                        sequence=sequence,
+                        bindings=sequence.get_bindings(),
+                        fbx_file_name=fbx_path
+                    )
+                else:
+                    params = unreal.SequencerExportFBXParams(
+                        world=world,
+                        root_sequence=sequence,
+                        sequence=sequence,
+                        bindings=sequence.get_bindings(),
+                        master_tracks=sequence_info["tracks"],
+                        fbx_file_name=fbx_path
+                    )
+                unreal.SequencerTools.export_level_sequence_fbx(params)
+            elif UNREAL_VERSION.major == 4 and UNREAL_VERSION.minor == 26:
+                unreal.SequencerTools.export_fbx(
+                    world,
+                    sequence,
+                    sequence.get_bindings(),
+                    unreal.FbxExportOption(),
+                    fbx_path
+                )
             else:
-                is_level_sequence = (data.asset_class == "LevelSequence")
-
-            if is_level_sequence:
-                sequence = data.get_asset()
-                with select_camera(sequence):
-                    if UNREAL_VERSION.major == 5:
-                        params = None
-                        if UNREAL_VERSION.minor >= 4:
-                            params = unreal.SequencerExportFBXParams(
-                                world=world,
-                                root_sequence=sequence,
-                                sequence=sequence,
-                                bindings=sequence.get_bindings(),
-                                fbx_file_name=os.path.join(staging_dir, fbx_filename)
-                            )
-                        else:
-                            params = unreal.SequencerExportFBXParams(
-                                world=world,
-                                root_sequence=sequence,
-                                sequence=sequence,
-                                bindings=sequence.get_bindings(),
-                                master_tracks=get_tracks(sequence),
-                                fbx_file_name=os.path.join(staging_dir, fbx_filename)
-                            )
-                        unreal.SequencerTools.export_level_sequence_fbx(params)
-                    elif UNREAL_VERSION.major == 4 and UNREAL_VERSION.minor == 26:
-                        unreal.SequencerTools.export_fbx(
-                            world,
-                            sequence,
-                            sequence.get_bindings(),
-                            unreal.FbxExportOption(),
-                            os.path.join(staging_dir, fbx_filename)
-                        )
-                    else:
-                        # Unreal 5.0 or 4.27
-                        unreal.SequencerTools.export_level_sequence_fbx(
-                            world,
-                            sequence,
-                            sequence.get_bindings(),
-                            unreal.FbxExportOption(),
-                            os.path.join(staging_dir, fbx_filename)
-                        )
-
-                    if not os.path.isfile(os.path.join(staging_dir, fbx_filename)):
-                        raise RuntimeError("Failed to extract camera")
+                # Unreal 5.0 or 4.27
+                unreal.SequencerTools.export_level_sequence_fbx(
+                    world,
+                    sequence,
+                    sequence.get_bindings(),
+                    unreal.FbxExportOption(),
+                    fbx_path
+                )
 
-        if "representations" not in instance.data:
-            instance.data["representations"] = []
+    def get_sequence_fingerprint(self, sequence_info, level, level_state):
+        """Get hash of saved state of a level sequence and its level.
+
+        Hash of the saved sequence package stands for its bindings, tracks
+        and keys, they are not read from the sequence.
+
+        Args:
+            sequence_info (dict): Cached sequence information, see
+                `LevelSequenceCache`.
+            level (str): Path to the level with camera actors.
+            level_state (tuple): Package state of the level, see
+                `get_package_state`.
 
-        fbx_representation = {
-            'name': 'fbx',
-            'ext': 'fbx',
-            'files': fbx_filename,
-            'clipIn': instance.data["clipIn"],
-            'clipOut': instance.data["clipOut"],
-            "stagingDir": staging_dir,
-        }
-        instance.data["representations"].append(fbx_representation)
+        Returns:
+            Optional[str]: Fingerprint of the sequence, None when the
+                sequence package file is not found.
+        """
+        sequence = sequence_info["sequence"]
+        package_file = get_package_file(sequence.get_outermost().get_name())
+        if not package_file or not os.path.isfile(package_file):
+            return None
+        return get_data_hash({
+            "sequence": sequence.get_path_name(),
+            "package_hash": get_file_hash(package_file),
+            "frame_range": list(sequence_info["frame_range"]),
+            "level": [level, level_state],
+            "unreal_version": str(UNREAL_VERSION),
+        })
@@ -2,10 +2,33 @@
 import unreal
 import os
 from ayon_core.pipeline import publish
+from ayon_core.pipeline.publish import KnownPublishError
+from ayon_unreal.api.pipeline import (
+    get_scene_snapshot,
+    get_dirty_package_names
+)
+from ayon_unreal.api.content_hash import (
+    PublishedContentHashes,
+    get_data_hash,
+    get_file_hash,
+    link_or_copy_file
+)
+
+# Stored with content hashes, change it when export options change
+EXPORT_OPTIONS = {
+    "exporter": "StaticMeshExporterFBX",
+    "ascii": False,
+    "collision": False,
+}
 
 
 class ExtractFbx(publish.Extractor):
-    """Extract Fbx."""
+    """Extract Fbx.
+
+    Each member is exported into its own FBX file. Members which did not
+    change since the last published version are linked from it instead
+    of being exported again.
+    """
 
     label = "Extract Fbx (Static Mesh)"
     hosts = ["unreal"]
@@ -13,39 +36,103 @@ class ExtractFbx(publish.Extractor):
 
     def process(self, instance):
         staging_dir = self.staging_dir(instance)
-        # TODO: select the asset during context
+        members = sorted(set(instance.data.get("members", [])))
+        scene_snapshot = get_scene_snapshot(instance.context)
+        dirty_packages = get_dirty_package_names()
+        published_hashes = PublishedContentHashes(instance)
+
+        if "representations" not in instance.data:
+            instance.data["representations"] = []
+
+        exports = []
+        members_by_repre_name = {}
+        for member in members:
+            asset = scene_snapshot.get_asset(member)
+            repre_name = "fbx"
+            fbx_filename = f"{instance.name}.fbx"
+            if len(members) > 1:
+                repre_name = f"fbx_{asset.get_name()}"
+                fbx_filename = f"{instance.name}_{asset.get_name()}.fbx"
+            members_by_repre_name.setdefault(repre_name, []).append(member)
+            exports.append((member, asset, repre_name, fbx_filename))
+
+        # Files and representations are named by the asset, assets of
+        # the same name from different directories would overwrite
+        # each other
+        duplicates = [
+            members for members in members_by_repre_name.values()
+            if len(members) > 1
+        ]
+        if duplicates:
+            raise KnownPublishError(
+                "Members with the same asset name can't be published "
+                "together: {}".format(
+                    "; ".join(", ".join(members) for members in duplicates)
+                )
+            )
+
+        tasks = []
+        for member, asset, repre_name, fbx_filename in exports:
+            fbx_path = os.path.join(
+                staging_dir, fbx_filename).replace("\\", "/")
+
+            instance.data["representations"].append({
+                'name': repre_name,
+                'ext': 'fbx',
+                'files': fbx_filename,
+                "stagingDir": staging_dir,
+            })
+
+            package_name = str(
+                scene_snapshot.get_asset_data(member).package_name)
+            if package_name in dirty_packages:
+                tasks.append(self._create_export_task(asset, fbx_path))
+                continue
+
+            content_hash = get_data_hash({
+                "source": get_file_hash(
+                    unreal.SystemLibrary.get_system_path(asset)),
+                "options": EXPORT_OPTIONS,
+            })
+            published_hashes.set_hash(repre_name, content_hash)
+            published_file = published_hashes.get_published_file(
+                repre_name, content_hash)
+            if published_file:
+                self.log.info(
+                    f"{member} did not change, using {published_file}")
+                link_or_copy_file(published_file, fbx_path)
+                continue
+            tasks.append(self._create_export_task(asset, fbx_path))
+
+        if hasattr(unreal.Exporter, "run_asset_export_tasks"):
+            unreal.Exporter.run_asset_export_tasks(tasks)
+        else:
+            for task in tasks:
+                unreal.Exporter.run_asset_export_task(task)
+
+        for task in tasks:
+            if not os.path.isfile(task.filename):
+                raise RuntimeError(
+                    f"Failed to export {task.object.get_path_name()}")
+            self.log.debug(task.filename)
+
+    def _create_export_task(self, asset, fbx_path):
         fbx_exporter = unreal.StaticMeshExporterFBX()
         fbx_exporter.set_editor_property('text', False)
 
         options = unreal.FbxExportOption()
-        options.set_editor_property('ascii', False)
-        options.set_editor_property('collision', False)
-        fbx_filename = f"{instance.name}.fbx"
+        options.set_editor_property(
+            'ascii', EXPORT_OPTIONS["ascii"])
+        options.set_editor_property(
+            'collision', EXPORT_OPTIONS["collision"])
 
         task = unreal.AssetExportTask()
         task.exporter = fbx_exporter
         task.options = options
-        members = set(instance.data.get("members", []))
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
-        for member in members:
-            task.object = asset_registry.get_asset_by_object_path(member).get_asset()
-            task.automated = True
-            task.filename = os.path.join(staging_dir, fbx_filename).replace("\\", "/")
-            task.selected = False
-            task.use_file_archive = False
-            task.write_empty_files = False
-
-            unreal.Exporter.run_asset_export_task(task)
-
-        if "representations" not in instance.data:
-            instance.data["representations"] = []
-
-        representation = {
-            'name': 'fbx',
-            'ext': 'fbx',
-            'files': fbx_filename,
-            "stagingDir": staging_dir,
-        }
-
-        instance.data["representations"].append(representation)
-        self.log.debug(f"{staging_dir}/{fbx_filename}")
+        task.object = asset
+        task.automated = True
+        task.filename = fbx_path
+        task.selected = False
+        task.use_file_archive = False
+        task.write_empty_files = False
+        return task
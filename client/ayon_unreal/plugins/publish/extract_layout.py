@@ -10,6 +10,12 @@ from unreal import EditorAssetLibrary as eal
 import ayon_api
 
 from ayon_core.pipeline import publish
+from ayon_unreal.api.pipeline import get_scene_snapshot
+from ayon_unreal.api.layout import (
+    BINARY_LAYOUT_EXTENSION,
+    LayoutElement,
+    write_binary_layout,
+)
 
 
 class ExtractLayout(publish.Extractor):
@@ -34,27 +40,18 @@ class ExtractLayout(publish.Extractor):
 
         json_data = []
         project_name = instance.context.data["projectName"]
-        eas = unreal.EditorActorSubsystem()
-        sel_actors = eas.get_all_level_actors()
-        members = set(instance.data.get("members", []))
-        actors = [a for a in sel_actors if a.get_path_name() in members]
+        scene_snapshot = get_scene_snapshot(instance.context)
+        actors = scene_snapshot.get_actors(instance.data.get("members", []))
+        placements = []
         for actor in actors:
-            mesh = None
-            # Check type the type of mesh
-            if actor.get_class().get_name() == 'SkeletalMeshActor':
-                mesh = actor.skeletal_mesh_component.skeletal_mesh
-            elif actor.get_class().get_name() == 'StaticMeshActor':
-                mesh = actor.static_mesh_component.static_mesh
+            placements.extend(self.get_placements(actor))
 
+        for mesh, transform in placements:
             if mesh:
                 # Search the reference to the Asset Container for the object
                 path = unreal.Paths.get_path(mesh.get_path_name())
-                filter = unreal.ARFilter(
-                    class_names=["AyonAssetContainer"], package_paths=[path])
-                ar = unreal.AssetRegistryHelpers.get_asset_registry()
-                try:
-                    asset_container = ar.get_assets(filter)[0].get_asset()
-                except IndexError:
+                asset_container = scene_snapshot.get_asset_container(path)
+                if not asset_container:
                     self.log.error("AssetContainer not found.")
                     return
 
@@ -80,7 +77,6 @@ class ExtractLayout(publish.Extractor):
                 json_element["instance_name"] = asset_name.group(1)
                 json_element["asset_name"] = instance_name
                 json_element["extension"] = extension
-                transform = actor.get_actor_transform()
                 json_element["host"] = self.hosts
                 json_element["transform"] = {
                     "translation": {
@@ -125,6 +121,64 @@ class ExtractLayout(publish.Extractor):
         }
         instance.data["representations"].append(json_representation)
 
+        creator_attributes = instance.data.get("creator_attributes", {})
+        if creator_attributes.get("export_binary_layout", False):
+            bases = {}
+            binary_filename = "{}.{}".format(
+                instance.name, BINARY_LAYOUT_EXTENSION)
+            write_binary_layout(
+                os.path.join(staging_dir, binary_filename),
+                [
+                    LayoutElement.from_data(json_element, bases)
+                    for json_element in json_data
+                ]
+            )
+            instance.data["representations"].append({
+                'name': BINARY_LAYOUT_EXTENSION,
+                'ext': BINARY_LAYOUT_EXTENSION,
+                'files': binary_filename,
+                "stagingDir": staging_dir,
+            })
+
+    @staticmethod
+    def get_placements(actor):
+        """Get meshes placed by actor with their transforms.
+
+        Every instance of instanced static mesh components is a placement
+        of its own, so layouts loaded with instanced meshes are published
+        per placement.
+
+        Args:
+            actor (unreal.Actor): Layout actor.
+
+        Returns:
+            list[tuple[unreal.Object, unreal.Transform]]: Placed meshes
+                and their world transforms.
+        """
+        # Check type the type of mesh
+        class_name = actor.get_class().get_name()
+        if class_name == 'SkeletalMeshActor':
+            return [(
+                actor.skeletal_mesh_component.skeletal_mesh,
+                actor.get_actor_transform()
+            )]
+        if class_name == 'StaticMeshActor':
+            return [(
+                actor.static_mesh_component.static_mesh,
+                actor.get_actor_transform()
+            )]
+
+        placements = []
+        for component in actor.get_components_by_class(
+            unreal.InstancedStaticMeshComponent
+        ):
+            mesh = component.static_mesh
+            for index in range(component.get_instance_count()):
+                placements.append(
+                    (mesh, component.get_instance_transform(index, True))
+                )
+        return placements
+
     def get_basis_matrix(self):
         """Get Identity matrix
 
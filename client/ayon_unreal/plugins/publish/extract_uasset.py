@@ -1,13 +1,28 @@
-from pathlib import Path
+import os
 import shutil
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import unreal
 
 from ayon_core.pipeline import publish
+from ayon_core.pipeline.publish import KnownPublishError
+from ayon_unreal.api.pipeline import get_scene_snapshot
+from ayon_unreal.api.content_hash import (
+    PublishedContentHashes,
+    get_file_hash,
+    link_or_copy_file
+)
 
 
 class ExtractUAsset(publish.Extractor):
-    """Extract a UAsset."""
+    """Extract a UAsset.
+
+    Package files are copied into staging, the editor can save them while
+    publishing. Packages with the same content as in the last published
+    version are hardlinked from the published files when the filesystem
+    allows it. Members are hashed and transferred concurrently.
+    """
 
     label = "Extract UAsset"
     hosts = ["unreal"]
@@ -17,7 +32,7 @@ class ExtractUAsset(publish.Extractor):
     def process(self, instance):
         extension = (
             "umap" if "umap" in instance.data.get("families") else "uasset")
-        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        scene_snapshot = get_scene_snapshot(instance.context)
 
         self.log.debug("Performing extraction..")
         staging_dir = self.staging_dir(instance)
@@ -27,24 +42,78 @@ class ExtractUAsset(publish.Extractor):
         if not members:
             raise RuntimeError("No members found in instance.")
 
-        # UAsset publishing supports only one member
-        obj = members[0]
+        transfers = []
+        members_by_repre_name = {}
+        for member in members:
+            asset = scene_snapshot.get_asset(member)
+            sys_path = unreal.SystemLibrary.get_system_path(asset)
+            repre_name = extension
+            if len(members) > 1:
+                repre_name = f"{extension}_{asset.get_name()}"
+            members_by_repre_name.setdefault(repre_name, []).append(member)
+            transfers.append((repre_name, sys_path))
 
-        asset = ar.get_asset_by_object_path(obj).get_asset()
-        sys_path = unreal.SystemLibrary.get_system_path(asset)
-        filename = Path(sys_path).name
+        # Files and representations are named by the asset, assets of
+        # the same name from different directories would overwrite
+        # each other
+        duplicates = [
+            members for members in members_by_repre_name.values()
+            if len(members) > 1
+        ]
+        if duplicates:
+            raise KnownPublishError(
+                "Members with the same asset name can't be published "
+                "together: {}".format(
+                    "; ".join(", ".join(members) for members in duplicates)
+                )
+            )
 
-        shutil.copy(sys_path, staging_dir)
+        published_hashes = PublishedContentHashes(instance)
 
-        self.log.info(f"instance.data: {instance.data}")
+        def _get_hash(transfer):
+            return get_file_hash(transfer[1])
+
+        with ThreadPoolExecutor() as executor:
+            content_hashes = list(executor.map(_get_hash, transfers))
 
-        if "representations" not in instance.data:
-            instance.data["representations"] = []
+        links = []
+        copies = []
+        for (repre_name, sys_path), content_hash in zip(
+            transfers, content_hashes
+        ):
+            filename = Path(sys_path).name
+            staging_path = os.path.join(staging_dir, filename)
+            published_hashes.set_hash(repre_name, content_hash)
+            published_file = published_hashes.get_published_file(
+                repre_name, content_hash)
+            if published_file:
+                self.log.info(
+                    f"{filename} did not change since the last "
+                    f"published version, using {published_file}")
+                links.append((published_file, staging_path))
+            else:
+                # Package file of the project is never linked, saving it
+                # in place would change the published file
+                copies.append((sys_path, staging_path))
 
-        representation = {
-            "name": extension,
-            "ext": extension,
-            "files": filename,
-            "stagingDir": staging_dir,
-        }
-        instance.data["representations"].append(representation)
+            if "representations" not in instance.data:
+                instance.data["representations"] = []
+
+            representation = {
+                "name": repre_name,
+                "ext": extension,
+                "files": filename,
+                "stagingDir": staging_dir,
+            }
+            instance.data["representations"].append(representation)
+
+        with ThreadPoolExecutor() as executor:
+            results = [
+                executor.submit(link_or_copy_file, *link) for link in links
+            ] + [
+                executor.submit(shutil.copy2, *copy) for copy in copies
+            ]
+            for result in results:
+                result.result()
+
+        self.log.info(f"instance.data: {instance.data}")
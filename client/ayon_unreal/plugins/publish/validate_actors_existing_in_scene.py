@@ -1,7 +1,7 @@
 import unreal
 
 import pyblish.api
-from ayon_unreal.api.pipeline import imprint
+from ayon_unreal.api.pipeline import imprint, get_scene_snapshot
 from ayon_core.pipeline.publish import (
     PublishValidationError
 )
@@ -28,10 +28,8 @@ class ValidateActorExistingInLayout(pyblish.api.InstancePlugin):
     actions = [SelectActorsAsInstanceMemberAction]
 
     def process(self, instance):
-        eas = unreal.EditorActorSubsystem()
-        sel_actors = eas.get_all_level_actors()
-        members_lookup = set(instance.data.get("members", []))
-        actors = [a for a in sel_actors if a.get_path_name() in members_lookup]
+        scene_snapshot = get_scene_snapshot(instance.context)
+        actors = scene_snapshot.get_actors(instance.data.get("members", []))
         if not actors:
             raise PublishValidationError(
                 "Invalid actors for layout publish\n\n"
@@ -3,7 +3,7 @@
 import pyblish.api
 import unreal
 from ayon_core.pipeline.publish import PublishValidationError, RepairAction
-from ayon_unreal.api.pipeline import get_tracks, add_track
+from ayon_unreal.api.pipeline import add_track, get_level_sequence_cache
 
 
 class ValidateCameraTracks(pyblish.api.InstancePlugin):
@@ -20,21 +20,19 @@ class ValidateCameraTracks(pyblish.api.InstancePlugin):
 
     def get_invalid(self, instance):
         invalid = []
-        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        sequence_cache = get_level_sequence_cache(instance.context)
         members = instance.data.get("members", {})
         if not members:
             invalid.append("No assets selected for publishing.")
             return invalid
         for member in members:
-            data = ar.get_asset_by_object_path(member)
-            is_level_sequence = (
-                data.asset_class_path.asset_name == "LevelSequence")
-            if not is_level_sequence:
+            sequence_info = sequence_cache.get(member)
+            if not sequence_info:
                 invalid.append(
                     "The published assets must be Level Sequence")
-            sequence = data.get_asset()
-            seq_name = sequence.get_name()
-            all_tracks = get_tracks(sequence)
+                continue
+            seq_name = sequence_info["sequence"].get_name()
+            all_tracks = sequence_info["tracks"]
             if not all_tracks:
                 message = (
                     f"No tracks found in Level Sequence {seq_name}. You can perform\n "
@@ -42,12 +40,7 @@ class ValidateCameraTracks(pyblish.api.InstancePlugin):
                     "and assign the camera to the track you want to publish\n"
                 )
                 invalid.append(message)
-            has_movie_tracks = False
-            for track in all_tracks:
-                if str(track).count("MovieSceneCameraCutTrack"):
-                    has_movie_tracks = True
-                    break
-            if not has_movie_tracks:
+            if not sequence_info["camera_tracks"]:
                 message = (
                     f"The level sequence {seq_name} does not include any Movie\n "
                     " Scene Camera Cut Track. Please make sure the published level\n "
@@ -64,12 +57,11 @@ class ValidateCameraTracks(pyblish.api.InstancePlugin):
 
     @classmethod
     def repair(cls, instance):
-        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        sequence_cache = get_level_sequence_cache(instance.context)
         members = instance.data.get("members", {})
         for member in members:
-            data = ar.get_asset_by_object_path(member)
-            is_level_sequence = (
-                data.asset_class_path.asset_name == "LevelSequence")
-            if is_level_sequence:
-                sequence = data.get_asset()
-                add_track(sequence, unreal.MovieSceneCameraCutTrack)
+            sequence_info = sequence_cache.get(member)
+            if sequence_info:
+                add_track(
+                    sequence_info["sequence"], unreal.MovieSceneCameraCutTrack)
+                sequence_cache.invalidate(member)
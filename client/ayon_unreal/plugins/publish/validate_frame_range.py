@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 import pyblish.api
 
-import unreal
-
 from ayon_core.pipeline import OptionalPyblishPluginMixin
 from ayon_core.pipeline.publish import (
     RepairAction,
@@ -11,7 +9,7 @@ from ayon_core.pipeline.publish import (
 )
 from ayon_unreal.api.pipeline import (
     get_frame_range_from_folder_attributes,
-    get_camera_tracks
+    get_level_sequence_cache
 )
 
 
@@ -68,17 +66,16 @@ class ValidateFrameRange(pyblish.api.InstancePlugin,
     def repair(cls, instance):
         clip_in_handle, clip_out_handle = get_frame_range_from_folder_attributes(
             instance.data["folderEntity"])
+        sequence_cache = get_level_sequence_cache(instance.context)
         for member in instance.data.get('members'):
-            ar = unreal.AssetRegistryHelpers.get_asset_registry()
-            data = ar.get_asset_by_object_path(member)
-            is_level_sequence = (
-                data.asset_class_path.asset_name == "LevelSequence")
-            if is_level_sequence:
-                sequence = data.get_asset()
-                camera_tracks = get_camera_tracks(sequence)
+            sequence_info = sequence_cache.get(member)
+            if sequence_info:
+                sequence = sequence_info["sequence"]
+                camera_tracks = sequence_info["camera_tracks"]
                 if not camera_tracks:
                     return sequence.get_playback_start(), sequence.get_playback_end()
                 for camera_track in camera_tracks:
                     sections = camera_track.get_sections()
                     for section in sections:
                         section.set_range(clip_in_handle, clip_out_handle)
+                sequence_cache.invalidate(member)
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-import unreal
 import pyblish.api
 from ayon_core.pipeline.publish import PublishValidationError
+from ayon_unreal.api.pipeline import get_scene_snapshot
 
 
 class ValidateNoDependencies(pyblish.api.InstancePlugin):
@@ -16,10 +16,9 @@ class ValidateNoDependencies(pyblish.api.InstancePlugin):
     def process(self, instance):
         invalid_asset = []
         members = set(instance.data.get("members", []))
-        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        scene_snapshot = get_scene_snapshot(instance.context)
         for member in members:
-            asset = asset_registry.get_asset_by_object_path(member).get_asset()
-            if asset.get_class().get_name() != "StaticMesh":
+            if scene_snapshot.get_asset_class_name(member) != "StaticMesh":
                 invalid_asset.append(member)
 
         if invalid_asset:
@@ -0,0 +1,643 @@
+# -*- coding: utf-8 -*-
+"""Render job planning and local multi-process execution.
+
+Nothing in this module imports `unreal`. Jobs are described by plain
+dictionaries so the same helpers can be used from within the editor, from
+standalone processes and with a fake editor executable.
+
+A render job dictionary has these keys:
+
+    - `name` (str): Shot (sequence) name, used as file name prefix.
+    - `output_dir` (str): Absolute directory the frames are written to.
+    - `ext` (str): Output image extension without dot.
+    - `frame_start` (int): First frame to render (inclusive).
+    - `frame_end` (int): Last frame to render (inclusive).
+    - `padding` (int, optional): Frame number zero padding. Defaults to 4.
+    - `map` (str, optional): Map object path used to render the job.
+
+"""
+import json
+import math
+import os
+import platform
+import struct
+import subprocess
+import time
+from typing import Optional
+
+RENDER_MANIFEST_DIR = ".ayon_render"
+SHARD_MANIFEST_ENV = "AYON_RENDER_SHARD_MANIFEST"
+DEFAULT_FRAME_PADDING = 4
+
+# Magic bytes at the start of a valid image and bytes ending a completely
+# written one (when the format has a fixed trailer).
+FRAME_HEADERS = {
+    "exr": b"\x76\x2f\x31\x01",
+    "png": b"\x89PNG\r\n\x1a\n",
+    "jpg": b"\xff\xd8\xff",
+    "bmp": b"BM",
+}
+FRAME_TRAILERS = {
+    "png": b"IEND\xaeB`\x82",
+    "jpg": b"\xff\xd9",
+}
+
+# Flags of OpenEXR version field
+EXR_TILED_FLAG = 0x200
+EXR_NON_IMAGE_FLAG = 0x800
+EXR_MULTIPART_FLAG = 0x1000
+# Scanlines stored in one chunk by OpenEXR compression methods
+EXR_SCANLINES_PER_CHUNK = {
+    0: 1,  # NO_COMPRESSION
+    1: 1,  # RLE
+    2: 1,  # ZIPS
+    3: 16,  # ZIP
+    4: 32,  # PIZ
+    5: 16,  # PXR24
+    6: 32,  # B44
+    7: 32,  # B44A
+    8: 32,  # DWAA
+    9: 256,  # DWAB
+}
+EXR_HEADER_READ_SIZE = 64 * 1024
+
+
+def get_editor_cmd_path(engine_dir: str) -> str:
+    """Get path to the headless editor executable of an engine.
+
+    Args:
+        engine_dir (str): Absolute path to `Engine` directory.
+
+    Returns:
+        str: Path to `UnrealEditor-Cmd` executable.
+
+    """
+    binaries_dir = os.path.join(engine_dir, "Binaries")
+    system = platform.system().lower()
+    if system == "windows":
+        return os.path.join(binaries_dir, "Win64", "UnrealEditor-Cmd.exe")
+    if system == "darwin":
+        return os.path.join(
+            binaries_dir, "Mac", "UnrealEditor.app",
+            "Contents", "MacOS", "UnrealEditor")
+    return os.path.join(binaries_dir, "Linux", "UnrealEditor-Cmd")
+
+
+def get_job_frame_count(job: dict) -> int:
+    """Get number of frames rendered by a job."""
+    return max(0, job["frame_end"] - job["frame_start"] + 1)
+
+
+def get_frame_path(job: dict, frame: int) -> str:
+    """Get path of a single frame rendered by a job.
+
+    Mirrors the `{shot_name}.{frame_number}` file name format set on the
+    output settings of jobs created by `start_rendering`.
+
+    """
+    padding = job.get("padding", DEFAULT_FRAME_PADDING)
+    file_name = f"{job['name']}.{frame:0{padding}d}.{job['ext']}"
+    return os.path.join(job["output_dir"], file_name)
+
+
+def get_expected_frame_paths(job: dict) -> list:
+    """Get paths of all frames a job is expected to render."""
+    return [
+        get_frame_path(job, frame)
+        for frame in range(job["frame_start"], job["frame_end"] + 1)
+    ]
+
+
+class _ExrHeaderReader:
+    """Read values from the beginning of EXR file, reading more on demand."""
+
+    def __init__(self, f):
+        self._file = f
+        self._data = b""
+        self.position = 0
+
+    def _ensure(self, size):
+        while len(self._data) < self.position + size:
+            data = self._file.read(EXR_HEADER_READ_SIZE)
+            if not data:
+                raise EOFError("Unexpected end of EXR file")
+            self._data += data
+
+    def read(self, size):
+        self._ensure(size)
+        value = self._data[self.position:self.position + size]
+        self.position += size
+        return value
+
+    def read_string(self):
+        while True:
+            end = self._data.find(b"\0", self.position)
+            if end >= 0:
+                break
+            self._ensure(len(self._data) - self.position + 1)
+        value = self._data[self.position:end]
+        self.position = end + 1
+        return value
+
+    def read_header(self):
+        attributes = {}
+        while True:
+            name = self.read_string()
+            if not name:
+                return attributes
+            attr_type = self.read_string()
+            size = struct.unpack("<i", self.read(4))[0]
+            attributes[name] = (attr_type, self.read(size))
+
+
+def _get_exr_level_tile_counts(width, height, tile_desc):
+    """Get tile count of every level of tiled EXR part."""
+    tile_width, tile_height, mode = struct.unpack("<IIB", tile_desc[:9])
+    level_mode = mode & 0x0F
+    round_up = bool(mode & 0x10)
+
+    def level_size(size, level):
+        if round_up:
+            return max(1, math.ceil(size / (1 << level)))
+        return max(1, size >> level)
+
+    def level_count(size):
+        if round_up:
+            return math.ceil(math.log2(size)) + 1 if size > 1 else 1
+        return size.bit_length()
+
+    def tile_count(size, tile_size):
+        return math.ceil(size / tile_size)
+
+    if level_mode == 0:
+        return [
+            tile_count(width, tile_width) * tile_count(height, tile_height)
+        ]
+    if level_mode == 1:
+        return [
+            tile_count(level_size(width, level), tile_width)
+            * tile_count(level_size(height, level), tile_height)
+            for level in range(level_count(max(width, height)))
+        ]
+    return [
+        tile_count(level_size(width, x_level), tile_width)
+        * tile_count(level_size(height, y_level), tile_height)
+        for y_level in range(level_count(height))
+        for x_level in range(level_count(width))
+    ]
+
+
+def _get_exr_chunk_count(attributes, tiled):
+    """Get number of chunks of EXR part from its header attributes."""
+    if b"chunkCount" in attributes:
+        return struct.unpack("<i", attributes[b"chunkCount"][1][:4])[0]
+    x_min, y_min, x_max, y_max = struct.unpack(
+        "<iiii", attributes[b"dataWindow"][1][:16])
+    width = x_max - x_min + 1
+    height = y_max - y_min + 1
+    if tiled:
+        return sum(_get_exr_level_tile_counts(
+            width, height, attributes[b"tiles"][1]))
+    compression = attributes[b"compression"][1][0]
+    return math.ceil(height / EXR_SCANLINES_PER_CHUNK[compression])
+
+
+def _is_exr_complete(f, size):
+    """Check that all chunks of EXR file were written.
+
+    OpenEXR writes the chunk offset tables filled with zeros and fills
+    them when the file is closed. File is complete when all offsets are
+    set and the last chunk of every part ends within the file.
+
+    Args:
+        f (BinaryIO): File opened at the start.
+        size (int): File size.
+
+    Returns:
+        bool: True if the file is complete.
+
+    """
+    reader = _ExrHeaderReader(f)
+    reader.read(4)
+    flags = struct.unpack("<I", reader.read(4))[0]
+    multipart = bool(flags & EXR_MULTIPART_FLAG)
+    deep = bool(flags & EXR_NON_IMAGE_FLAG)
+
+    headers = []
+    while True:
+        attributes = reader.read_header()
+        if not attributes:
+            break
+        headers.append(attributes)
+        if not multipart:
+            break
+
+    chunk_counts = []
+    for attributes in headers:
+        tiled = bool(flags & EXR_TILED_FLAG)
+        if b"type" in attributes:
+            part_type = attributes[b"type"][1].rstrip(b"\0")
+            tiled = part_type in (b"tiledimage", b"deeptile")
+            deep = deep or part_type.startswith(b"deep")
+        chunk_counts.append((_get_exr_chunk_count(attributes, tiled), tiled))
+
+    last_chunks = []
+    for chunk_count, tiled in chunk_counts:
+        offsets = struct.unpack(
+            f"<{chunk_count}Q", reader.read(chunk_count * 8))
+        if not offsets or not all(0 < offset < size for offset in offsets):
+            return False
+        last_chunks.append((max(offsets), tiled))
+
+    if deep:
+        # Chunk sizes of deep data are not validated
+        return True
+
+    for offset, tiled in last_chunks:
+        # Chunk starts with part number in multipart files, followed by
+        # tile coordinates and levels or by scanline and the data size
+        chunk_header_size = (4 if multipart else 0) + (16 if tiled else 4)
+        f.seek(offset + chunk_header_size)
+        data_size = f.read(4)
+        if len(data_size) != 4:
+            return False
+        chunk_end = (
+            offset + chunk_header_size + 4
+            + struct.unpack("<i", data_size)[0]
+        )
+        if chunk_end > size:
+            return False
+    return True
+
+
+def is_frame_complete(
+    path: str, ext: str, size: Optional[int] = None
+) -> bool:
+    """Check that a rendered frame was completely written.
+
+    Validates the size and the image header and, where the format allows
+    it, the trailer, the size stored in the header or the chunk offset
+    table (EXR). Frames of unknown formats are considered complete when
+    they are not empty.
+
+    Args:
+        path (str): Path to the frame.
+        ext (str): Image extension without dot.
+        size (int, optional): Known file size, saves a `stat` call.
+
+    Returns:
+        bool: True if the frame is complete.
+
+    """
+    ext = ext.lower()
+    try:
+        if size is None:
+            size = os.path.getsize(path)
+        header = FRAME_HEADERS.get(ext, b"")
+        trailer = FRAME_TRAILERS.get(ext, b"")
+        if size <= len(header) + len(trailer):
+            return False
+        with open(path, "rb") as f:
+            if f.read(len(header)) != header:
+                return False
+            if ext == "exr":
+                f.seek(0)
+                return _is_exr_complete(f, size)
+            if ext == "bmp":
+                # File size is stored right after the magic bytes
+                stored_size = int.from_bytes(f.read(4), "little")
+                return stored_size == size
+            if trailer:
+                f.seek(-len(trailer), os.SEEK_END)
+                return f.read(len(trailer)) == trailer
+    except (OSError, EOFError, KeyError, IndexError, struct.error):
+        return False
+    return True
+
+
+def get_complete_frames(job: dict) -> set:
+    """Get frames of a job which are already rendered completely.
+
+    The output directory is listed only once, frames are then matched
+    against the listing by their expected file names.
+
+    Returns:
+        set[int]: Completely rendered frame numbers.
+
+    """
+    try:
+        entries = {
+            entry.name: entry
+            for entry in os.scandir(job["output_dir"])
+            if entry.is_file()
+        }
+    except OSError:
+        return set()
+
+    complete = set()
+    for frame in range(job["frame_start"], job["frame_end"] + 1):
+        file_name = os.path.basename(get_frame_path(job, frame))
+        entry = entries.get(file_name)
+        if entry is None:
+            continue
+        if is_frame_complete(entry.path, job["ext"], entry.stat().st_size):
+            complete.add(frame)
+    return complete
+
+
+def get_missing_frame_ranges(job: dict) -> list:
+    """Get inclusive frame ranges of a job which still need to render."""
+    complete = get_complete_frames(job)
+    return get_frame_ranges(
+        frame
+        for frame in range(job["frame_start"], job["frame_end"] + 1)
+        if frame not in complete
+    )
+
+
+def split_frame_range(
+    frame_start: int, frame_end: int, chunk_size: int
+) -> list:
+    """Split inclusive frame range into chunks.
+
+    Args:
+        frame_start (int): First frame of the range.
+        frame_end (int): Last frame of the range.
+        chunk_size (int): Maximum number of frames in a chunk. Zero or
+            negative value disables chunking.
+
+    Returns:
+        list[tuple[int, int]]: Inclusive frame ranges of the chunks.
+
+    Example:
+        >>> split_frame_range(1001, 1010, 4)
+        [(1001, 1004), (1005, 1008), (1009, 1010)]
+
+    """
+    if chunk_size <= 0 or frame_end < frame_start:
+        return [(frame_start, frame_end)]
+    return [
+        (chunk_start, min(chunk_start + chunk_size - 1, frame_end))
+        for chunk_start in range(frame_start, frame_end + 1, chunk_size)
+    ]
+
+
+def get_frame_ranges(frames) -> list:
+    """Collapse frame numbers into inclusive continuous ranges.
+
+    Example:
+        >>> get_frame_ranges([1, 2, 3, 7, 9, 10])
+        [(1, 3), (7, 7), (9, 10)]
+
+    """
+    ranges = []
+    for frame in sorted(set(frames)):
+        if ranges and frame == ranges[-1][1] + 1:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return [tuple(frame_range) for frame_range in ranges]
+
+
+def shard_jobs(jobs: list, shard_count: int) -> list:
+    """Distribute render jobs into shards with balanced frame counts.
+
+    Jobs are never split, each shard renders whole jobs (shots or chunks
+    of shots). Longest jobs are assigned first, always to the shard with
+    the least frames.
+
+    Args:
+        jobs (list[dict]): Render jobs.
+        shard_count (int): Maximum number of shards.
+
+    Returns:
+        list[list[dict]]: Non-empty shards of jobs.
+
+    """
+    shard_count = max(1, min(shard_count, len(jobs)))
+    shards = [[] for _ in range(shard_count)]
+    loads = [0] * shard_count
+    for job in sorted(jobs, key=get_job_frame_count, reverse=True):
+        index = loads.index(min(loads))
+        shards[index].append(job)
+        loads[index] += get_job_frame_count(job)
+    return [shard for shard in shards if shard]
+
+
+class LocalRenderShard:
+    """Single headless editor process rendering a subset of jobs."""
+
+    def __init__(self, index, manifest_path, jobs_path, jobs, log_path):
+        self.index = index
+        self.manifest_path = manifest_path
+        self.jobs_path = jobs_path
+        self.jobs = jobs
+        self.log_path = log_path
+        self.process = None
+        self.start_time = None
+        self.end_time = None
+
+    @property
+    def returncode(self):
+        if self.process is None:
+            return None
+        return self.process.poll()
+
+    @property
+    def finished(self):
+        return self.process is not None and self.returncode is not None
+
+    def get_expected_frames(self) -> int:
+        return sum(get_job_frame_count(job) for job in self.jobs)
+
+    def get_rendered_frames(self) -> int:
+        return sum(
+            1
+            for job in self.jobs
+            for path in get_expected_frame_paths(job)
+            if os.path.isfile(path)
+        )
+
+    def get_missing_frame_paths(self) -> list:
+        return [
+            path
+            for job in self.jobs
+            for path in get_expected_frame_paths(job)
+            if not os.path.isfile(path)
+        ]
+
+
+class LocalRenderExecutor:
+    """Render queue manifests in parallel headless editor processes.
+
+    Each shard is rendered by its own `UnrealEditor-Cmd` process started
+    with `-game -MoviePipelineConfig=<manifest>`. Alongside the manifest
+    a JSON description of the shard jobs is written and its path is passed
+    to the process in `AYON_RENDER_SHARD_MANIFEST` environment variable.
+    Progress is tracked by counting the frames found on disk.
+
+    Example:
+        >>> executor = LocalRenderExecutor(exe, project_file, work_dir)
+        >>> executor.add_shard(manifest_text, jobs)
+        >>> executor.start()
+        >>> results = executor.wait()
+
+    """
+
+    def __init__(
+        self, executable, project_file, manifest_dir,
+        extra_args=None, env=None
+    ):
+        self.executable = executable
+        self.project_file = project_file
+        self.manifest_dir = manifest_dir
+        self.extra_args = list(extra_args or [])
+        self.env = env
+        self.shards = []
+
+    def add_shard(self, manifest_text: str, jobs: list) -> LocalRenderShard:
+        """Write queue manifest of a shard to disk and register it.
+
+        Args:
+            manifest_text (str): Serialized `MoviePipelineQueue` manifest.
+            jobs (list[dict]): Render jobs contained in the manifest.
+
+        Returns:
+            LocalRenderShard: Registered shard.
+
+        """
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        index = len(self.shards)
+        base_path = os.path.join(self.manifest_dir, f"shard_{index:03d}")
+        manifest_path = f"{base_path}.utxt"
+        with open(manifest_path, "w") as f:
+            f.write(manifest_text)
+        jobs_path = f"{base_path}.json"
+        with open(jobs_path, "w") as f:
+            json.dump({"manifest": manifest_path, "jobs": jobs}, f, indent=4)
+
+        shard = LocalRenderShard(
+            index, manifest_path, jobs_path, jobs, f"{base_path}.log")
+        self.shards.append(shard)
+        return shard
+
+    def get_command(self, shard: LocalRenderShard) -> list:
+        command = [self.executable, self.project_file]
+        map_path = next(
+            (job["map"] for job in shard.jobs if job.get("map")), None)
+        if map_path:
+            command.append(map_path)
+        command.extend([
+            "-game",
+            f"-MoviePipelineConfig={shard.manifest_path}",
+            "-windowed",
+            "-Unattended",
+            "-NoSplash",
+            "-Log",
+            "-StdOut",
+            "-allowStdOutLogVerbosity",
+        ])
+        command.extend(self.extra_args)
+        return command
+
+    def start(self):
+        """Start processes of all registered shards."""
+        for shard in self.shards:
+            env = dict(self.env or os.environ)
+            env[SHARD_MANIFEST_ENV] = shard.jobs_path
+            log_file = open(shard.log_path, "w")
+            shard.start_time = time.time()
+            try:
+                shard.process = subprocess.Popen(
+                    self.get_command(shard),
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    env=env,
+                )
+            finally:
+                # Child process holds its own handle of the file
+                log_file.close()
+
+    def poll(self) -> bool:
+        """Check state of the processes without blocking.
+
+        Returns:
+            bool: True when all processes have finished.
+
+        """
+        finished = True
+        for shard in self.shards:
+            if not shard.finished:
+                finished = False
+            elif shard.end_time is None:
+                shard.end_time = time.time()
+        return finished
+
+    def get_progress(self) -> list:
+        """Get progress of each shard.
+
+        Returns:
+            list[dict]: Rendered and expected frame counts per shard.
+
+        """
+        return [
+            {
+                "shard": shard.index,
+                "rendered": shard.get_rendered_frames(),
+                "expected": shard.get_expected_frames(),
+                "returncode": shard.returncode,
+            }
+            for shard in self.shards
+        ]
+
+    def wait(self, interval: float = 1.0) -> dict:
+        """Block until all processes finish and return merged results."""
+        while not self.poll():
+            time.sleep(interval)
+        return self.merge_results()
+
+    def merge_results(self) -> dict:
+        """Merge results of all shards and store them next to manifests.
+
+        Returns:
+            dict: Merged results with `success` flag, list of rendered
+                frame paths, missing frame paths and per shard details.
+
+        """
+        results = {
+            "success": True,
+            "frames": [],
+            "missing": [],
+            "shards": [],
+        }
+        for shard in self.shards:
+            missing = set(shard.get_missing_frame_paths())
+            frames = [
+                path
+                for job in shard.jobs
+                for path in get_expected_frame_paths(job)
+                if path not in missing
+            ]
+            duration = None
+            if shard.start_time and shard.end_time:
+                duration = shard.end_time - shard.start_time
+            success = shard.returncode == 0 and not missing
+            results["success"] = results["success"] and success
+            results["frames"].extend(frames)
+            results["missing"].extend(sorted(missing))
+            results["shards"].append({
+                "shard": shard.index,
+                "manifest": shard.manifest_path,
+                "log": shard.log_path,
+                "returncode": shard.returncode,
+                "duration": duration,
+                "jobs": [job["name"] for job in shard.jobs],
+                "rendered": len(frames),
+                "success": success,
+            })
+
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        results_path = os.path.join(self.manifest_dir, "results.json")
+        with open(results_path, "w") as f:
+            json.dump(results, f, indent=4)
+        return results
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""Render throughput telemetry.
+
+Timings of rendered jobs are stored as JSON lines next to the renders, one
+record per job. Frame timings are derived from the modification times and
+sizes of the frames written on disk, so no per frame callback from the
+executor is needed. Like `render_jobs`, nothing in here imports `unreal`.
+
+"""
+import collections
+import json
+import os
+import time
+
+from ayon_unreal import render_jobs
+
+TELEMETRY_FILE_NAME = "render_telemetry.jsonl"
+
+
+def collect_frame_stats(job: dict) -> list:
+    """Collect finish time and size of frames rendered by a job.
+
+    Args:
+        job (dict): Render job data, see `ayon_unreal.render_jobs`.
+
+    Returns:
+        list[dict]: Frame number, finish time and size of each rendered
+            frame, ordered by the time they were written.
+
+    """
+    frames = []
+    for frame in range(job["frame_start"], job["frame_end"] + 1):
+        path = render_jobs.get_frame_path(job, frame)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        frames.append({
+            "frame": frame,
+            "finished": stat.st_mtime,
+            "bytes": stat.st_size,
+        })
+    frames.sort(key=lambda item: item["finished"])
+    return frames
+
+
+def build_job_record(
+    job: dict, start_time: float, end_time: float, success: bool
+) -> dict:
+    """Build telemetry record of a finished render job.
+
+    Duration of a frame is the time since the previous frame (or job start)
+    was written. The first frame also contains engine warm-up, warm-up cost
+    is its duration above the average duration of the other frames.
+
+    Args:
+        job (dict): Render job data.
+        start_time (float): Time the job started rendering.
+        end_time (float): Time the job finished.
+        success (bool): Whether the job finished successfully.
+
+    Returns:
+        dict: Job record.
+
+    """
+    frames = collect_frame_stats(job)
+    previous = start_time
+    for frame in frames:
+        frame["duration"] = max(0.0, frame["finished"] - previous)
+        previous = max(previous, frame["finished"])
+
+    warm_up = 0.0
+    if frames:
+        durations = [frame["duration"] for frame in frames[1:]]
+        average = sum(durations) / len(durations) if durations else 0.0
+        warm_up = max(0.0, frames[0]["duration"] - average)
+
+    return {
+        "type": "job",
+        "name": job["name"],
+        "sequence": job.get("sequence") or job["name"],
+        "preset": job.get("preset") or "",
+        "frame_start": job["frame_start"],
+        "frame_end": job["frame_end"],
+        "start": start_time,
+        "end": end_time,
+        "duration": end_time - start_time,
+        "success": bool(success),
+        "frame_count": len(frames),
+        "expected_frames": render_jobs.get_job_frame_count(job),
+        "output_bytes": sum(frame["bytes"] for frame in frames),
+        "warm_up": warm_up,
+        "frames": frames,
+    }
+
+
+class RenderTelemetry:
+    """Record timings of sequentially rendered jobs to JSONL file.
+
+    Jobs of an executor render one after another, so a job starts when
+    the previous one finishes (or when the queue started).
+
+    Args:
+        path (str): Path to JSONL file, records are appended.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.queue_start = None
+        self._job_start = None
+        self._job_records = []
+
+    def start_queue(self):
+        self.queue_start = time.time()
+        self._job_start = self.queue_start
+
+    def record_job(self, job, success, start_time=None):
+        """Record finished job.
+
+        Args:
+            job (dict): Render job data.
+            success (bool): Whether the job finished successfully.
+            start_time (float, optional): Time the job started, defaults
+                to the end of previously recorded job.
+
+        Returns:
+            dict: Written record.
+
+        """
+        end_time = time.time()
+        if start_time is None:
+            start_time = self._job_start or end_time
+        record = build_job_record(job, start_time, end_time, success)
+        self._write(record)
+        self._job_records.append(record)
+        self._job_start = end_time
+        return record
+
+    def record_process_jobs(self, jobs, start_time, end_time, success):
+        """Record jobs rendered one after another by a separate process.
+
+        Job ends when its last frame was written, the last job ends with
+        the process. Following job starts when the previous one ended.
+
+        Args:
+            jobs (list[dict]): Render jobs in the order they rendered.
+            start_time (float): Time the process started.
+            end_time (float): Time the process finished.
+            success (bool): Whether the process finished successfully.
+
+        Returns:
+            list[dict]: Written records.
+
+        """
+        records = []
+        job_start = start_time
+        for index, job in enumerate(jobs):
+            job_end = end_time
+            if index < len(jobs) - 1:
+                frames = collect_frame_stats(job)
+                job_end = frames[-1]["finished"] if frames else job_start
+                job_end = min(max(job_end, job_start), end_time)
+            record = build_job_record(job, job_start, job_end, success)
+            self._write(record)
+            self._job_records.append(record)
+            records.append(record)
+            job_start = job_end
+        return records
+
+    def finish_queue(self, success):
+        """Record summary of the whole queue."""
+        end_time = time.time()
+        start_time = self.queue_start or end_time
+        record = {
+            "type": "queue",
+            "start": start_time,
+            "end": end_time,
+            "duration": end_time - start_time,
+            "success": bool(success),
+            "jobs": len(self._job_records),
+            "frame_count": sum(
+                job["frame_count"] for job in self._job_records),
+            "output_bytes": sum(
+                job["output_bytes"] for job in self._job_records),
+        }
+        self._write(record)
+        return record
+
+    def _write(self, record):
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+def read_records(paths):
+    """Read telemetry records from JSONL files or directories.
+
+    Directories are searched recursively for telemetry files.
+
+    Yields:
+        dict: Telemetry record.
+
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                if TELEMETRY_FILE_NAME in files:
+                    yield from read_records(
+                        [os.path.join(root, TELEMETRY_FILE_NAME)])
+            continue
+
+        with open(path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def summarize(records, key: str) -> dict:
+    """Summarize throughput of job records grouped by a record key.
+
+    Args:
+        records (Iterable[dict]): Telemetry records.
+        key (str): Record key to group jobs by, e.g. `sequence`
+            or `preset`.
+
+    Returns:
+        dict[str, dict]: Summary for each group.
+
+    """
+    groups = collections.defaultdict(lambda: {
+        "jobs": 0,
+        "failed": 0,
+        "frames": 0,
+        "duration": 0.0,
+        "warm_up": 0.0,
+        "output_bytes": 0,
+    })
+    for record in records:
+        if record.get("type") != "job":
+            continue
+        group = groups[record.get(key) or ""]
+        group["jobs"] += 1
+        group["failed"] += 0 if record["success"] else 1
+        group["frames"] += record["frame_count"]
+        group["duration"] += record["duration"]
+        group["warm_up"] += record["warm_up"]
+        group["output_bytes"] += record["output_bytes"]
+
+    for group in groups.values():
+        render_time = max(0.0, group["duration"] - group["warm_up"])
+        group["frames_per_second"] = (
+            group["frames"] / group["duration"]
+            if group["duration"] else 0.0
+        )
+        group["seconds_per_frame"] = (
+            render_time / group["frames"] if group["frames"] else 0.0
+        )
+    return dict(groups)
+
+
+def format_report(records) -> str:
+    """Format throughput per sequence and per render preset as text."""
+    records = list(records)
+    lines = []
+    for key, title in (("sequence", "Sequence"), ("preset", "Preset")):
+        lines.append(
+            f"{title:<40} {'jobs':>5} {'frames':>7} {'fps':>7} "
+            f"{'s/frame':>8} {'warm-up':>8} {'MB':>9}"
+        )
+        for name, group in sorted(summarize(records, key).items()):
+            lines.append(
+                f"{name or '-':<40} {group['jobs']:>5} "
+                f"{group['frames']:>7} "
+                f"{group['frames_per_second']:>7.2f} "
+                f"{group['seconds_per_frame']:>8.2f} "
+                f"{group['warm_up']:>8.1f} "
+                f"{group['output_bytes'] / (1024 * 1024):>9.1f}"
+            )
+        lines.append("")
+    return "\n".join(lines)
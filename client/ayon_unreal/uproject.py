@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Cached access to Unreal project descriptors (`.uproject` files).
+
+The module does not depend on `unreal`, so it is shared by the launch
+hooks and by the host running inside the Unreal Editor.
+"""
+import json
+import os
+
+_descriptors = {}
+
+
+class UProjectDescriptor:
+    """Parsed Unreal project descriptor.
+
+    The file is parsed on first access and parsed again only when its
+    modification time changes.
+
+    Args:
+        path (str): Path to the `.uproject` file.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.normpath(str(path))
+        self._mtime = None
+        self._data = None
+
+    def _get_data(self):
+        mtime = os.path.getmtime(self.path)
+        if self._data is None or mtime != self._mtime:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._data = json.load(f)
+            self._mtime = mtime
+        return self._data
+
+    @property
+    def data(self):
+        """dict[str, Any]: Content of the project descriptor."""
+        return self._get_data()
+
+    def get_engine_association(self):
+        """Get engine version or id the project is associated with.
+
+        Returns:
+            Optional[str]: Engine association.
+        """
+        return self._get_data().get("EngineAssociation")
+
+    def get_enabled_plugins(self):
+        """Get names of plugins enabled in the project.
+
+        Returns:
+            set[str]: Names of enabled plugins.
+        """
+        return {
+            plugin["Name"]
+            for plugin in self._get_data().get("Plugins") or []
+            if plugin.get("Name") and plugin.get("Enabled", True)
+        }
+
+    def is_plugin_enabled(self, plugin_name):
+        """Check whether plugin is enabled in the project."""
+        return plugin_name in self.get_enabled_plugins()
+
+    def get_modules(self):
+        """Get names of project modules.
+
+        Returns:
+            list[str]: Names of modules.
+        """
+        return [
+            module["Name"]
+            for module in self._get_data().get("Modules") or []
+            if module.get("Name")
+        ]
+
+    def set_engine_association(self, engine_association):
+        """Set engine association and write the descriptor.
+
+        Args:
+            engine_association (str): Engine version or id.
+        """
+        data = self._get_data()
+        data["EngineAssociation"] = engine_association
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+        self._mtime = os.path.getmtime(self.path)
+
+
+def get_project_descriptor(path):
+    """Get cached descriptor of Unreal project file.
+
+    Args:
+        path (Union[str, Path]): Path to the `.uproject` file.
+
+    Returns:
+        UProjectDescriptor: Project descriptor.
+    """
+    path = os.path.normpath(str(path))
+    descriptor = _descriptors.get(path)
+    if descriptor is None:
+        descriptor = UProjectDescriptor(path)
+        _descriptors[path] = descriptor
+    return descriptor
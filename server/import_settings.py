@@ -102,6 +102,16 @@ class UnrealImportModel(BaseSettingsModel):
         False,
         title="Remove loaded assets when deleting layouts"
     )
+    instanced_mesh_threshold: int = SettingsField(
+        0,
+        title="Instance static meshes placed more times than",
+        ge=0,
+        description=(
+            "Static mesh placed by a layout more times than this number is "
+            "loaded as instances of one Hierarchical Instanced Static Mesh "
+            "actor instead of one actor per placement. 0 disables instancing"
+        )
+    )
     delete_unmatched_assets: bool = SettingsField(
         False,
         title="Delete assets that are not matched",
@@ -126,5 +136,6 @@ DEFAULT_IMPORT_SETTINGS = {
     "force_loaded": False,
     "folder_representation_type": "json",
     "remove_loaded_assets": False,
+    "instanced_mesh_threshold": 0,
     "delete_unmatched_assets": False,
 }
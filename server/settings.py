@@ -14,6 +14,13 @@ def _render_format_enum():
     ]
 
 
+def _render_executor_enum():
+    return [
+        {"value": "pie", "label": "In editor (PIE)"},
+        {"value": "local_processes", "label": "Local headless processes"}
+    ]
+
+
 class RenderSetUp(BaseSettingsModel):
     render_queue_path: str = SettingsField(
         "",
@@ -29,11 +36,46 @@ class RenderSetUp(BaseSettingsModel):
         0,
         title="Pre-roll frames"
     )
+    chunk_size: int = SettingsField(
+        0,
+        title="Frames per render chunk",
+        description=(
+            "Split shots into render jobs of at most this many frames, so "
+            "they can be rendered in parallel. Every chunk warms up for "
+            "'Pre-roll frames'. Set to 0 to render whole shots."
+        ),
+        ge=0,
+    )
     render_format: str = SettingsField(
         "png",
         title="Render format",
         enum_resolver=_render_format_enum
     )
+    resume_renders: bool = SettingsField(
+        False,
+        title="Resume local renders",
+        description=(
+            "Skip frames which are already completely rendered in the "
+            "output directory and render only the missing frame ranges."
+        )
+    )
+    render_executor: str = SettingsField(
+        "pie",
+        title="Local render executor",
+        description=(
+            "Render inside the open editor or in parallel headless "
+            "UnrealEditor-Cmd processes, sharded by shots."
+        ),
+        enum_resolver=_render_executor_enum
+    )
+    local_processes: int = SettingsField(
+        2,
+        title="Local render processes",
+        description=(
+            "Number of headless editor processes rendering in parallel"
+        ),
+        ge=1,
+    )
 
 
 class ProjectSetup(BaseSettingsModel):
@@ -66,6 +108,27 @@ class ProjectSetup(BaseSettingsModel):
     )
 
 
+class PublishProfilerModel(BaseSettingsModel):
+    enabled: bool = SettingsField(
+        False,
+        title="Enabled",
+        description=(
+            "Record time, Unreal API calls and memory of each publish "
+            "plugin. Can be enabled also by AYON_UNREAL_PUBLISH_PROFILE "
+            "environment variable."
+        )
+    )
+    report_dir: str = SettingsField(
+        "",
+        title="Report Directory",
+        description=(
+            "Directory publish profile reports are written to. "
+            "Saved/Ayon/PublishProfiles of the Unreal project is used "
+            "when empty."
+        )
+    )
+
+
 class UnrealSettings(BaseSettingsModel):
     imageio: UnrealImageIOModel = SettingsField(
         default_factory=UnrealImageIOModel,
@@ -90,6 +153,10 @@ class UnrealSettings(BaseSettingsModel):
     create: CreatorsModel = SettingsField(
         default_factory=CreatorsModel, title="Creators"
     )
+    publish_profiler: PublishProfilerModel = SettingsField(
+        default_factory=PublishProfilerModel,
+        title="Publish Profiler",
+    )
 
 
 DEFAULT_VALUES = {
@@ -99,7 +166,11 @@ DEFAULT_VALUES = {
         "render_queue_path": "/Game/Ayon/renderQueue",
         "render_config_path": "/Game/Ayon/DefaultMovieRenderQueueConfig.DefaultMovieRenderQueueConfig",
         "preroll_frames": 0,
+        "chunk_size": 0,
         "render_format": "exr",
+        "resume_renders": False,
+        "render_executor": "pie",
+        "local_processes": 2,
     },
     "project_setup": {
         "allow_project_creation": True,
@@ -108,4 +179,8 @@ DEFAULT_VALUES = {
         "force_existing_project": False,
     },
     "create": DEFAULT_CREATOR_SETTINGS,
+    "publish_profiler": {
+        "enabled": False,
+        "report_dir": "",
+    },
 }
@@ -0,0 +1,42 @@
+"""Benchmark of converting layout transforms from their basis.
+
+Compares per-element conversion, as done by loaders before, with batch
+conversion of `convert_basis_matrices` with NumPy, when installed, and
+with its pure Python fallback. The per-element reference inverts the
+basis in Python for each element, loaders did that with `unreal.Matrix`
+which is faster, the difference in the editor is smaller.
+
+    python tests/benchmark_layout_basis.py [element count]
+"""
+import sys
+import time
+
+# Test configuration makes the addon modules importable
+import conftest  # noqa: F401
+from ayon_unreal.api import layout
+from test_layout_basis import convert_per_element, make_elements
+
+
+def _measure(label, function, elements):
+    start = time.perf_counter()
+    function(elements)
+    print(f"{label:<24} {time.perf_counter() - start:8.3f} s")
+
+
+def main(count):
+    elements = make_elements(count)
+    print(f"{count} elements")
+    _measure("per element", convert_per_element, elements)
+    if layout.numpy is not None:
+        _measure("batch with NumPy", layout.convert_basis_matrices, elements)
+    numpy = layout.numpy
+    layout.numpy = None
+    try:
+        _measure(
+            "batch without NumPy", layout.convert_basis_matrices, elements)
+    finally:
+        layout.numpy = numpy
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,144 @@
+"""Test configuration.
+
+Modules of the addon which do not depend on the Unreal Editor are tested
+directly. The `ayon_unreal` package `__init__` imports AYON core, so when
+it is not installed the package is registered without running it and its
+submodules are imported from the client directory.
+
+Modules only available inside the Unreal Editor or AYON launcher (e.g.
+`unreal`, `ayon_api`) are replaced by stub modules when not installed.
+Attributes of stubs starting with upper case are classes, so they can be
+inherited from and checked with `isinstance`, classes named as errors can
+be raised. Other attributes are `MagicMock` objects. Tests replace the
+attributes they depend on.
+"""
+import abc
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+CLIENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "client")
+
+STUBBED_MODULES = {
+    "ayon_api",
+    "ayon_core",
+    "clique",
+    "pyblish",
+    "qtpy",
+    "semver",
+    "unreal",
+}
+# Stubbed modules imported by `from <package> import <module>`
+STUBBED_SUBMODULES = {
+    "ayon_core.pipeline.publish",
+}
+
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+os.environ.setdefault("AYON_UNREAL_VERSION", "5.3.0")
+
+
+def _get_stub_attribute(name):
+    if name.endswith("Error"):
+        return StubMeta(name, (StubClass, Exception), {})
+    if name[:1].isupper():
+        return StubMeta(name, (StubClass,), {})
+    return mock.MagicMock(name=name)
+
+
+class StubMeta(abc.ABCMeta):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = _get_stub_attribute(name)
+        setattr(cls, name, value)
+        return value
+
+
+class StubClass(metaclass=StubMeta):
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = mock.MagicMock(name=name)
+        setattr(self, name, value)
+        return value
+
+
+class StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        module_name = f"{self.__name__}.{name}"
+        if module_name in STUBBED_SUBMODULES:
+            return importlib.import_module(module_name)
+        value = _get_stub_attribute(name)
+        setattr(self, name, value)
+        return value
+
+
+class StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Import stub modules of missing editor only packages."""
+
+    def __init__(self, names):
+        self.names = names
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.split(".")[0] not in self.names:
+            return None
+        return importlib.machinery.ModuleSpec(
+            fullname, self, is_package=True)
+
+    def create_module(self, spec):
+        module = StubModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+_missing = {
+    name for name in STUBBED_MODULES
+    if name not in sys.modules and importlib.util.find_spec(name) is None
+}
+if _missing:
+    sys.meta_path.append(StubFinder(_missing))
+
+if "ayon_core" in _missing:
+    for package_name, package_dir in (
+        ("ayon_unreal", os.path.join(CLIENT_DIR, "ayon_unreal")),
+        ("ayon_unreal.api", os.path.join(CLIENT_DIR, "ayon_unreal", "api")),
+    ):
+        package = types.ModuleType(package_name)
+        package.__path__ = [package_dir]
+        sys.modules.setdefault(package_name, package)
+    sys.modules["ayon_unreal"].UNREAL_ADDON_ROOT = os.path.join(
+        CLIENT_DIR, "ayon_unreal")
+    sys.modules["ayon_unreal"].api = sys.modules["ayon_unreal.api"]
+
+
+@pytest.fixture
+def load_plugin():
+    """Load module of a plugin by its path relative to plugins directory."""
+    def _load_plugin(relative_path):
+        path = os.path.join(
+            CLIENT_DIR, "ayon_unreal", "plugins", relative_path)
+        module_name = os.path.splitext(os.path.basename(path))[0]
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    return _load_plugin
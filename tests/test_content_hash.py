@@ -0,0 +1,107 @@
+"""Tests of detecting unchanged source files of loaded containers."""
+import os
+from unittest import mock
+
+import pytest
+
+from ayon_unreal.api import content_hash, plugin
+
+
+def _write(path, content):
+    with open(path, "wb") as f:
+        f.write(content)
+    return str(path)
+
+
+def _fail_read(path, *args):
+    raise AssertionError(f"{path} should not be read")
+
+
+def test_loaded_source_file_is_not_read(tmp_path, monkeypatch):
+    source = _write(tmp_path / "v001.abc", b"cache" * 1000)
+    monkeypatch.setattr(content_hash, "open", _fail_read, raising=False)
+
+    data = content_hash.get_source_file_data(source)
+
+    assert data["source_path"] == source
+    assert data["source_size"] == "5000"
+    # Files of different size are not read
+    other = _write(tmp_path / "v002.abc", b"cache" * 999)
+    assert not content_hash.is_source_file_unchanged(data, other)
+
+
+def test_changed_content_of_big_file_is_detected(tmp_path):
+    content = bytearray(os.urandom(64 * 1024)) * 16
+    source = _write(tmp_path / "v001.abc", bytes(content))
+    container = content_hash.get_source_file_data(source)
+    # Same size, a few bytes changed far from start and end of the file
+    content[len(content) // 3 + 12345] ^= 0xFF
+    published = _write(tmp_path / "v002.abc", bytes(content))
+
+    assert not content_hash.is_source_file_unchanged(container, published)
+
+
+def test_same_content_in_another_file_is_unchanged(tmp_path):
+    source = _write(tmp_path / "v001.abc", b"cache" * 1000)
+    container = content_hash.get_source_file_data(source)
+    published = _write(tmp_path / "v002.abc", b"cache" * 1000)
+
+    assert content_hash.is_source_file_unchanged(container, published)
+    assert not content_hash.is_source_file_unchanged(
+        container, _write(tmp_path / "v003.abc", b"other" * 1000))
+    assert not content_hash.is_source_file_unchanged(
+        {}, published)
+
+
+def test_hardlinked_file_is_not_read(tmp_path, monkeypatch):
+    source = _write(tmp_path / "v001.abc", b"cache" * 1000)
+    container = content_hash.get_source_file_data(source)
+    published = str(tmp_path / "v002.abc")
+    os.link(source, published)
+    monkeypatch.setattr(content_hash, "open", _fail_read, raising=False)
+
+    assert content_hash.is_source_file_unchanged(container, published)
+
+
+def test_modified_imported_file_is_not_trusted(tmp_path):
+    source = _write(tmp_path / "v001.abc", b"cache" * 1000)
+    container = content_hash.get_source_file_data(source)
+    published = _write(tmp_path / "v002.abc", b"cache" * 1000)
+    # Imported file overwritten after import
+    _write(source, b"other" * 1000)
+    stat = os.stat(source)
+    os.utime(source, (stat.st_atime, stat.st_mtime + 10))
+
+    assert not content_hash.is_source_file_unchanged(container, published)
+    os.remove(source)
+    assert not content_hash.is_source_file_unchanged(container, published)
+
+
+@pytest.mark.parametrize("changed", [False, True])
+def test_update_unchanged_source(tmp_path, monkeypatch, changed):
+    source = _write(tmp_path / "v001.fbx", b"mesh")
+    container = {
+        "namespace": "/Game/Ayon/Assets/hero",
+        "objectName": "hero_CON",
+        **content_hash.get_source_file_data(source),
+    }
+    published = _write(tmp_path / "v002.fbx", b"edit" if changed else b"mesh")
+    imprint = mock.MagicMock()
+    monkeypatch.setattr(plugin, "imprint", imprint)
+    loader = plugin.Loader()
+    loader.filepath_from_context = lambda context: published
+    context = {
+        "project": {"name": "project"},
+        "representation": {"id": "repre-2", "versionId": "version-2"},
+    }
+
+    assert loader.update_unchanged_source(container, context) != changed
+    if changed:
+        imprint.assert_not_called()
+        return
+    imprint.assert_called_once()
+    container_path, data = imprint.call_args.args
+    assert container_path == "/Game/Ayon/Assets/hero/hero_CON"
+    assert data["representation"] == "repre-2"
+    assert data["source_path"] == published
+    assert data["source_file_id"] != container["source_file_id"]
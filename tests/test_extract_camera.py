@@ -0,0 +1,163 @@
+"""Tests of skipping export of unchanged camera sequences."""
+import os
+import types
+from unittest import mock
+
+import pytest
+import unreal
+
+from ayon_unreal.api import content_hash, pipeline
+
+
+class FakePublishedHashes:
+    """Hashes and files of the last published version by representation."""
+
+    published = {}
+
+    def __init__(self, instance):
+        self.instance = instance
+
+    def get_published_file(self, repre_name, content_hash):
+        published = self.published.get(repre_name)
+        if published and published[0] == content_hash:
+            return published[1]
+        return None
+
+    def set_hash(self, repre_name, content_hash):
+        version_data = self.instance.data.setdefault("versionData", {})
+        version_data[repre_name] = content_hash
+
+
+def _make_sequence(name):
+    sequence = mock.MagicMock()
+    sequence.get_name.return_value = name
+    sequence.get_path_name.return_value = f"/Game/Ayon/{name}.{name}"
+    sequence.get_outermost.return_value.get_name.return_value = (
+        f"/Game/Ayon/{name}")
+    return sequence
+
+
+@pytest.fixture
+def camera_extractor(load_plugin, monkeypatch, tmp_path):
+    plugin = load_plugin(os.path.join("publish", "extract_camera.py"))
+    world = mock.MagicMock()
+    world.get_path_name.return_value = "/Game/Ayon/sh010_map.sh010_map"
+    world.get_outermost.return_value.get_name.return_value = (
+        "/Game/Ayon/sh010_map")
+    monkeypatch.setattr(
+        plugin, "UNREAL_VERSION",
+        types.SimpleNamespace(major=5, minor=3))
+    monkeypatch.setattr(
+        unreal, "UnrealEditorSubsystem",
+        lambda: types.SimpleNamespace(get_editor_world=lambda: world))
+
+    content_dir = tmp_path / "Content"
+    (content_dir / "Ayon").mkdir(parents=True)
+    (content_dir / "Ayon" / "sh010_map.umap").write_bytes(b"level")
+    sequences = {}
+    for name in ("cam_a", "cam_b"):
+        (content_dir / "Ayon" / f"{name}.uasset").write_bytes(name.encode())
+        sequences[f"/Game/Ayon/{name}.{name}"] = {
+            "sequence": _make_sequence(name),
+            "tracks": [],
+            "frame_range": (1001, 1100),
+            "state": (False, 1.0, 5),
+        }
+    monkeypatch.setattr(
+        plugin, "get_level_sequence_cache",
+        lambda context: types.SimpleNamespace(get=sequences.get))
+    monkeypatch.setattr(
+        unreal.Paths, "project_content_dir", lambda: f"{content_dir}/")
+    monkeypatch.setattr(
+        unreal.Paths, "convert_relative_path_to_full", lambda path: path)
+    monkeypatch.setattr(pipeline, "get_dirty_package_names", set)
+    monkeypatch.setattr(
+        plugin, "PublishedContentHashes", FakePublishedHashes)
+    monkeypatch.setattr(FakePublishedHashes, "published", {})
+    monkeypatch.setattr(content_hash, "create_hard_link", os.link)
+
+    extractor = plugin.ExtractCamera()
+    exported = []
+
+    def export_sequence(world, sequence_info, fbx_path):
+        exported.append(sequence_info["sequence"].get_name())
+        with open(fbx_path, "w") as f:
+            f.write(sequence_info["sequence"].get_name())
+
+    extractor.export_sequence = export_sequence
+    extractor.exported = exported
+    extractor.sequences = sequences
+    extractor.content_dir = content_dir
+    return extractor
+
+
+def _publish(extractor, tmp_path, version):
+    staging_dir = tmp_path / f"v{version:03d}"
+    staging_dir.mkdir()
+    extractor.staging_dir = lambda instance: str(staging_dir)
+    extractor.exported.clear()
+    instance = types.SimpleNamespace(
+        name="cameraMain",
+        context=types.SimpleNamespace(data={}),
+        data={
+            "level": "/Game/Ayon/sh010_map.sh010_map",
+            "members": list(extractor.sequences),
+            "clipIn": 1001,
+            "clipOut": 1100,
+        },
+    )
+    extractor.process(instance)
+    # Integrate the version
+    for representation in instance.data["representations"]:
+        repre_name = representation["name"]
+        version_data = instance.data.get("versionData", {})
+        FakePublishedHashes.published[repre_name] = (
+            version_data.get(repre_name),
+            os.path.join(staging_dir, representation["files"])
+        )
+    return instance
+
+
+def test_unchanged_sequences_are_not_exported(camera_extractor, tmp_path):
+    _publish(camera_extractor, tmp_path, 1)
+    assert camera_extractor.exported == ["cam_a", "cam_b"]
+
+    instance = _publish(camera_extractor, tmp_path, 2)
+    assert camera_extractor.exported == []
+    staged = os.path.join(
+        instance.data["representations"][0]["stagingDir"],
+        "cameraMain_cam_a.fbx")
+    with open(staged) as f:
+        assert f.read() == "cam_a"
+    # Keys are not read, saved package stands for the sequence content
+    sequence = camera_extractor.sequences["/Game/Ayon/cam_a.cam_a"]
+    sequence["sequence"].get_bindings.assert_not_called()
+
+    (camera_extractor.content_dir / "Ayon" / "cam_b.uasset").write_bytes(
+        b"edited")
+    _publish(camera_extractor, tmp_path, 3)
+    assert camera_extractor.exported == ["cam_b"]
+
+
+def test_dirty_sequences_are_exported(camera_extractor, tmp_path):
+    _publish(camera_extractor, tmp_path, 1)
+    sequence_info = camera_extractor.sequences["/Game/Ayon/cam_a.cam_a"]
+    sequence_info["state"] = (True, 1.0, 5)
+
+    instance = _publish(camera_extractor, tmp_path, 2)
+
+    assert camera_extractor.exported == ["cam_a"]
+    assert list(instance.data["versionData"]) == ["fbx_cam_b"]
+
+
+def test_saved_level_changes_fingerprint(camera_extractor, tmp_path):
+    _publish(camera_extractor, tmp_path, 1)
+    level_file = camera_extractor.content_dir / "Ayon" / "sh010_map.umap"
+    # Camera actor moved in the level and the level saved
+    level_file.write_bytes(b"edited level")
+    stat = level_file.stat()
+    os.utime(level_file, (stat.st_atime, stat.st_mtime + 10))
+
+    _publish(camera_extractor, tmp_path, 2)
+
+    assert camera_extractor.exported == ["cam_a", "cam_b"]
@@ -0,0 +1,151 @@
+"""Tests of exporting static meshes into FBX files."""
+import os
+import types
+
+import pytest
+import unreal
+
+from ayon_unreal.api import content_hash
+
+
+class FakePublishedHashes:
+    """Hashes and files of the last published version by representation."""
+
+    published = {}
+
+    def __init__(self, instance):
+        self.instance = instance
+
+    def get_published_file(self, repre_name, file_hash):
+        published = self.published.get(repre_name)
+        if published and published[0] == file_hash:
+            return published[1]
+        return None
+
+    def set_hash(self, repre_name, file_hash):
+        version_data = self.instance.data.setdefault("versionData", {})
+        version_data[repre_name] = file_hash
+
+
+def _make_package(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+@pytest.fixture
+def extractor(load_plugin, monkeypatch, tmp_path):
+    plugin = load_plugin(os.path.join("publish", "extract_fbx.py"))
+    assets = {}
+    dirty_packages = set()
+    batches = []
+
+    def get_asset(member):
+        name, system_path = assets[member]
+        return types.SimpleNamespace(
+            get_name=lambda: name,
+            get_path_name=lambda: member,
+            system_path=system_path,
+        )
+
+    def run_asset_export_tasks(tasks):
+        batches.append([task.object.get_path_name() for task in tasks])
+        for task in tasks:
+            with open(task.filename, "w") as f:
+                f.write(task.object.get_name())
+
+    monkeypatch.setattr(
+        plugin, "get_scene_snapshot",
+        lambda context: types.SimpleNamespace(
+            get_asset=get_asset,
+            get_asset_data=lambda member: types.SimpleNamespace(
+                package_name=member.split(".")[0]),
+        )
+    )
+    monkeypatch.setattr(
+        plugin, "get_dirty_package_names", lambda: set(dirty_packages))
+    monkeypatch.setattr(
+        unreal.SystemLibrary, "get_system_path",
+        lambda asset: asset.system_path)
+    monkeypatch.setattr(
+        unreal, "Exporter",
+        types.SimpleNamespace(run_asset_export_tasks=run_asset_export_tasks))
+    monkeypatch.setattr(
+        plugin, "PublishedContentHashes", FakePublishedHashes)
+    monkeypatch.setattr(FakePublishedHashes, "published", {})
+    monkeypatch.setattr(content_hash, "create_hard_link", os.link)
+
+    extractor = plugin.ExtractFbx()
+    extractor.assets = assets
+    extractor.dirty_packages = dirty_packages
+    extractor.batches = batches
+    extractor.module = plugin
+    return extractor
+
+
+def _publish(extractor, tmp_path, version):
+    staging_dir = tmp_path / f"v{version:03d}"
+    staging_dir.mkdir()
+    extractor.staging_dir = lambda instance: str(staging_dir)
+    extractor.batches.clear()
+    instance = types.SimpleNamespace(
+        name="staticMeshMain",
+        context=None,
+        data={"members": list(extractor.assets)},
+    )
+    extractor.process(instance)
+    # Integrate the version
+    version_data = instance.data.get("versionData", {})
+    for representation in instance.data["representations"]:
+        repre_name = representation["name"]
+        FakePublishedHashes.published[repre_name] = (
+            version_data.get(repre_name),
+            os.path.join(staging_dir, representation["files"])
+        )
+    return instance
+
+
+def test_unchanged_members_are_not_exported(extractor, tmp_path):
+    content = tmp_path / "Content"
+    rock = _make_package(str(content / "Props" / "Rock.uasset"), b"rock")
+    tree = _make_package(str(content / "Props" / "Tree.uasset"), b"tree")
+    extractor.assets.update({
+        "/Game/Props/Rock.Rock": ("Rock", rock),
+        "/Game/Props/Tree.Tree": ("Tree", tree),
+    })
+
+    instance = _publish(extractor, tmp_path, 1)
+    # All members are exported in one batch
+    assert extractor.batches == [
+        ["/Game/Props/Rock.Rock", "/Game/Props/Tree.Tree"]]
+    assert [repre["name"] for repre in instance.data["representations"]] \
+        == ["fbx_Rock", "fbx_Tree"]
+
+    _make_package(rock, b"edited rock")
+    instance = _publish(extractor, tmp_path, 2)
+    assert extractor.batches == [["/Game/Props/Rock.Rock"]]
+    staging_dir = instance.data["representations"][0]["stagingDir"]
+    assert os.path.samefile(
+        os.path.join(staging_dir, "staticMeshMain_Tree.fbx"),
+        tmp_path / "v001" / "staticMeshMain_Tree.fbx")
+
+    # Unsaved changes are not in the package file, member is exported
+    extractor.dirty_packages.add("/Game/Props/Tree")
+    instance = _publish(extractor, tmp_path, 3)
+    assert extractor.batches == [["/Game/Props/Tree.Tree"]]
+    assert list(instance.data["versionData"]) == ["fbx_Rock"]
+
+
+def test_members_with_same_name_are_rejected(extractor, tmp_path):
+    extractor.assets.update({
+        "/Game/A/Rock.Rock": ("Rock", _make_package(
+            str(tmp_path / "Content" / "A" / "Rock.uasset"), b"a")),
+        "/Game/B/Rock.Rock": ("Rock", _make_package(
+            str(tmp_path / "Content" / "B" / "Rock.uasset"), b"b")),
+    })
+
+    with pytest.raises(extractor.module.KnownPublishError):
+        _publish(extractor, tmp_path, 1)
+    assert not os.listdir(tmp_path / "v001")
+    assert not extractor.batches
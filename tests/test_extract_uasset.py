@@ -0,0 +1,117 @@
+"""Tests of extracting package files of assets."""
+import os
+import types
+
+import pytest
+import unreal
+
+from ayon_unreal.api import content_hash
+
+
+class FakePublishedHashes:
+    """Published files of the last version by representation and hash."""
+
+    published = {}
+
+    def __init__(self, instance):
+        self.instance = instance
+
+    def get_published_file(self, repre_name, file_hash):
+        return self.published.get((repre_name, file_hash))
+
+    def set_hash(self, repre_name, file_hash):
+        pass
+
+
+def _make_package(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+@pytest.fixture
+def extractor(load_plugin, monkeypatch, tmp_path):
+    plugin = load_plugin(os.path.join("publish", "extract_uasset.py"))
+    assets = {}
+
+    def get_asset(member):
+        asset = assets[member]
+        return types.SimpleNamespace(
+            get_name=lambda: asset[0], system_path=asset[1])
+
+    monkeypatch.setattr(
+        plugin, "get_scene_snapshot",
+        lambda context: types.SimpleNamespace(get_asset=get_asset))
+    monkeypatch.setattr(
+        unreal.SystemLibrary, "get_system_path",
+        lambda asset: asset.system_path)
+    monkeypatch.setattr(
+        plugin, "PublishedContentHashes", FakePublishedHashes)
+    monkeypatch.setattr(FakePublishedHashes, "published", {})
+    monkeypatch.setattr(content_hash, "create_hard_link", os.link)
+
+    extractor = plugin.ExtractUAsset()
+    staging_dir = tmp_path / "staging"
+    staging_dir.mkdir()
+    extractor.staging_dir = lambda instance: str(staging_dir)
+    extractor.assets = assets
+    extractor.module = plugin
+    return extractor
+
+
+def _make_instance(members):
+    return types.SimpleNamespace(
+        context=None,
+        data={"families": ["uasset"], "members": members},
+    )
+
+
+def test_extract_uasset_copies_project_packages(extractor, tmp_path):
+    content = tmp_path / "Content"
+    changed = _make_package(
+        str(content / "Props" / "Changed.uasset"), b"changed")
+    unchanged = _make_package(
+        str(content / "Props" / "Unchanged.uasset"), b"unchanged")
+    published = _make_package(
+        str(tmp_path / "publish" / "Unchanged.uasset"), b"unchanged")
+    FakePublishedHashes.published[
+        ("uasset_Unchanged", content_hash.get_file_hash(unchanged))
+    ] = published
+    extractor.assets.update({
+        "/Game/Props/Changed.Changed": ("Changed", changed),
+        "/Game/Props/Unchanged.Unchanged": ("Unchanged", unchanged),
+    })
+    instance = _make_instance(list(extractor.assets))
+
+    extractor.process(instance)
+
+    representations = instance.data["representations"]
+    assert [repre["name"] for repre in representations] == [
+        "uasset_Changed", "uasset_Unchanged"]
+    staging_dir = representations[0]["stagingDir"]
+    staged_changed = os.path.join(staging_dir, "Changed.uasset")
+    staged_unchanged = os.path.join(staging_dir, "Unchanged.uasset")
+    with open(staged_changed, "rb") as f:
+        assert f.read() == b"changed"
+    # Package of the project is never linked into staging
+    assert not os.path.samefile(staged_changed, changed)
+    assert os.path.samefile(staged_unchanged, published)
+
+
+def test_extract_uasset_rejects_members_with_same_name(
+    extractor, tmp_path
+):
+    first = _make_package(
+        str(tmp_path / "Content" / "A" / "Rock.uasset"), b"a")
+    second = _make_package(
+        str(tmp_path / "Content" / "B" / "Rock.uasset"), b"b")
+    extractor.assets.update({
+        "/Game/A/Rock.Rock": ("Rock", first),
+        "/Game/B/Rock.Rock": ("Rock", second),
+    })
+    instance = _make_instance(list(extractor.assets))
+
+    with pytest.raises(extractor.module.KnownPublishError):
+        extractor.process(instance)
+    assert not os.listdir(extractor.staging_dir(instance))
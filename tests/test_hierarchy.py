@@ -0,0 +1,322 @@
+"""Tests of sequence hierarchy building and folder lookups."""
+import copy
+from unittest import mock
+
+import unreal
+
+from ayon_unreal.api import hierarchy, pipeline
+
+SHOT_COUNT = 50
+
+
+def _element(name, *children):
+    return {"name": name, "children": list(children)}
+
+
+def _make_sequence(path):
+    sequence = mock.MagicMock(name=path)
+    sequence.get_path_name.return_value = path
+    sequence.get_tracks.return_value = []
+    return sequence
+
+
+def _make_track():
+    track = mock.MagicMock()
+    sections = []
+
+    def add_section():
+        section = mock.MagicMock()
+        sections.append(section)
+        return section
+
+    track.add_section.side_effect = add_section
+    track.get_sections.side_effect = lambda: list(sections)
+    return track
+
+
+def test_plan_hierarchy_links_each_parent_once(monkeypatch):
+    existing = {"/Game/Ayon/ep01/ep01.ep01"}
+    monkeypatch.setattr(
+        unreal.EditorAssetLibrary, "does_asset_exist",
+        lambda path: path in existing)
+    element = _element(
+        "ep01",
+        _element("sq01", _element("sh010"), _element("sh020")),
+        _element("sq02", _element("sh030")),
+    )
+
+    operations = hierarchy._plan_hierarchy(element, "/Game/Ayon")
+
+    created = [
+        (operation["type"], operation["name"])
+        for operation in operations if operation["type"] != "link"
+    ]
+    assert ("sequence", "ep01") not in created
+    assert sorted(created) == sorted([
+        ("sequence", "sq01"), ("sequence", "sh010"), ("level", "sh010"),
+        ("sequence", "sh020"), ("level", "sh020"),
+        ("sequence", "sq02"), ("sequence", "sh030"), ("level", "sh030"),
+    ])
+    links = {
+        operation["parent"]: operation["children"]
+        for operation in operations if operation["type"] == "link"
+    }
+    # Links run after all sequences and levels are created
+    assert [operation["type"] for operation in operations[-len(links):]] \
+        == ["link"] * len(links)
+    assert len(links) == 3
+    assert links["/Game/Ayon/ep01/ep01.ep01"] == {
+        "/Game/Ayon/ep01/sq01/sq01.sq01": [
+            "/Game/Ayon/ep01/sq01/sh010/sh010_map.sh010_map",
+            "/Game/Ayon/ep01/sq01/sh020/sh020_map.sh020_map",
+        ],
+        "/Game/Ayon/ep01/sq02/sq02.sq02": [
+            "/Game/Ayon/ep01/sq02/sh030/sh030_map.sh030_map",
+        ],
+    }
+    assert links["/Game/Ayon/ep01/sq01/sq01.sq01"] == {
+        "/Game/Ayon/ep01/sq01/sh010/sh010.sh010": [
+            "/Game/Ayon/ep01/sq01/sh010/sh010_map.sh010_map",
+        ],
+        "/Game/Ayon/ep01/sq01/sh020/sh020.sh020": [
+            "/Game/Ayon/ep01/sq01/sh020/sh020_map.sh020_map",
+        ],
+    }
+
+
+def test_plan_hierarchy_of_built_hierarchy_only_links(monkeypatch):
+    monkeypatch.setattr(
+        unreal.EditorAssetLibrary, "does_asset_exist", lambda path: True)
+    element = _element("sq01", _element("sh010"))
+
+    operations = hierarchy._plan_hierarchy(element, "/Game/Ayon")
+
+    assert [operation["type"] for operation in operations] == ["link"]
+
+
+def test_link_child_sequences_does_not_load_levels(monkeypatch):
+    asset_registry = mock.MagicMock()
+    asset_registry.get_asset_by_object_path.return_value.is_valid \
+        .return_value = False
+    monkeypatch.setattr(
+        unreal.AssetRegistryHelpers, "get_asset_registry",
+        lambda: asset_registry)
+    load_level = mock.MagicMock()
+    monkeypatch.setattr(unreal.EditorLevelLibrary, "load_level", load_level)
+    tracks = {}
+    monkeypatch.setattr(pipeline, "get_tracks", lambda sequence: [])
+    monkeypatch.setattr(
+        pipeline, "add_track",
+        lambda sequence, track_class: tracks.setdefault(
+            track_class, _make_track()))
+
+    maps = [
+        f"/Game/Ayon/sq01/sh{index:03d}/sh{index:03d}_map.sh{index:03d}_map"
+        for index in range(SHOT_COUNT)
+    ]
+    children = [
+        {
+            "sequence": _make_sequence(f"/Game/Ayon/sq01/sh{index:03d}"),
+            "frame_start": index * 10 + 1,
+            "frame_end": index * 10 + 10,
+            "maps": [level],
+        }
+        for index, level in enumerate(maps)
+    ]
+    # Child listed twice is linked once with levels of both entries
+    children.append(dict(children[0], maps=[maps[0], maps[1]]))
+    pipeline.link_child_sequences(
+        _make_sequence("/Game/Ayon/sq01/sq01"), children, SHOT_COUNT * 10)
+
+    load_level.assert_not_called()
+    subscene_track = tracks[unreal.MovieSceneSubTrack]
+    visibility_track = tracks[unreal.MovieSceneLevelVisibilityTrack]
+    assert subscene_track.add_section.call_count == SHOT_COUNT
+    # Lookup of each level name once
+    assert asset_registry.get_asset_by_object_path.call_count == SHOT_COUNT
+    level_names = [
+        section.set_level_names.call_args.args[0]
+        for section in visibility_track.get_sections()
+    ]
+    assert level_names[0] == ["sh000_map", "sh001_map"]
+    # Visible section with hidden sections before and after it, except
+    # before the first and after the last child
+    assert len(level_names) == 2 + (SHOT_COUNT - 2) * 3 + 2
+
+
+def test_get_level_name_prefers_asset_registry(monkeypatch):
+    asset_data = mock.MagicMock(asset_name="sh010_level")
+    asset_data.is_valid.return_value = True
+    asset_registry = mock.MagicMock()
+    asset_registry.get_asset_by_object_path.return_value = asset_data
+    monkeypatch.setattr(
+        unreal.AssetRegistryHelpers, "get_asset_registry",
+        lambda: asset_registry)
+
+    assert pipeline.get_level_name(
+        "/Game/Ayon/sh010/sh010_map.sh010_map") == "sh010_level"
+    asset_data.is_valid.return_value = False
+    assert pipeline.get_level_name(
+        "/Game/Ayon/sh010/sh010_map.sh010_map") == "sh010_map"
+
+
+class FakeServer:
+    """Stand-in for AYON server answering folder queries."""
+
+    def __init__(self, folders):
+        self.folders = folders
+        self.requests = []
+
+    def get_folders(self, project_name, folder_paths=None, fields=None):
+        self.requests.append((project_name, set(folder_paths), fields))
+        for folder in self.folders:
+            if folder["path"] in folder_paths:
+                yield {"path": folder["path"], "attrib": folder["attrib"]}
+
+
+def _folder(path, clip_in, clip_out, fps=25.0):
+    return {
+        "path": path,
+        "attrib": {"clipIn": clip_in, "clipOut": clip_out, "fps": fps},
+    }
+
+
+def test_get_folder_attributes_by_path_in_one_request(monkeypatch):
+    server = FakeServer([
+        _folder("/ep01", 1, 200),
+        _folder("/ep01/sq01", 1, 100),
+        _folder("/ep02", 1, 50),
+    ])
+    monkeypatch.setattr(
+        pipeline.ayon_api, "get_folders", server.get_folders)
+
+    attributes = pipeline.get_folder_attributes_by_path(
+        "project", ["ep01/", "/ep01/sq01", "/ep01", "/missing"])
+
+    assert attributes == {
+        "/ep01": {"clipIn": 1, "clipOut": 200, "fps": 25.0},
+        "/ep01/sq01": {"clipIn": 1, "clipOut": 100, "fps": 25.0},
+    }
+    assert len(server.requests) == 1
+    assert server.requests[0][1] == {"/ep01", "/ep01/sq01", "/missing"}
+    assert pipeline.get_folder_attributes_by_path("project", []) == {}
+    assert len(server.requests) == 1
+
+
+def test_run_plan_prefetches_folder_attributes(monkeypatch):
+    server = FakeServer([
+        _folder("/sq01", 1, 30),
+        _folder("/sq01/sh010", 1, 10),
+        _folder("/sq01/sh020", 11, 30),
+    ])
+    monkeypatch.setattr(
+        pipeline.ayon_api, "get_folders", server.get_folders)
+    monkeypatch.setattr(
+        unreal.EditorAssetLibrary, "does_asset_exist", lambda path: False)
+    slow_task = mock.MagicMock()
+    slow_task.__enter__.return_value.should_cancel.return_value = False
+    monkeypatch.setattr(unreal, "ScopedSlowTask", lambda *args: slow_task)
+    monkeypatch.setattr(hierarchy, "_create_level", mock.MagicMock())
+    monkeypatch.setattr(hierarchy, "_link_children", mock.MagicMock())
+    created = {}
+
+    def generate_sequence(name, h_dir, folder_attributes_by_path=None):
+        attributes = folder_attributes_by_path.get(
+            pipeline.get_sequence_folder_path(h_dir))
+        created[name] = (attributes["clipIn"], attributes["clipOut"])
+        return _make_sequence(f"{h_dir}/{name}.{name}"), created[name]
+
+    monkeypatch.setattr(hierarchy, "generate_sequence", generate_sequence)
+    operations = hierarchy._plan_hierarchy(
+        _element("sq01", _element("sh010"), _element("sh020")),
+        "/Game/Ayon")
+
+    assert hierarchy._run_plan(operations, "/Game/Ayon/sq01/sq01_map", "p")
+    assert len(server.requests) == 1
+    assert created == {"sq01": (1, 30), "sh010": (1, 10), "sh020": (11, 30)}
+
+
+def test_generate_sequence_uses_prefetched_attributes(monkeypatch):
+    server = FakeServer([])
+    monkeypatch.setattr(
+        pipeline.ayon_api, "get_folders", server.get_folders)
+    sequence = _make_sequence("/Game/Ayon/sq01/sh010/sh010.sh010")
+    asset_tools = mock.MagicMock()
+    asset_tools.create_asset.return_value = sequence
+    monkeypatch.setattr(
+        unreal.AssetToolsHelpers, "get_asset_tools",
+        lambda self: asset_tools)
+
+    _, frame_range = pipeline.generate_sequence(
+        "sh010", "/Game/Ayon/sq01/sh010",
+        {"/sq01/sh010": {"clipIn": 1001, "clipOut": 1050, "fps": 24.0}})
+
+    assert frame_range == (1001, 1050)
+    sequence.set_playback_start.assert_called_once_with(1001)
+    assert not server.requests
+
+
+class FakeHierarchyServer:
+    """Stand-in for AYON server answering folder hierarchy queries."""
+
+    def __init__(self, hierarchy):
+        self.hierarchy = hierarchy
+        self.updated_at = {}
+        self.hierarchy_requests = 0
+
+    def _iter_paths(self, elements, parent_path=""):
+        for element in elements:
+            path = f"{parent_path}/{element['name']}"
+            yield path
+            yield from self._iter_paths(element["children"], path)
+
+    def get_folders(self, project_name, fields=None):
+        for path in self._iter_paths(self.hierarchy):
+            yield {"updatedAt": self.updated_at.get(path, "2026-01-01")}
+
+    def get_folders_hierarchy(self, project_name=None):
+        self.hierarchy_requests += 1
+        return {"hierarchy": copy.deepcopy(self.hierarchy)}
+
+
+def test_folder_hierarchy_cache_refetches_changed_folders(monkeypatch):
+    server = FakeHierarchyServer(
+        [_element("sq01", _element("sh010"))])
+    monkeypatch.setattr(hierarchy, "get_folders", server.get_folders)
+    monkeypatch.setattr(
+        hierarchy, "get_folders_hierarchy", server.get_folders_hierarchy)
+    cache = hierarchy.FolderHierarchyCache()
+
+    assert cache.find("project", "/sq01")["name"] == "sq01"
+    assert cache.find("project", "sq01/sh010")["name"] == "sh010"
+    assert server.hierarchy_requests == 1
+
+    # Shot created under the cached sequence
+    server.hierarchy[0]["children"].append(_element("sh020"))
+    sequence = cache.find("project", "/sq01")
+    assert [child["name"] for child in sequence["children"]] == [
+        "sh010", "sh020"]
+    assert server.hierarchy_requests == 2
+
+    # Shot renamed
+    server.hierarchy[0]["children"][1]["name"] = "sh030"
+    server.updated_at["/sq01/sh030"] = "2026-02-01"
+    assert cache.find("project", "/sq01/sh020") is None
+    assert cache.find("project", "/sq01/sh030")["name"] == "sh030"
+    assert server.hierarchy_requests == 3
+
+
+def test_folder_selector_filters_when_typing_pauses():
+    selector = hierarchy.FolderSelector.__new__(hierarchy.FolderSelector)
+    selector._filter_timer = mock.MagicMock()
+    selector._folders_widget = mock.MagicMock()
+    selector._folders_filter_text = mock.MagicMock()
+    selector._folders_filter_text.text.return_value = "sh01"
+
+    for text in ("s", "sh", "sh0", "sh01"):
+        selector._on_filter_text_changed(text)
+
+    assert selector._filter_timer.start.call_count == 4
+    selector._folders_widget.set_name_filter.assert_not_called()
+    selector._on_filter_timer()
+    selector._folders_widget.set_name_filter.assert_called_once_with("sh01")
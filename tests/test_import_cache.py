@@ -0,0 +1,162 @@
+"""Tests of the project wide cache of imported representations."""
+import json
+from unittest import mock
+
+import pytest
+import unreal
+
+from ayon_unreal.api import import_cache, plugin
+
+
+@pytest.fixture
+def tick_callbacks(monkeypatch):
+    callbacks = {}
+
+    def register(callback):
+        handle = len(callbacks)
+        callbacks[handle] = callback
+        return handle
+
+    monkeypatch.setattr(unreal, "register_slate_post_tick_callback", register)
+    monkeypatch.setattr(
+        unreal, "unregister_slate_post_tick_callback", callbacks.pop)
+    return callbacks
+
+
+def _tick(callbacks):
+    for callback in list(callbacks.values()):
+        callback(0.1)
+
+
+def test_import_cache_is_written_once_per_tick(
+    tmp_path, monkeypatch, tick_callbacks
+):
+    path = tmp_path / "Saved" / "Ayon" / import_cache.IMPORT_CACHE_FILE
+    cache = import_cache.ImportCache(str(path))
+    save = mock.MagicMock(wraps=cache._save)
+    monkeypatch.setattr(cache, "_save", save)
+
+    for index in range(200):
+        cache.add(f"key{index}", f"/Game/Ayon/Assets/a{index}", "a_CON")
+
+    assert not path.exists()
+    assert len(tick_callbacks) == 1
+    _tick(tick_callbacks)
+    _tick(tick_callbacks)
+    assert save.call_count == 1
+    assert not tick_callbacks
+    with open(path) as f:
+        assert len(json.load(f)) == 200
+
+    cache.add("key200", "/Game/Ayon/Assets/a200", "a_CON")
+    cache.flush()
+    assert save.call_count == 2
+    assert not tick_callbacks
+    reloaded = import_cache.ImportCache(str(path))
+    assert len(reloaded._get_entries()) == 201
+
+
+def test_stale_entries_are_removed(tmp_path, monkeypatch, tick_callbacks):
+    path = tmp_path / import_cache.IMPORT_CACHE_FILE
+    cache = import_cache.ImportCache(str(path))
+    cache.add("key", "/Game/Ayon/Assets/a", "a_CON")
+    cache.flush()
+    monkeypatch.setattr(
+        unreal.EditorAssetLibrary, "does_asset_exist", lambda path: False)
+
+    assert cache.get("key", "repre-1") is None
+    _tick(tick_callbacks)
+    with open(path) as f:
+        assert json.load(f) == {}
+
+
+class FakeContent:
+    """Containers in content directories with their metadata."""
+
+    def __init__(self):
+        self.containers = {}
+
+    def list_containers(self, directory):
+        return [
+            path for path in self.containers
+            if path.rsplit("/", 1)[0] == directory
+        ]
+
+    def create_unique_asset_name(self, base_path, suffix=""):
+        index = 1
+        while f"{base_path}_{index}" in self.containers:
+            index += 1
+        name = f"{base_path}_{index}".rsplit("/", 1)[1]
+        return f"{base_path}_{index}", name
+
+    def get_assets(self, ar_filter):
+        return [
+            mock.MagicMock(asset_name=path.rsplit("/", 1)[1])
+            for path in self.list_containers(
+                ar_filter.kwargs["package_paths"][0])
+        ]
+
+    def delete_directory(self, directory):
+        for path in self.list_containers(directory):
+            self.containers.pop(path)
+
+
+@pytest.fixture
+def content(monkeypatch, tick_callbacks, tmp_path):
+    content = FakeContent()
+    library = unreal.EditorAssetLibrary
+    monkeypatch.setattr(
+        library, "does_asset_exist", lambda path: path in content.containers)
+    monkeypatch.setattr(library, "load_asset", lambda path: path)
+    monkeypatch.setattr(
+        library, "get_metadata_tag",
+        lambda path, tag: content.containers[path].get(tag))
+    monkeypatch.setattr(
+        library, "get_metadata_tag_values",
+        lambda path: dict(content.containers[path]))
+    monkeypatch.setattr(
+        library, "list_assets",
+        lambda directory, **kwargs: content.list_containers(directory))
+    monkeypatch.setattr(
+        library, "does_directory_exist",
+        lambda directory: bool(content.list_containers(directory)))
+    monkeypatch.setattr(library, "delete_asset", content.containers.pop)
+    monkeypatch.setattr(library, "delete_directory", content.delete_directory)
+    monkeypatch.setattr(
+        unreal.AssetToolsHelpers, "get_asset_tools", lambda self: content)
+    monkeypatch.setattr(
+        unreal.AssetRegistryHelpers, "get_asset_registry", lambda: content)
+    monkeypatch.setattr(
+        plugin, "create_container",
+        lambda container, path: content.containers.setdefault(
+            f"{path}/{container}", {}))
+    monkeypatch.setattr(
+        plugin, "imprint",
+        lambda path, data: content.containers[path].update(data))
+    cache = import_cache.ImportCache(
+        str(tmp_path / import_cache.IMPORT_CACHE_FILE))
+    monkeypatch.setattr(plugin, "get_import_cache", lambda: cache)
+    return content
+
+
+def test_cached_import_creates_container_of_load(content):
+    asset_dir = "/Game/Ayon/Assets/hero"
+    content.containers[f"{asset_dir}/hero_CON"] = {
+        "representation": "repre-1", "namespace": asset_dir}
+    loader = plugin.Loader()
+    context = {"representation": {"id": "repre-1"}}
+    loader.cache_import(context, asset_dir, "hero_CON")
+
+    loaded = loader.get_cached_import(context)
+
+    assert loaded == [f"{asset_dir}/hero_CON", f"{asset_dir}/hero_CON_1"]
+    assert content.containers[f"{asset_dir}/hero_CON_1"] == {
+        "representation": "repre-1", "namespace": asset_dir}
+
+    # Directory is kept while another load uses it
+    loader.remove_container_directory(
+        {"namespace": asset_dir, "objectName": "hero_CON"})
+    assert list(content.containers) == [f"{asset_dir}/hero_CON_1"]
+    loader.remove_container_directory(
+        {"namespace": asset_dir, "objectName": "hero_CON_1"})
+    assert not content.containers
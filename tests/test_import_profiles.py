@@ -0,0 +1,44 @@
+"""Tests of import profiles building loader import options."""
+import types
+
+import pytest
+
+from ayon_unreal.api import import_profiles
+
+
+@pytest.fixture(autouse=True)
+def clear_templates(monkeypatch):
+    monkeypatch.setattr(
+        import_profiles, "UNREAL_VERSION",
+        types.SimpleNamespace(major=5, minor=3))
+    import_profiles.clear_options_templates()
+    yield
+    import_profiles.clear_options_templates()
+
+
+def test_abc_skeletal_mesh_keeps_default_material_settings():
+    default = import_profiles.get_options_template(
+        "abc_skeletal_mesh", material_settings="create_materials")
+    assert "material_settings" not in default.properties
+    assert "conversion_settings" not in default.properties
+
+    converted = import_profiles.get_options_template(
+        "abc_skeletal_mesh",
+        conversion_preset="maya",
+        material_settings="create_materials"
+    )
+    material_settings = converted.properties["material_settings"]
+    assert material_settings.kwargs == {
+        "create_materials": True, "find_materials": False}
+
+
+def test_options_templates_are_cached_by_arguments():
+    template = import_profiles.get_options_template(
+        "abc_static_mesh", conversion_preset="maya", merge_meshes=True)
+
+    assert import_profiles.get_options_template(
+        "abc_static_mesh", merge_meshes=True, conversion_preset="maya"
+    ) is template
+    assert import_profiles.get_options_template(
+        "abc_static_mesh", conversion_preset="maya", merge_meshes=False
+    ) is not template
@@ -0,0 +1,222 @@
+"""Tests of reading and comparing layout representations."""
+import io
+import json
+
+import pytest
+
+from ayon_unreal.api import layout
+
+LAYOUT_JSON = """
+[
+    {"instance_name": "tree", "transform_matrix": [[1.5, 0, 0, 0],
+        [0, 1, 0, 0], [0, 0, 1, 0], [-12.25e2, 3.0E-1, 1000000, 1]]},
+    {"instance_name": "rock [1], \\"big\\"", "rotation":
+        {"x": 0.1, "y": -90, "z": 180.5}, "host": ["unreal"]},
+    {"instance_name": "empty", "basis": [], "nested": {"a": [[]], "b": {}}},
+    12345678,
+    "tail \\u00e9 ]",
+    null, true, false, [], {}
+]
+"""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1024 * 1024])
+def test_streamed_items_match_json_loads(chunk_size):
+    items = list(layout.iter_json_array(
+        io.StringIO(LAYOUT_JSON), chunk_size))
+
+    assert items == json.loads(LAYOUT_JSON)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5])
+@pytest.mark.parametrize("content", ["[]", "  [ \n ]  ", "[1]", "[1,2]"])
+def test_streamed_small_arrays(content, chunk_size):
+    items = list(layout.iter_json_array(io.StringIO(content), chunk_size))
+
+    assert items == json.loads(content)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+@pytest.mark.parametrize("content", [
+    "",
+    " \n ",
+    '{"instance_name": "tree"}',
+    "[1 2]",
+    "[1,]",
+    "[,1]",
+    "[",
+    "[1,",
+    '[{"instance_name": "tr',
+])
+def test_malformed_layout_data_is_rejected(content, chunk_size):
+    with pytest.raises(ValueError):
+        list(layout.iter_json_array(io.StringIO(content), chunk_size))
+
+
+def _make_layout_data(count):
+    basis = [
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, -1.0, 0.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+    data = []
+    for index in range(count):
+        element = {
+            "representation": f"repre{index % 3}",
+            "version": f"version{index % 3}",
+            "extension": "fbx",
+            "product_base_type": "model",
+            "instance_name": f"tree{index % 5}",
+            "asset_name": "tree",
+            "transform_matrix": [
+                [1.1 + index, 0.0, 0.0, 0.0],
+                [0.0, 0.3, 0.7, 0.0],
+                [0.0, -0.7, 0.3, 0.0],
+                [123.456 * index, -0.1, 98765.4321, 1.0],
+            ],
+        }
+        if index % 2:
+            element["basis"] = basis
+            element["rotation"] = {"x": 0.1, "y": 45.5, "z": -33.3}
+        if index % 4 == 0:
+            element["host"] = ["unreal"]
+        if index == 3:
+            element["animation"] = "abc"
+        if index == 4:
+            del element["transform_matrix"]
+        data.append(element)
+    return data
+
+
+@pytest.fixture(params=["numpy", "python"])
+def read_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        assert layout.numpy is not None
+    else:
+        monkeypatch.setattr(layout, "numpy", None)
+    return request.param
+
+
+def _assert_values_close(values, expected_values):
+    if expected_values is None:
+        assert values is None
+        return
+    assert len(values) == len(expected_values)
+    for value, expected_value in zip(values, expected_values):
+        if isinstance(expected_value, tuple):
+            _assert_values_close(value, expected_value)
+        else:
+            # Stored as float32
+            assert value == pytest.approx(expected_value, rel=1e-6)
+
+
+def _write_json_layout(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return str(path)
+
+
+@pytest.mark.parametrize("count", [0, 1, 10])
+def test_binary_layout_round_trip(tmp_path, monkeypatch, read_path, count):
+    # Read in more than one chunk of rows
+    monkeypatch.setattr(layout, "BINARY_LAYOUT_READ_ROWS", 3)
+    json_path = _write_json_layout(
+        tmp_path / "layout.json", _make_layout_data(count))
+    binary_path = str(tmp_path / "layout.ulayout")
+
+    elements = list(layout.iter_layout_elements(json_path))
+    layout.write_binary_layout(binary_path, elements)
+    binary_elements = list(layout.iter_layout_elements(binary_path))
+
+    assert not layout.is_binary_layout(json_path)
+    assert layout.is_binary_layout(binary_path)
+    assert len(binary_elements) == count
+    for element, binary_element in zip(elements, binary_elements):
+        for field in layout.BINARY_ELEMENT_FIELDS:
+            assert getattr(binary_element, field) == getattr(element, field)
+        for field in ("transform_matrix", "basis", "rotation"):
+            _assert_values_close(
+                getattr(binary_element, field), getattr(element, field))
+
+
+def test_binary_layout_shares_bases(tmp_path, read_path):
+    json_path = _write_json_layout(
+        tmp_path / "layout.json", _make_layout_data(6))
+    binary_path = str(tmp_path / "layout.ulayout")
+
+    layout.write_binary_layout(
+        binary_path, list(layout.iter_layout_elements(json_path)))
+    bases = {
+        id(element.basis)
+        for element in layout.iter_layout_elements(binary_path)
+        if element.basis is not None
+    }
+
+    assert len(bases) == 1
+
+
+def test_newer_binary_layout_version_is_rejected(tmp_path, monkeypatch):
+    binary_path = str(tmp_path / "layout.ulayout")
+    monkeypatch.setattr(
+        layout, "BINARY_LAYOUT_VERSION", layout.BINARY_LAYOUT_VERSION + 1)
+    layout.write_binary_layout(binary_path, [])
+    monkeypatch.undo()
+
+    with pytest.raises(ValueError):
+        list(layout.iter_binary_layout_elements(binary_path))
+
+
+def test_element_keys_follow_order_of_instance_names():
+    elements = [
+        layout.LayoutElement(instance_name="tree"),
+        layout.LayoutElement(instance_name="rock"),
+        layout.LayoutElement(instance_name="tree"),
+        layout.LayoutElement(asset_name="bush"),
+    ]
+
+    assert list(layout.get_element_keys(elements).values()) == [
+        "tree#0", "rock#0", "tree#1", "bush#0"]
+
+
+def test_diff_classifies_placements():
+    old_data = _make_layout_data(10)
+    new_data = json.loads(json.dumps(old_data))
+    # tree1#0 moved
+    new_data[1]["transform_matrix"][3][0] += 10.0
+    # tree2#0 rotated
+    new_data[2]["rotation"] = {"x": 0.0, "y": 90.0, "z": 0.0}
+    # tree3#0 has animation, tree0#1 placed with another representation
+    new_data[5]["representation"] = "repre9"
+    # tree4#1 removed, tree5#0 added
+    del new_data[9]
+    new_data.append(dict(new_data[0], instance_name="tree5"))
+    old_elements = [layout.LayoutElement.from_data(item) for item in old_data]
+    new_elements = [layout.LayoutElement.from_data(item) for item in new_data]
+
+    diff = layout.diff_layout_elements(old_elements, new_elements)
+
+    assert diff == {
+        "unchanged": [
+            "tree0#0", "tree4#0", "tree1#1", "tree2#1", "tree3#1"],
+        "moved": ["tree1#0", "tree2#0"],
+        "added": ["tree3#0", "tree0#1", "tree5#0"],
+        "removed": ["tree3#0", "tree0#1", "tree4#1"],
+    }
+
+
+def test_diff_of_binary_and_json_layout(tmp_path, read_path):
+    json_path = _write_json_layout(
+        tmp_path / "layout.json", _make_layout_data(10))
+    binary_path = str(tmp_path / "layout.ulayout")
+    json_elements = list(layout.iter_layout_elements(json_path))
+    layout.write_binary_layout(binary_path, json_elements)
+    binary_elements = list(layout.iter_layout_elements(binary_path))
+
+    diff = layout.diff_layout_elements(json_elements, binary_elements)
+
+    # Only the element with animation is replaced
+    assert diff["moved"] == []
+    assert diff["added"] == diff["removed"] == ["tree3#0"]
+    assert len(diff["unchanged"]) == 9
@@ -0,0 +1,145 @@
+"""Tests of converting layout transforms from their basis in batches."""
+import random
+
+import pytest
+
+from ayon_unreal.api import layout
+
+MAYA_BASIS = (
+    (1.0, 0.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0),
+    (0.0, -1.0, 0.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0),
+)
+SCALED_BASIS = (
+    (0.0, 100.0, 0.0, 0.0),
+    (-100.0, 0.0, 0.0, 0.0),
+    (0.0, 0.0, 100.0, 0.0),
+    (5.0, -3.0, 2.0, 1.0),
+)
+
+
+def _multiply(matrix_a, matrix_b):
+    return [
+        [sum(matrix_a[i][k] * matrix_b[k][j] for k in range(4))
+         for j in range(4)]
+        for i in range(4)
+    ]
+
+
+def _determinant(matrix):
+    if len(matrix) == 1:
+        return matrix[0][0]
+    return sum(
+        (-1) ** column * matrix[0][column] * _determinant(
+            _minor(matrix, 0, column))
+        for column in range(len(matrix))
+    )
+
+
+def _minor(matrix, row, column):
+    return [
+        [value for j, value in enumerate(values) if j != column]
+        for i, values in enumerate(matrix) if i != row
+    ]
+
+
+def _inverse(matrix):
+    determinant = _determinant(matrix)
+    return [
+        [
+            (-1) ** (i + j) * _determinant(_minor(matrix, j, i))
+            / determinant
+            for j in range(4)
+        ]
+        for i in range(4)
+    ]
+
+
+def convert_per_element(elements):
+    """Conversion of each element on its own, as the loaders did before.
+
+    Same as `basis.get_inverse() * matrix * basis` of `unreal.Matrix`, or
+    `matrix * basis` for layouts published from Unreal.
+    """
+    output = []
+    for element in elements:
+        if element.transform_matrix is None:
+            output.append(None)
+            continue
+        basis = element.basis or layout.IDENTITY_MATRIX
+        matrix = _multiply(element.transform_matrix, basis)
+        if not element.unreal_import:
+            matrix = _multiply(_inverse(basis), matrix)
+        output.append(matrix)
+    return output
+
+
+def make_elements(count, seed=0):
+    """Create elements with random transforms and various bases."""
+    rng = random.Random(seed)
+    bases = [None, layout.IDENTITY_MATRIX, MAYA_BASIS, SCALED_BASIS]
+    elements = []
+    for index in range(count):
+        matrix = tuple(
+            tuple(rng.uniform(-10.0, 10.0) for _ in range(3)) + (0.0,)
+            for _ in range(3)
+        ) + (tuple(rng.uniform(-1000.0, 1000.0) for _ in range(3)) + (1.0,),)
+        elements.append(layout.LayoutElement(
+            instance_name=f"asset_{index}",
+            transform_matrix=None if index % 17 == 0 else matrix,
+            basis=bases[index % len(bases)],
+            unreal_import=index % 3 == 0,
+        ))
+    return elements
+
+
+def _assert_matrices_equal(converted, expected):
+    assert len(converted) == len(expected)
+    for matrix, expected_matrix in zip(converted, expected):
+        if expected_matrix is None:
+            assert matrix is None
+            continue
+        for row, expected_row in zip(matrix, expected_matrix):
+            assert list(row) == pytest.approx(
+                expected_row, rel=1e-9, abs=1e-9)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def conversion_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        assert layout.numpy is not None
+    else:
+        monkeypatch.setattr(layout, "numpy", None)
+    return request.param
+
+
+def test_batch_conversion_matches_per_element(conversion_path):
+    elements = make_elements(500)
+
+    _assert_matrices_equal(
+        layout.convert_basis_matrices(elements),
+        convert_per_element(elements)
+    )
+
+
+def test_identity_basis_is_passed_through(conversion_path):
+    elements = make_elements(8)
+
+    converted = layout.convert_basis_matrices(elements)
+
+    for element, matrix in zip(elements, converted):
+        if element.transform_matrix and element.basis in (
+            None, layout.IDENTITY_MATRIX
+        ):
+            assert matrix is element.transform_matrix
+
+
+def test_singular_basis_is_rejected(conversion_path):
+    singular = ((1.0, 0.0, 0.0, 0.0),) * 4
+    element = layout.LayoutElement(
+        transform_matrix=layout.IDENTITY_MATRIX, basis=singular)
+
+    with pytest.raises(ValueError):
+        layout.convert_basis_matrices([element])
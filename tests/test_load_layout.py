@@ -0,0 +1,245 @@
+"""Tests of tracking actors spawned by layout loaders."""
+import collections
+import json
+import os
+from unittest import mock
+
+import pytest
+import unreal
+
+from ayon_unreal.api import layout
+from ayon_unreal.api import plugin as unreal_plugin
+
+MESH_PATH = "/Game/Ayon/tree/tree.tree"
+
+
+def _make_elements(count):
+    return [
+        layout.LayoutElement(
+            representation="repre",
+            version="version",
+            extension="fbx",
+            product_base_type="staticMesh",
+            instance_name="tree",
+            transform_matrix=layout.IDENTITY_MATRIX,
+        )
+        for _ in range(count)
+    ]
+
+
+def _make_mesh():
+    mesh = mock.MagicMock(name="tree")
+    mesh.get_class.return_value.get_name.return_value = "StaticMesh"
+    mesh.get_path_name.return_value = MESH_PATH
+    return mesh
+
+
+def _make_instanced_actor(mesh):
+    actor = mock.MagicMock(name="tree_instances")
+    actor.get_name.return_value = "tree_instances"
+    actor.get_class.return_value.get_name.return_value = "Actor"
+    component = actor.get_component_by_class.return_value
+    component.get_editor_property.return_value = mesh
+    return actor
+
+
+@pytest.fixture
+def mesh(monkeypatch):
+    mesh = _make_mesh()
+    registry = mock.MagicMock()
+    registry.get_asset_by_object_path.return_value.get_asset.return_value = (
+        mesh)
+    asset = mock.MagicMock()
+    asset.get_asset.return_value = mesh
+    registry.get_assets.return_value = [asset]
+    monkeypatch.setattr(
+        unreal.AssetRegistryHelpers, "get_asset_registry",
+        lambda: registry)
+    return mesh
+
+
+def _make_actor(name):
+    actor = mock.MagicMock(name=name)
+    actor.get_name.return_value = name
+    return actor
+
+
+def _make_loader(module, loader_class, elements, monkeypatch):
+    layouts = elements if isinstance(elements, dict) else {None: elements}
+    monkeypatch.setattr(
+        module, "iter_layout_elements",
+        lambda path: iter(layouts.get(path, layouts.get(None))))
+    loader = loader_class()
+    loader.instanced_mesh_threshold = 2
+    loader._get_placement_transforms = lambda placed: {
+        element: f"transform{index}"
+        for index, element in enumerate(placed)
+    }
+    loader._get_repre_entities_by_version_id = (
+        lambda *args, **kwargs: collections.defaultdict(
+            list, {"version": [{"id": "repre", "name": "fbx"}]})
+    )
+    loader._load_assets = lambda *args: [MESH_PATH]
+    return loader
+
+
+@pytest.mark.parametrize("count", [2, 3])
+def test_threshold_instanced_actors_are_recorded(
+    load_plugin, monkeypatch, mesh, count
+):
+    module = load_plugin(os.path.join("load", "load_layout.py"))
+    loader = _make_loader(
+        module, module.LayoutLoader, _make_elements(count), monkeypatch)
+    actor = _make_instanced_actor(mesh)
+    monkeypatch.setattr(
+        unreal_plugin, "spawn_instanced_actor",
+        lambda obj, transforms: (actor, None, None))
+    monkeypatch.setattr(
+        unreal_plugin, "spawn_actors",
+        lambda obj, transforms: [
+            _make_actor(f"tree{index}") for index in range(len(transforms))
+        ]
+    )
+
+    instanced_placements = {}
+    placements = {}
+    loader._process(
+        "layout.json", "project", "/Game/Ayon/layout", None,
+        instanced_placements=instanced_placements,
+        placements=placements
+    )
+
+    keys = [f"tree#{index}" for index in range(count)]
+    if count > loader.instanced_mesh_threshold:
+        assert instanced_placements == {"tree_instances": keys}
+        assert placements == {}
+    else:
+        assert instanced_placements == {}
+        assert placements == {
+            key: [f"tree{index}"] for index, key in enumerate(keys)}
+
+
+def test_no_placements_spawn_no_actors(load_plugin, monkeypatch, mesh):
+    module = load_plugin(os.path.join("load", "load_layout.py"))
+    loader = _make_loader(
+        module, module.LayoutLoader, _make_elements(3), monkeypatch)
+    spawn_instanced_actor = mock.MagicMock()
+    monkeypatch.setattr(
+        unreal_plugin, "spawn_instanced_actor", spawn_instanced_actor)
+
+    instanced_placements = {}
+    placements = {}
+    loader._process(
+        "layout.json", "project", "/Game/Ayon/layout", None,
+        instanced_meshes=True,
+        instanced_placements=instanced_placements,
+        placements=placements,
+        keys=set()
+    )
+
+    spawn_instanced_actor.assert_not_called()
+    assert instanced_placements == {}
+    assert placements == {}
+
+
+def test_update_instances_all_placements_over_threshold(
+    load_plugin, monkeypatch, mesh, tmp_path
+):
+    module = load_plugin(os.path.join("load", "load_layout.py"))
+    old_path = tmp_path / "layout_v001.json"
+    old_path.write_text("[]")
+    loader = _make_loader(
+        module, module.LayoutLoader,
+        {str(old_path): _make_elements(2), "layout_v002.json":
+            _make_elements(3)},
+        monkeypatch
+    )
+    monkeypatch.setattr(
+        module.ayon_api, "get_representation_by_id",
+        lambda project_name, repre_id: {"id": repre_id})
+    monkeypatch.setattr(
+        module, "get_representation_path", lambda repre: str(old_path))
+    monkeypatch.setattr(
+        unreal, "ScopedEditorTransaction", mock.MagicMock())
+    single_actors = [_make_actor("tree0"), _make_actor("tree1")]
+    level_library = mock.MagicMock()
+    level_library.get_all_level_actors.return_value = single_actors
+    monkeypatch.setattr(module, "EditorLevelLibrary", level_library)
+    actor = _make_instanced_actor(mesh)
+    spawn_instanced_actor = mock.MagicMock(return_value=(actor, None, None))
+    monkeypatch.setattr(
+        unreal_plugin, "spawn_instanced_actor", spawn_instanced_actor)
+
+    instanced_placements = {}
+    placements = {}
+    loader._update_placements(
+        {
+            "representation": "repre_v001",
+            "placements": json.dumps(
+                {"tree#0": ["tree0"], "tree#1": ["tree1"]}),
+            "instanced_placements": "{}",
+        },
+        "project", "/Game/Ayon/layout", None, "layout_v002.json",
+        placements, instanced_placements
+    )
+
+    assert level_library.destroy_actor.call_args_list == [
+        mock.call(single_actor) for single_actor in single_actors]
+    spawn_instanced_actor.assert_called_once_with(
+        mesh, ["transform0", "transform1", "transform2"])
+    assert instanced_placements == {
+        "tree_instances": ["tree#0", "tree#1", "tree#2"]}
+    assert placements == {}
+
+
+def test_update_without_instanced_placements_rebuilds(
+    load_plugin, monkeypatch
+):
+    module = load_plugin(os.path.join("load", "load_layout.py"))
+    get_representation = mock.MagicMock()
+    monkeypatch.setattr(
+        module.ayon_api, "get_representation_by_id", get_representation)
+    loader = module.LayoutLoader()
+
+    loaded_assets = loader._update_placements(
+        {"placements": "{}", "representation": "repre"}, "project",
+        "/Game/Ayon/layout", None, "layout.json", {}, {}
+    )
+
+    assert loaded_assets is None
+    get_representation.assert_not_called()
+
+
+def test_existing_layout_reuses_instanced_actor(
+    load_plugin, monkeypatch, mesh
+):
+    module = load_plugin(os.path.join("load", "load_layout_existing.py"))
+    actor = _make_instanced_actor(mesh)
+    level_library = mock.MagicMock()
+    level_library.get_all_level_actors.return_value = [actor]
+    monkeypatch.setattr(module, "EditorLevelLibrary", level_library)
+    monkeypatch.setattr(
+        module.ayon_api, "get_representations",
+        lambda *args, **kwargs: [{
+            "id": "repre",
+            "versionId": "version",
+            "attrib": {"path": "/publish/tree.fbx"},
+            "context": {"representation": "fbx"},
+        }]
+    )
+    monkeypatch.setattr(
+        module.upipeline, "ls",
+        lambda: [{"representation": "repre", "namespace": "/Game/Ayon"}])
+    loader = _make_loader(
+        module, module.ExistingLayoutLoader, _make_elements(3),
+        monkeypatch)
+    loader._spawn_placements = mock.MagicMock()
+
+    loader._process("layout.json", "project", None)
+
+    loader._spawn_placements.assert_not_called()
+    level_library.destroy_actor.assert_not_called()
+    component = actor.get_component_by_class.return_value
+    component.clear_instances.assert_called_once()
+    component.add_instances.assert_called_once_with(
+        ["transform0", "transform1", "transform2"], False, True)
@@ -0,0 +1,208 @@
+"""Tests of editor independent logic of the pipeline API."""
+import os
+import types
+from unittest import mock
+
+import pytest
+import unreal
+
+from ayon_unreal.api import pipeline
+
+
+class CinematicShotTrack(unreal.MovieSceneSubTrack):
+    pass
+
+
+def _make_track(track_class):
+    track = track_class()
+    track.get_class.return_value = track_class
+    return track
+
+
+def test_filter_tracks_by_class_includes_subclasses(monkeypatch):
+    for track_class in (unreal.MovieSceneSubTrack, CinematicShotTrack):
+        monkeypatch.setattr(
+            track_class, "static_class", classmethod(lambda cls: cls))
+    sub_track = _make_track(unreal.MovieSceneSubTrack)
+    shot_track = _make_track(CinematicShotTrack)
+    camera_cut_track = _make_track(unreal.MovieSceneCameraCutTrack)
+    tracks = [sub_track, shot_track, camera_cut_track]
+
+    assert pipeline.filter_tracks_by_class(
+        tracks, unreal.MovieSceneSubTrack) == [sub_track, shot_track]
+    assert pipeline.filter_tracks_by_class(
+        tracks, unreal.MovieSceneSubTrack, exact=True) == [sub_track]
+    assert pipeline.get_camera_tracks(None, tracks) == [camera_cut_track]
+
+
+class FakeKey:
+    """Scripting channel key counting calls to Unreal."""
+
+    calls = 0
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    def get_time(self):
+        FakeKey.calls += 1
+        frame_number = unreal.FrameNumber(value=self.frame)
+        return types.SimpleNamespace(
+            get_editor_property=lambda name: frame_number)
+
+    def set_time(self, frame_number):
+        FakeKey.calls += 1
+        self.frame = frame_number.get_editor_property("value")
+
+
+class FakeFrameNumber:
+    def __init__(self, value):
+        self.value = value
+
+    def get_editor_property(self, name):
+        return getattr(self, name)
+
+
+def _make_fake_sequence(key_frames):
+    section = mock.MagicMock()
+    section.get_all_channels.return_value = [
+        mock.MagicMock(**{"get_keys.return_value": [
+            FakeKey(frame) for frame in frames
+        ]})
+        for frames in key_frames
+    ]
+    track = mock.MagicMock(**{"get_sections.return_value": [section]})
+    possessable = mock.MagicMock(**{"get_tracks.return_value": [track]})
+    sequence = mock.MagicMock(
+        **{"get_possessables.return_value": [possessable]})
+    return sequence, section
+
+
+def test_retime_sequence_keys(monkeypatch):
+    monkeypatch.setattr(unreal, "FrameNumber", FakeFrameNumber)
+    monkeypatch.setattr(FakeKey, "calls", 0)
+    key_frames = [list(range(1, 101)), [1, 50, 100], []]
+    sequence, section = _make_fake_sequence(key_frames)
+
+    assert pipeline.retime_sequence_keys(sequence, 1001, 1101, 0) == 0
+    section.set_range.assert_called_once_with(1001, 1101)
+    # Keys are not touched without offset
+    assert FakeKey.calls == 0
+
+    assert pipeline.retime_sequence_keys(sequence, 1001, 1101, 1000) == 103
+    channels = section.get_all_channels.return_value
+    assert [
+        [key.frame for key in channel.get_keys()] for channel in channels
+    ] == [
+        [frame + 1000 for frame in frames] for frames in key_frames
+    ]
+    # Time of each key is read and written once
+    assert FakeKey.calls == 2 * 103
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    """Editor world, its actors and asset registry counting queries."""
+    scene = types.SimpleNamespace(
+        world_path="/Game/Levels/Main.Main",
+        actors=[_make_actor("/Game/Levels/Main.Main:Rock")],
+        registry=mock.MagicMock(),
+        list_actors=mock.MagicMock(),
+    )
+    scene.list_actors.side_effect = lambda: list(scene.actors)
+
+    def get_asset_by_object_path(object_path):
+        asset_data = mock.MagicMock(name=object_path)
+        class_name = object_path.split(":")[-1]
+        asset_data.asset_class = class_name
+        asset_data.asset_class_path.asset_name = class_name
+        return asset_data
+
+    scene.registry.get_asset_by_object_path.side_effect = (
+        get_asset_by_object_path)
+    monkeypatch.setattr(
+        unreal.AssetRegistryHelpers, "get_asset_registry",
+        lambda: scene.registry)
+    monkeypatch.setattr(
+        unreal.EditorLevelLibrary, "get_editor_world",
+        lambda: types.SimpleNamespace(get_path_name=lambda: scene.world_path))
+    monkeypatch.setattr(
+        unreal, "EditorActorSubsystem",
+        lambda: types.SimpleNamespace(
+            get_all_level_actors=scene.list_actors))
+    return scene
+
+
+def _make_actor(path):
+    return types.SimpleNamespace(get_path_name=lambda: path)
+
+
+def test_scene_snapshot_lists_actors_once_per_level(scene):
+    snapshot = pipeline.SceneSnapshot()
+    rock = scene.actors[0]
+
+    assert snapshot.get_actors([rock.get_path_name()]) == [rock]
+    # Actors spawned after the snapshot was taken are not listed
+    scene.actors.append(_make_actor("/Game/Levels/Main.Main:Tree"))
+    assert snapshot.get_actors_by_path() == {rock.get_path_name(): rock}
+    assert scene.list_actors.call_count == 1
+
+    scene.world_path = "/Game/Levels/Other.Other"
+    assert len(snapshot.get_actors_by_path()) == 2
+    assert scene.list_actors.call_count == 2
+
+    snapshot.invalidate()
+    snapshot.get_actors_by_path()
+    assert scene.list_actors.call_count == 3
+
+
+def test_scene_snapshot_caches_assets(scene):
+    snapshot = pipeline.SceneSnapshot()
+    mesh_path = "/Game/Props/Rock.Rock:StaticMesh"
+
+    assert snapshot.get_asset_class_name(mesh_path) == "StaticMesh"
+    asset = snapshot.get_asset(mesh_path)
+    assert snapshot.get_asset(mesh_path) is asset
+    assert snapshot.get_asset_data(mesh_path).get_asset.call_count == 1
+    assert scene.registry.get_asset_by_object_path.call_count == 1
+
+    container = mock.MagicMock()
+    scene.registry.get_assets.return_value = [container]
+    assert snapshot.get_asset_container("/Game/Ayon/Rock") is (
+        container.get_asset.return_value)
+    scene.registry.get_assets.return_value = []
+    assert snapshot.get_asset_container("/Game/Ayon/Tree") is None
+    snapshot.get_asset_container("/Game/Ayon/Rock")
+    snapshot.get_asset_container("/Game/Ayon/Tree")
+    assert scene.registry.get_assets.call_count == 2
+
+    snapshot.invalidate()
+    snapshot.get_asset(mesh_path)
+    assert scene.registry.get_asset_by_object_path.call_count == 2
+
+
+def test_scene_snapshot_is_shared_by_context(scene):
+    context = types.SimpleNamespace(data={})
+
+    snapshot = pipeline.get_scene_snapshot(context)
+
+    assert isinstance(snapshot, pipeline.SceneSnapshot)
+    assert context.data["unrealSceneSnapshot"] is snapshot
+    assert pipeline.get_scene_snapshot(context) is snapshot
+
+
+def test_model_content_is_validated_from_snapshot(scene, load_plugin):
+    plugin = load_plugin(os.path.join("publish", "validate_model_content.py"))
+    context = types.SimpleNamespace(data={})
+    members = [
+        "/Game/Props/Rock.Rock:StaticMesh",
+        "/Game/Props/Rig.Rig:SkeletalMesh",
+    ]
+    instance = types.SimpleNamespace(
+        context=context, data={"members": members[:1]})
+
+    plugin.ValidateNoDependencies().process(instance)
+    instance.data["members"] = members
+    with pytest.raises(plugin.PublishValidationError):
+        plugin.ValidateNoDependencies().process(instance)
+    # Asset data are queried once for all instances
+    assert scene.registry.get_asset_by_object_path.call_count == 2
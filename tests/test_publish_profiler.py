@@ -0,0 +1,116 @@
+"""Tests of profiling publish plugins."""
+import importlib.util
+import json
+import os
+import sys
+import textwrap
+import types
+
+from ayon_unreal.api import pipeline, publish_profiler
+
+PLUGIN = textwrap.dedent("""\
+    import time
+
+
+    class {name}:
+        label = "{name}"
+        order = 1.0
+        __instanceEnabled__ = {instance_enabled}
+
+        def process(self, {argument}):
+            time.sleep(0.01)
+            return "{name} done"
+""")
+
+
+class FakeContext:
+    def __init__(self):
+        self.data = {}
+
+
+class FakeInstance:
+    def __init__(self, context, name):
+        self.context = context
+        self.data = {"name": name}
+
+
+def _discover_plugin(plugin_dir, name, instance_enabled):
+    """Load plugin the way pyblish discovers plugins from a path."""
+    path = os.path.join(plugin_dir, f"{name}.py")
+    with open(path, "w") as f:
+        f.write(PLUGIN.format(
+            name=name,
+            instance_enabled=instance_enabled,
+            argument="instance" if instance_enabled else "context",
+        ))
+    module = types.ModuleType(name)
+    module.__file__ = path
+    with open(path) as f:
+        exec(f.read(), module.__dict__)
+    sys.modules[path] = module
+    plugin = getattr(module, name)
+    plugin.__module__ = module.__file__
+    return plugin
+
+
+def _import_plugin(plugin_dir, name, monkeypatch):
+    """Load plugin imported as module by its name."""
+    module_name = f"plugins.{name.lower()}"
+    path = os.path.join(plugin_dir, f"{name}.py")
+    with open(path, "w") as f:
+        f.write(PLUGIN.format(
+            name=name, instance_enabled=True, argument="instance"))
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setitem(sys.modules, module_name, module)
+    return getattr(module, name)
+
+
+def test_discovered_plugins_are_profiled(tmp_path, monkeypatch):
+    publish_dir = tmp_path / "publish"
+    other_dir = tmp_path / "other"
+    publish_dir.mkdir()
+    other_dir.mkdir()
+    # Plugins are discovered through a link to the addon publish path
+    (tmp_path / "linked").symlink_to(publish_dir, target_is_directory=True)
+    monkeypatch.setattr(pipeline, "PUBLISH_PATH", str(publish_dir))
+    instance_plugin = _discover_plugin(
+        str(tmp_path / "linked"), "ExtractThing", True)
+    context_plugin = _discover_plugin(
+        str(publish_dir), "CollectThings", False)
+    imported_plugin = _import_plugin(
+        str(publish_dir), "ValidateThing", monkeypatch)
+    other_plugin = _discover_plugin(str(other_dir), "ExtractOther", True)
+
+    profiler = publish_profiler.PublishProfiler(str(tmp_path / "reports"))
+    profiler.discovery_filter(
+        [instance_plugin, context_plugin, imported_plugin, other_plugin])
+    # Plugins are wrapped once when discovered again
+    profiler.discovery_filter([instance_plugin])
+
+    assert instance_plugin._ayon_profiled
+    assert context_plugin._ayon_profiled
+    assert imported_plugin._ayon_profiled
+    assert "_ayon_profiled" not in other_plugin.__dict__
+
+    context = FakeContext()
+    instance = FakeInstance(context, "modelMain")
+    assert instance_plugin().process(instance) == "ExtractThing done"
+    assert context_plugin().process(context) == "CollectThings done"
+    other_plugin().process(instance)
+
+    profile = context.data["unrealPublishProfile"]
+    records = profile["records"]
+    assert [
+        (record["plugin"], record["instance"]) for record in records
+    ] == [("ExtractThing", "modelMain"), ("CollectThings", None)]
+    assert all(record["duration"] >= 0.01 for record in records)
+    assert all(record["success"] for record in records)
+
+    with open(f"{profile['path']}.json") as f:
+        assert len(json.load(f)["records"]) == 2
+    with open(f"{profile['path']}.folded") as f:
+        stacks = [line.rsplit(" ", 1)[0] for line in f]
+    assert stacks == [
+        "publish;ExtractThing;modelMain", "publish;CollectThings"]
@@ -0,0 +1,339 @@
+"""Tests of render job planning and local multi-process execution."""
+import json
+import os
+import stat
+import struct
+import sys
+import textwrap
+from unittest import mock
+
+import pyblish.api
+import pytest
+import unreal
+
+from ayon_unreal import render_jobs, render_telemetry
+from ayon_unreal.api import rendering
+
+PNG_HEADER = render_jobs.FRAME_HEADERS["png"]
+PNG_TRAILER = render_jobs.FRAME_TRAILERS["png"]
+
+# Fake `UnrealEditor-Cmd` writing frames of jobs passed in the shard
+# description, `fail` job names end the process with an error instead.
+FAKE_EDITOR = textwrap.dedent("""\
+    #!{python}
+    import json
+    import os
+    import sys
+
+    with open(os.environ["{env}"]) as f:
+        shard = json.load(f)
+    assert os.path.isfile(shard["manifest"])
+    for job in shard["jobs"]:
+        if job["name"] == "fail":
+            sys.exit(3)
+        os.makedirs(job["output_dir"], exist_ok=True)
+        for frame in range(job["frame_start"], job["frame_end"] + 1):
+            name = "{{}}.{{:0{{}}d}}.{{}}".format(
+                job["name"], frame, job.get("padding", 4), job["ext"])
+            with open(os.path.join(job["output_dir"], name), "wb") as f:
+                f.write({header!r} + b"data" + {trailer!r})
+    print(" ".join(sys.argv[1:]))
+""")
+
+
+def _make_job(tmp_path, name, frame_start, frame_end, ext="png"):
+    return {
+        "name": name,
+        "output_dir": str(tmp_path / "renders" / name),
+        "ext": ext,
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "padding": 4,
+    }
+
+
+def _write_frame(job, frame, content):
+    os.makedirs(job["output_dir"], exist_ok=True)
+    with open(render_jobs.get_frame_path(job, frame), "wb") as f:
+        f.write(content)
+
+
+def _make_fake_editor(tmp_path):
+    path = tmp_path / "UnrealEditor-Cmd"
+    path.write_text(FAKE_EDITOR.format(
+        python=sys.executable,
+        env=render_jobs.SHARD_MANIFEST_ENV,
+        header=PNG_HEADER,
+        trailer=PNG_TRAILER,
+    ))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+def test_split_frame_range():
+    assert render_jobs.split_frame_range(1001, 1010, 4) == [
+        (1001, 1004), (1005, 1008), (1009, 1010)]
+    assert render_jobs.split_frame_range(1001, 1010, 0) == [(1001, 1010)]
+
+
+
+class FakeJobConfig:
+    """Movie pipeline configuration keeping one setting per class."""
+
+    def __init__(self):
+        self.settings = {}
+
+    def find_or_add_setting_by_class(self, setting_class):
+        return self.settings.setdefault(setting_class, mock.MagicMock())
+
+    def find_setting_by_class(self, setting_class):
+        return self.settings.get(setting_class)
+
+    def remove_setting(self, setting):
+        pass
+
+
+def _create_chunk_jobs(chunk_size, preroll_frames):
+    queue = mock.MagicMock()
+    queue.allocate_new_job.side_effect = lambda job_class: mock.MagicMock(
+        **{"get_configuration.return_value": FakeJobConfig()})
+    sequence = mock.MagicMock(**{"get_name.return_value": "sh010"})
+    render_settings = {
+        "chunk_size": chunk_size,
+        "preroll_frames": preroll_frames,
+        "render_format": "png",
+    }
+    chunks = render_jobs.split_frame_range(1001, 1010, chunk_size)
+    return [
+        rendering._create_render_job(
+            queue,
+            {"master_sequence": "/Game/sh010", "master_level": "/Game/Map"},
+            None,
+            {"sequence": sequence, "output": "sh010"},
+            chunk,
+            "/renders",
+            render_settings,
+            chunked=len(chunks) > 1,
+        )
+        for chunk in chunks
+    ]
+
+
+def test_every_chunk_warms_up_engine():
+    jobs = _create_chunk_jobs(4, 8)
+
+    assert [
+        (job_data["frame_start"], job_data["frame_end"])
+        for _, job_data in jobs
+    ] == [(1001, 1004), (1005, 1008), (1009, 1010)]
+    for job, job_data in jobs:
+        assert job.job_name == (
+            f"sh010_{job_data['frame_start']}-{job_data['frame_end']}")
+        settings = job.get_configuration().settings
+        output_settings = settings[unreal.MoviePipelineOutputSetting]
+        assert output_settings.custom_start_frame == job_data["frame_start"]
+        # End frame of the movie pipeline is exclusive
+        assert output_settings.custom_end_frame == job_data["frame_end"] + 1
+        aa_settings = settings[unreal.MoviePipelineAntiAliasingSetting]
+        assert aa_settings.engine_warm_up_count == 8
+
+
+@pytest.mark.parametrize("chunk_size, preroll_frames", [(0, 8), (4, 0)])
+def test_jobs_without_chunks_or_preroll_do_not_warm_up(
+    chunk_size, preroll_frames
+):
+    jobs = _create_chunk_jobs(chunk_size, preroll_frames)
+
+    for job, _ in jobs:
+        assert unreal.MoviePipelineAntiAliasingSetting not in (
+            job.get_configuration().settings)
+
+
+def test_farm_instances_have_chunk_size_only_when_configured(
+    load_plugin, monkeypatch
+):
+    monkeypatch.setattr(pyblish.api, "CollectorOrder", 0)
+    plugin = load_plugin(
+        os.path.join("publish", "create_farm_render_instances.py"))
+    collector = plugin.CreateFarmRenderInstances()
+
+    assert collector.add_additional_data(
+        {"name": "sh010", "chunkSize": None}) == {"name": "sh010"}
+    assert collector.add_additional_data(
+        {"name": "sh010", "chunkSize": 10}) == {
+            "name": "sh010", "chunkSize": 10}
+
+def test_shard_jobs_balances_frames(tmp_path):
+    jobs = [
+        _make_job(tmp_path, "a", 1, 100),
+        _make_job(tmp_path, "b", 1, 60),
+        _make_job(tmp_path, "c", 1, 50),
+        _make_job(tmp_path, "d", 1, 10),
+    ]
+    shards = render_jobs.shard_jobs(jobs, 2)
+
+    loads = sorted(
+        sum(render_jobs.get_job_frame_count(job) for job in shard)
+        for shard in shards
+    )
+    assert loads == [110, 110]
+    assert len(render_jobs.shard_jobs(jobs, 10)) == len(jobs)
+    assert sorted(
+        job["name"] for shard in shards for job in shard
+    ) == ["a", "b", "c", "d"]
+
+
+def test_missing_frame_ranges_skip_incomplete_frames(tmp_path):
+    job = _make_job(tmp_path, "sh010", 1, 6)
+    complete = PNG_HEADER + b"data" + PNG_TRAILER
+    for frame in (1, 2, 5):
+        _write_frame(job, frame, complete)
+    # Truncated frame is rendered again
+    _write_frame(job, 3, PNG_HEADER + b"da")
+
+    assert render_jobs.get_complete_frames(job) == {1, 2, 5}
+    assert render_jobs.get_missing_frame_ranges(job) == [(3, 4), (6, 6)]
+
+
+def test_local_executor_with_fake_editor(tmp_path):
+    jobs = [
+        _make_job(tmp_path, "sh010", 1, 5),
+        _make_job(tmp_path, "sh020", 1, 3),
+        _make_job(tmp_path, "sh030", 10, 12),
+    ]
+    executor = render_jobs.LocalRenderExecutor(
+        _make_fake_editor(tmp_path),
+        "project.uproject",
+        str(tmp_path / "manifests")
+    )
+    for shard in render_jobs.shard_jobs(jobs, 2):
+        executor.add_shard("manifest", shard)
+    executor.start()
+    results = executor.wait(interval=0.05)
+
+    assert results["success"]
+    assert not results["missing"]
+    assert len(results["frames"]) == 11
+    assert [shard["returncode"] for shard in results["shards"]] == [0, 0]
+    with open(tmp_path / "manifests" / "results.json") as f:
+        assert json.load(f) == results
+    with open(executor.shards[0].log_path) as f:
+        assert "-MoviePipelineConfig=" in f.read()
+
+
+def test_local_executor_reports_failed_shard(tmp_path):
+    jobs = [
+        _make_job(tmp_path, "sh010", 1, 4),
+        _make_job(tmp_path, "fail", 1, 2),
+    ]
+    executor = render_jobs.LocalRenderExecutor(
+        _make_fake_editor(tmp_path),
+        "project.uproject",
+        str(tmp_path / "manifests")
+    )
+    for shard in render_jobs.shard_jobs(jobs, 2):
+        executor.add_shard("manifest", shard)
+    executor.start()
+    results = executor.wait(interval=0.05)
+
+    assert not results["success"]
+    assert len(results["missing"]) == 2
+    failed = [shard for shard in results["shards"] if not shard["success"]]
+    assert [shard["returncode"] for shard in failed] == [3]
+
+
+def test_telemetry_records_process_jobs(tmp_path):
+    jobs = [
+        _make_job(tmp_path, "sh010", 1, 2),
+        _make_job(tmp_path, "sh020", 1, 2),
+    ]
+    complete = PNG_HEADER + b"data" + PNG_TRAILER
+    for job in jobs:
+        for frame in (1, 2):
+            _write_frame(job, frame, complete)
+    telemetry = render_telemetry.RenderTelemetry(
+        str(tmp_path / render_telemetry.TELEMETRY_FILE_NAME))
+    telemetry.start_queue()
+    start_time = telemetry.queue_start - 10.0
+    records = telemetry.record_process_jobs(
+        jobs, start_time, telemetry.queue_start + 1.0, True)
+    telemetry.finish_queue(True)
+
+    assert [record["frame_count"] for record in records] == [2, 2]
+    assert records[0]["start"] == start_time
+    assert records[1]["start"] == records[0]["end"]
+    written = list(render_telemetry.read_records([str(tmp_path)]))
+    assert [record["type"] for record in written] == ["job", "job", "queue"]
+    assert written[-1]["frame_count"] == 4
+
+
+def _exr_attribute(name, attr_type, value):
+    return (
+        name + b"\0" + attr_type + b"\0"
+        + struct.pack("<i", len(value)) + value
+    )
+
+
+def _make_exr(width, height, tile_size=None):
+    """Build uncompressed single channel half float EXR file."""
+    header = [
+        _exr_attribute(
+            b"channels", b"chlist",
+            b"Y\0" + struct.pack("<iBBBBii", 1, 0, 0, 0, 0, 1, 1) + b"\0"),
+        _exr_attribute(b"compression", b"compression", b"\0"),
+        _exr_attribute(
+            b"dataWindow", b"box2i",
+            struct.pack("<iiii", 0, 0, width - 1, height - 1)),
+        _exr_attribute(
+            b"displayWindow", b"box2i",
+            struct.pack("<iiii", 0, 0, width - 1, height - 1)),
+        _exr_attribute(b"lineOrder", b"lineOrder", b"\0"),
+    ]
+    version = 2
+    if tile_size:
+        version |= render_jobs.EXR_TILED_FLAG
+        header.append(_exr_attribute(
+            b"tiles", b"tiledesc",
+            struct.pack("<IIB", tile_size, tile_size, 0)))
+        chunks = [
+            struct.pack("<iiii", x, y, 0, 0)
+            + struct.pack("<i", tile_size * tile_size * 2)
+            + b"\1" * (tile_size * tile_size * 2)
+            for y in range(-(-height // tile_size))
+            for x in range(-(-width // tile_size))
+        ]
+    else:
+        chunks = [
+            struct.pack("<ii", y, width * 2) + b"\1" * (width * 2)
+            for y in range(height)
+        ]
+
+    data = (
+        render_jobs.FRAME_HEADERS["exr"] + struct.pack("<I", version)
+        + b"".join(header) + b"\0"
+    )
+    offset = len(data) + len(chunks) * 8
+    offsets = []
+    for chunk in chunks:
+        offsets.append(offset)
+        offset += len(chunk)
+    return data + struct.pack(f"<{len(offsets)}Q", *offsets) + b"".join(
+        chunks)
+
+
+def test_exr_frame_completeness(tmp_path):
+    job = _make_job(tmp_path, "sh010", 1, 5, ext="exr")
+    scanline = _make_exr(8, 6)
+    _write_frame(job, 1, scanline)
+    _write_frame(job, 2, _make_exr(20, 9, tile_size=8))
+    # Killed mid-write, last chunk is not written completely
+    _write_frame(job, 3, scanline[:-3])
+    # Killed before the offset table was filled on close
+    table_start = len(scanline) - 6 * (8 + 8 + 16)
+    _write_frame(
+        job, 4,
+        scanline[:table_start] + b"\0" * 48 + scanline[table_start + 48:])
+    # Only the header was written
+    _write_frame(job, 5, scanline[:64])
+
+    assert render_jobs.get_complete_frames(job) == {1, 2}